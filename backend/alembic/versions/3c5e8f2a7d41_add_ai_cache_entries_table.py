@@ -0,0 +1,40 @@
+"""Add ai_cache_entries table
+
+Revision ID: 3c5e8f2a7d41
+Revises: f9f1aa7380ab
+Create Date: 2026-10-19 11:02:13.482915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c5e8f2a7d41'
+down_revision: Union[str, Sequence[str], None] = 'f9f1aa7380ab'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'ai_cache_entries',
+        sa.Column('key', sa.String(), nullable=False),
+        sa.Column('kind', sa.String(), nullable=False),
+        sa.Column('value', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('key')
+    )
+    op.create_index(op.f('ix_ai_cache_entries_kind'), 'ai_cache_entries', ['kind'], unique=False)
+    op.create_index(op.f('ix_ai_cache_entries_expires_at'), 'ai_cache_entries', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_ai_cache_entries_expires_at'), table_name='ai_cache_entries')
+    op.drop_index(op.f('ix_ai_cache_entries_kind'), table_name='ai_cache_entries')
+    op.drop_table('ai_cache_entries')
@@ -0,0 +1,69 @@
+"""Add question bank tables
+
+Revision ID: 7b2d9e4c1a63
+Revises: 3c5e8f2a7d41
+Create Date: 2026-10-19 13:24:51.207634
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b2d9e4c1a63'
+down_revision: Union[str, Sequence[str], None] = '3c5e8f2a7d41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'questions',
+        sa.Column('id', sa.String(), nullable=False),
+        sa.Column('text', sa.Text(), nullable=False),
+        sa.Column('text_hash', sa.String(), nullable=False),
+        sa.Column('type', sa.String(), nullable=False),
+        sa.Column('weight', sa.Integer(), nullable=False),
+        sa.Column('options', sa.Text(), nullable=True),
+        sa.Column('correct_options', sa.Text(), nullable=True),
+        sa.Column('seniority', sa.String(), nullable=True),
+        sa.Column('difficulty', sa.String(), nullable=True),
+        sa.Column('source_provider', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('text_hash')
+    )
+    op.create_index(op.f('ix_questions_id'), 'questions', ['id'], unique=False)
+    op.create_index(op.f('ix_questions_type'), 'questions', ['type'], unique=False)
+    op.create_index(op.f('ix_questions_seniority'), 'questions', ['seniority'], unique=False)
+    op.create_index(op.f('ix_questions_difficulty'), 'questions', ['difficulty'], unique=False)
+    op.create_index('ix_questions_type_seniority_difficulty', 'questions', ['type', 'seniority', 'difficulty'], unique=False)
+    op.create_table(
+        'question_tags',
+        sa.Column('id', sa.String(), nullable=False),
+        sa.Column('question_id', sa.String(), nullable=False),
+        sa.Column('tag_name', sa.String(), nullable=False),
+        sa.ForeignKeyConstraint(['question_id'], ['questions.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('question_id', 'tag_name', name='uq_question_tags_question_tag')
+    )
+    op.create_index(op.f('ix_question_tags_id'), 'question_tags', ['id'], unique=False)
+    op.create_index(op.f('ix_question_tags_question_id'), 'question_tags', ['question_id'], unique=False)
+    op.create_index('ix_question_tags_tag_name_question_id', 'question_tags', ['tag_name', 'question_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_question_tags_tag_name_question_id', table_name='question_tags')
+    op.drop_index(op.f('ix_question_tags_question_id'), table_name='question_tags')
+    op.drop_index(op.f('ix_question_tags_id'), table_name='question_tags')
+    op.drop_table('question_tags')
+    op.drop_index('ix_questions_type_seniority_difficulty', table_name='questions')
+    op.drop_index(op.f('ix_questions_difficulty'), table_name='questions')
+    op.drop_index(op.f('ix_questions_seniority'), table_name='questions')
+    op.drop_index(op.f('ix_questions_type'), table_name='questions')
+    op.drop_index(op.f('ix_questions_id'), table_name='questions')
+    op.drop_table('questions')
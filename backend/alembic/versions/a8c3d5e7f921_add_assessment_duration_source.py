@@ -0,0 +1,28 @@
+"""Add duration_source to assessments
+
+Revision ID: a8c3d5e7f921
+Revises: e2b7f4a9c013
+Create Date: 2026-10-19 19:41:27.530846
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8c3d5e7f921'
+down_revision: Union[str, Sequence[str], None] = 'e2b7f4a9c013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('assessments', sa.Column('duration_source', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('assessments', 'duration_source')
@@ -0,0 +1,46 @@
+"""Add assessment_operations table
+
+Revision ID: d4a6c2b8e517
+Revises: 7b2d9e4c1a63
+Create Date: 2026-10-19 15:10:37.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a6c2b8e517'
+down_revision: Union[str, Sequence[str], None] = '7b2d9e4c1a63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'assessment_operations',
+        sa.Column('id', sa.String(), nullable=False),
+        sa.Column('kind', sa.String(), nullable=False),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('job_id', sa.String(), nullable=False),
+        sa.Column('assessment_id', sa.String(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_by', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ),
+        sa.ForeignKeyConstraint(['created_by'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_assessment_operations_id'), 'assessment_operations', ['id'], unique=False)
+    op.create_index(op.f('ix_assessment_operations_status'), 'assessment_operations', ['status'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_assessment_operations_status'), table_name='assessment_operations')
+    op.drop_index(op.f('ix_assessment_operations_id'), table_name='assessment_operations')
+    op.drop_table('assessment_operations')
@@ -0,0 +1,30 @@
+"""Add owner and lease columns to assessment_operations
+
+Revision ID: e2b7f4a9c013
+Revises: d4a6c2b8e517
+Create Date: 2026-10-19 16:02:11.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b7f4a9c013'
+down_revision: Union[str, Sequence[str], None] = 'd4a6c2b8e517'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('assessment_operations', sa.Column('owner_id', sa.String(), nullable=True))
+    op.add_column('assessment_operations', sa.Column('lease_expires_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('assessment_operations', 'lease_expires_at')
+    op.drop_column('assessment_operations', 'owner_id')
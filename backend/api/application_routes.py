@@ -3,7 +3,7 @@ from sqlalchemy.orm import Session
 from typing import List
 import json
 
-from database.database import get_db
+from database.database import get_read_db, get_write_db
 from schemas import ApplicationCreate, ApplicationUpdate, ApplicationResponse, ApplicationListResponse, ApplicationDetailedResponse, ApplicationDetailedListResponse, MyApplicationsListResponse, MyApplicationResponse, MyApplicationsJob, MyApplicationsAssessment, ApplicationAssessment
 from services import create_application, get_application, get_applications_by_job_and_assessment, calculate_application_score, get_applications_by_user, get_application_by_user
 from services.assessment_service import get_assessment
@@ -18,7 +18,7 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/applications", tags=["applications"])
 
 @router.get("/jobs/{jid}/assessments/{aid}")
-def get_applications_list(jid: str, aid: str, page: int = 1, limit: int = 10, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+def get_applications_list(jid: str, aid: str, page: int = 1, limit: int = 10, db: Session = Depends(get_read_db), current_user: User = Depends(get_current_user)):
     """Get list of applications for an assessment"""
     logger.info(f"Retrieving applications list for job ID: {jid}, assessment ID: {aid}, page: {page}, limit: {limit} by user: {current_user.id}")
     # Only HR users can view applications
@@ -86,7 +86,7 @@ def get_applications_list(jid: str, aid: str, page: int = 1, limit: int = 10, db
     }
 
 @router.get("/jobs/{jid}/assessment_id/{aid}/applications/{id}", response_model=ApplicationDetailedResponse)
-def get_application_detail(jid: str, aid: str, id: str, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+def get_application_detail(jid: str, aid: str, id: str, db: Session = Depends(get_read_db), current_user: User = Depends(get_current_user)):
     """Get detailed application information including answers"""
     logger.info(f"Retrieving application detail for job ID: {jid}, assessment ID: {aid}, application ID: {id} by user: {current_user.id}")
 
@@ -224,7 +224,7 @@ def get_application_detail(jid: str, aid: str, id: str, db: Session = Depends(ge
 
 
 @router.post("/jobs/{jid}/assessments/{aid}", response_model=dict)  # Returns just id as per requirements
-def create_new_application(jid: str, aid: str, application: ApplicationCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+def create_new_application(jid: str, aid: str, application: ApplicationCreate, db: Session = Depends(get_write_db), current_user: User = Depends(get_current_user)):
     """Create a new application for an assessment"""
     logger.info(f"Creating new application for job ID: {jid}, assessment ID: {aid}, user ID: {application.user_id} by user: {current_user.id}")
     # Only applicant users can create applications
@@ -257,7 +257,7 @@ def create_new_application(jid: str, aid: str, application: ApplicationCreate, d
 
 
 @router.get("/my-applications", response_model=MyApplicationsListResponse)
-def get_my_applications(page: int = 1, limit: int = 10, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+def get_my_applications(page: int = 1, limit: int = 10, db: Session = Depends(get_read_db), current_user: User = Depends(get_current_user)):
     """Get list of applications for the current logged-in user"""
     logger.info(f"Retrieving applications for user ID: {current_user.id}, page: {page}, limit: {limit}")
 
@@ -308,7 +308,7 @@ def get_my_applications(page: int = 1, limit: int = 10, db: Session = Depends(ge
 
 
 @router.get("/my-applications/{id}", response_model=ApplicationDetailedResponse)
-def get_my_application(id: str, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+def get_my_application(id: str, db: Session = Depends(get_read_db), current_user: User = Depends(get_current_user)):
     """Get a specific application by ID for the current logged-in user"""
     logger.info(f"Retrieving application with ID: {id} for user ID: {current_user.id}")
 
@@ -1,11 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List
 import json
 
-from database.database import get_db
+from database.database import get_read_db, get_write_db
 from schemas import AssessmentCreate, AssessmentUpdate, AssessmentRegenerate, AssessmentResponse, AssessmentListResponse, AssessmentDetailedResponse
-from services import create_assessment, get_assessment, get_assessments_by_job, update_assessment, regenerate_assessment, delete_assessment
+from schemas import AssessmentOperationAccepted, AssessmentOperationResponse
+from services import get_assessment, get_assessments_by_job, update_assessment, delete_assessment, get_job
+from services.assessment_service import stream_assessment_creation, get_unknown_question_ids, get_unreplaced_type_ids
+from services.assessment_operation_service import submit_create_assessment, submit_regenerate_assessment, get_operation
 from utils.dependencies import get_current_user
 from models.user import User
 from logging_config import get_logger
@@ -16,7 +20,7 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/assessments", tags=["assessments"])
 
 @router.get("/jobs/{jid}", response_model=AssessmentListResponse)
-def get_assessments_list(jid: str, page: int = 1, limit: int = 10, db: Session = Depends(get_db)):
+def get_assessments_list(jid: str, page: int = 1, limit: int = 10, db: Session = Depends(get_read_db)):
     """Get list of assessments for a job"""
     logger.info(f"Retrieving assessments list for job ID: {jid}, page: {page}, limit: {limit}")
     skip = (page - 1) * limit
@@ -46,7 +50,7 @@ def get_assessments_list(jid: str, page: int = 1, limit: int = 10, db: Session =
     )
 
 @router.get("/jobs/{jid}/{aid}", response_model=AssessmentDetailedResponse)
-def get_assessment_details(jid: str, aid: str, db: Session = Depends(get_db)):
+def get_assessment_details(jid: str, aid: str, db: Session = Depends(get_read_db)):
     """Get assessment details"""
     logger.info(f"Retrieving assessment details for job ID: {jid}, assessment ID: {aid}")
     assessment = get_assessment(db, aid)
@@ -69,9 +73,9 @@ def get_assessment_details(jid: str, aid: str, db: Session = Depends(get_db)):
     logger.info(f"Successfully retrieved assessment details for job ID: {jid}, assessment ID: {assessment.id}")
     return AssessmentDetailedResponse(**assessment_dict)
 
-@router.post("/jobs/{id}", response_model=dict)  # Returns just id as per requirements
-def create_new_assessment(id: str, assessment: AssessmentCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    """Create a new assessment for a job"""
+@router.post("/jobs/{id}", response_model=AssessmentOperationAccepted, status_code=status.HTTP_202_ACCEPTED)
+def create_new_assessment(id: str, assessment: AssessmentCreate, db: Session = Depends(get_write_db), current_user: User = Depends(get_current_user)):
+    """Queue the creation of a new assessment for a job; poll the returned operation for the result"""
     logger.info(f"Creating new assessment for job ID: {id}, title: {assessment.title} by user: {current_user.id}")
     # Only HR users can create assessments
     if current_user.role != "hr":
@@ -80,13 +84,52 @@ def create_new_assessment(id: str, assessment: AssessmentCreate, db: Session = D
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only HR users can create assessments"
         )
-    db_assessment = create_assessment(db, id, assessment)
-    logger.info(f"Successfully created assessment with ID: {db_assessment.id} for job ID: {id}")
-    return {"id": db_assessment.id}
+    operation = submit_create_assessment(db, id, assessment, user_id=current_user.id)
+    if not operation:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    logger.info(f"Accepted assessment creation operation: {operation.id} for job ID: {id}")
+    return AssessmentOperationAccepted(operation_id=operation.id, status=operation.status)
+
+def _sse_event(event: str, data: dict) -> str:
+    """Format one server-sent event"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+@router.post("/jobs/{id}/stream")
+def stream_new_assessment(id: str, assessment: AssessmentCreate, db: Session = Depends(get_write_db), current_user: User = Depends(get_current_user)):
+    """Create a new assessment for a job, streaming its questions as server-sent events while they are generated"""
+    logger.info(f"Streaming creation of assessment for job ID: {id}, title: {assessment.title} by user: {current_user.id}")
+    # Only HR users can create assessments
+    if current_user.role != "hr":
+        logger.warning(f"Unauthorized attempt to create assessment by user: {current_user.id} with role: {current_user.role}")
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only HR users can create assessments"
+        )
+    if not get_job(db, id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+
+    # The request's session is closed before the response body is sent, so the stream opens its own sessions
+    bind = db.get_bind()
 
-@router.patch("/jobs/{jid}/{aid}/regenerate")
-def regenerate_assessment_route(jid: str, aid: str, regenerate_data: AssessmentRegenerate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    """Regenerate an assessment"""
+    async def events():
+        try:
+            async for event, data in stream_assessment_creation(bind, id, assessment):
+                yield _sse_event(event, data)
+        except Exception as e:
+            logger.error(f"Streaming creation of assessment for job ID: {id} failed: {str(e)}")
+            yield _sse_event("error", {"detail": str(e)})
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+@router.patch("/jobs/{jid}/{aid}/regenerate", response_model=AssessmentOperationAccepted, status_code=status.HTTP_202_ACCEPTED)
+def regenerate_assessment_route(jid: str, aid: str, regenerate_data: AssessmentRegenerate, db: Session = Depends(get_write_db), current_user: User = Depends(get_current_user)):
+    """Queue the regeneration of an assessment; poll the returned operation for the result"""
     logger.info(f"Regenerating assessment for job ID: {jid}, assessment ID: {aid} by user: {current_user.id}")
     # Only HR users can regenerate assessments
     if current_user.role != "hr":
@@ -95,22 +138,65 @@ def regenerate_assessment_route(jid: str, aid: str, regenerate_data: AssessmentR
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only HR users can regenerate assessments"
         )
+    # Reject replacements the background operation could only fail on
+    if regenerate_data.question_ids is not None:
+        if regenerate_data.questions_types is not None:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Provide either questions_types or question_ids, not both"
+            )
+        unreplaced_ids = get_unreplaced_type_ids(regenerate_data.question_ids, regenerate_data.replacement_types or {})
+        if unreplaced_ids:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Replacement types for questions that are not replaced: {', '.join(unreplaced_ids)}"
+            )
+        db_assessment = get_assessment(db, aid)
+        unknown_ids = get_unknown_question_ids(db_assessment, regenerate_data.question_ids) if db_assessment else []
+        if unknown_ids:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Questions not found in assessment: {', '.join(unknown_ids)}"
+            )
+    elif regenerate_data.replacement_types:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="replacement_types requires question_ids"
+        )
+
     # Extract parameters from the request data using dict() to maintain consistency with other routes
     regenerate_params = regenerate_data.dict(exclude_unset=True)
 
-    # Call the service function with the extracted parameters
-    updated_assessment = regenerate_assessment(db, aid, **regenerate_params)
-    if not updated_assessment:
+    # Queue the service function with the extracted parameters
+    operation = submit_regenerate_assessment(db, aid, user_id=current_user.id, **regenerate_params)
+    if not operation:
         logger.warning(f"Assessment not found for regeneration with job ID: {jid}, assessment ID: {aid}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Assessment not found"
         )
-    logger.info(f"Successfully regenerated assessment with ID: {updated_assessment.id} for job ID: {jid}")
-    return {}
+    logger.info(f"Accepted assessment regeneration operation: {operation.id} for assessment ID: {aid}")
+    return AssessmentOperationAccepted(operation_id=operation.id, status=operation.status)
+
+@router.get("/operations/{oid}", response_model=AssessmentOperationResponse)
+def get_assessment_operation_status(oid: str, db: Session = Depends(get_read_db), current_user: User = Depends(get_current_user)):
+    """Get the status of a queued assessment creation or regeneration"""
+    # Only HR users can follow assessment operations
+    if current_user.role != "hr":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only HR users can view assessment operations"
+        )
+    operation = get_operation(db, oid)
+    if not operation:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Assessment operation not found"
+        )
+    return operation
 
 @router.patch("/jobs/{jid}/{aid}")
-def update_existing_assessment(jid: str, aid: str, assessment_update: AssessmentUpdate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+def update_existing_assessment(jid: str, aid: str, assessment_update: AssessmentUpdate, db: Session = Depends(get_write_db), current_user: User = Depends(get_current_user)):
     """Update an existing assessment"""
     logger.info(f"Updating assessment for job ID: {jid}, assessment ID: {aid} by user: {current_user.id}")
     # Only HR users can update assessments
@@ -131,7 +217,7 @@ def update_existing_assessment(jid: str, aid: str, assessment_update: Assessment
     return {}
 
 @router.delete("/jobs/{jid}/{aid}")
-def delete_existing_assessment(jid: str, aid: str, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+def delete_existing_assessment(jid: str, aid: str, db: Session = Depends(get_write_db), current_user: User = Depends(get_current_user)):
     """Delete an assessment"""
     logger.info(f"Deleting assessment for job ID: {jid}, assessment ID: {aid} by user: {current_user.id}")
     # Only HR users can delete assessments
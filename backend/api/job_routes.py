@@ -3,7 +3,7 @@ from sqlalchemy.orm import Session
 from typing import List
 import json
 
-from database.database import get_db
+from database.database import get_read_db, get_write_db
 from schemas import JobCreate, JobUpdate, JobResponse, JobListResponse
 from services import create_job, get_job, get_active_jobs, update_job, delete_job, get_job_applicants_count
 from utils.dependencies import get_current_user
@@ -16,7 +16,7 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
 @router.get("", response_model=JobListResponse)
-def get_jobs_list(page: int = 1, limit: int = 10, db: Session = Depends(get_db)):
+def get_jobs_list(page: int = 1, limit: int = 10, db: Session = Depends(get_read_db)):
     """Get list of jobs"""
     logger.info(f"Retrieving jobs list - page: {page}, limit: {limit}")
     skip = (page - 1) * limit
@@ -46,7 +46,7 @@ def get_jobs_list(page: int = 1, limit: int = 10, db: Session = Depends(get_db))
     )
 
 @router.get("/{id}", response_model=JobResponse)
-def get_job_details(id: str, db: Session = Depends(get_db)):
+def get_job_details(id: str, db: Session = Depends(get_read_db)):
     """Get job details by ID"""
     logger.info(f"Retrieving job details for ID: {id}")
     job = get_job(db, id)
@@ -70,7 +70,7 @@ def get_job_details(id: str, db: Session = Depends(get_db)):
     return JobResponse(**job_dict)
 
 @router.post("", response_model=dict)  # Returns just id as per requirements
-def create_new_job(job: JobCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+def create_new_job(job: JobCreate, db: Session = Depends(get_write_db), current_user: User = Depends(get_current_user)):
     """Create a new job"""
     logger.info(f"Creating new job with title: {job.title} by user: {current_user.id}")
     # Only HR users can create jobs
@@ -85,7 +85,7 @@ def create_new_job(job: JobCreate, db: Session = Depends(get_db), current_user:
     return {"id": db_job.id}
 
 @router.patch("/{id}")
-def update_existing_job(id: str, job_update: JobUpdate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+def update_existing_job(id: str, job_update: JobUpdate, db: Session = Depends(get_write_db), current_user: User = Depends(get_current_user)):
     """Update an existing job"""
     logger.info(f"Updating job with ID: {id} by user: {current_user.id}")
     # Only HR users can update jobs
@@ -106,7 +106,7 @@ def update_existing_job(id: str, job_update: JobUpdate, db: Session = Depends(ge
     return {}
 
 @router.delete("/{id}")
-def delete_existing_job(id: str, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+def delete_existing_job(id: str, db: Session = Depends(get_write_db), current_user: User = Depends(get_current_user)):
     """Delete a job"""
     logger.info(f"Deleting job with ID: {id} by user: {current_user.id}")
     # Only HR users can delete jobs
@@ -1,10 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import PlainTextResponse
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
-from database.database import get_db
+from database.database import get_read_db
+from database.slow_query_log import get_slow_queries
+from models.user import User
+from utils.dependencies import get_current_user
+from services.pregeneration_service import get_pregeneration_stats
+from integrations.ai_integration.scheduling import get_scheduler_stats
+from integrations.ai_integration.instrumentation import get_ai_call_stats
+from utils.metrics import render_prometheus
+from config import settings
 
 router = APIRouter()
+# Served at the application root, where Prometheus scrapes by default
+metrics_router = APIRouter()
 
 # Health check endpoint
 @router.get("/", response_model=dict)
@@ -13,7 +25,7 @@ def read_root():
     return {"message": "Welcome to AI-Powered Hiring Assessment Platform API"}
 
 @router.get("/health", status_code=200)
-def health_check(db: Session = Depends(get_db)):
+def health_check(db: Session = Depends(get_read_db)):
     """Health check endpoint to verify API is running and database is accessible"""
     try:
         # Test database connection using SQLAlchemy
@@ -27,4 +39,34 @@ def health_check(db: Session = Depends(get_db)):
         }
 
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Health check failed: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Health check failed: {str(e)}")
+
+@router.get("/metrics/pregeneration", status_code=200)
+def pregeneration_metrics():
+    """Question pre-generation counters and question bank hit/miss metrics"""
+    return get_pregeneration_stats()
+
+@router.get("/metrics/ai-scheduler", status_code=200)
+def ai_scheduler_metrics():
+    """Per-provider AI call queue depths, wait times and concurrency limits"""
+    return get_scheduler_stats()
+
+@router.get("/metrics/ai", status_code=200)
+def ai_call_metrics():
+    """AI call counts, latency, token usage and estimated cost by provider, method and originating route"""
+    return get_ai_call_stats()
+
+@router.get("/admin/slow-queries", status_code=200)
+def slow_queries(limit: Optional[int] = None, current_user: User = Depends(get_current_user)):
+    """Slow SQL statement fingerprints that took the most time in total, with their query plans"""
+    if current_user.role != "hr":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only HR users can view slow queries"
+        )
+    return {"threshold_ms": settings.slow_query_threshold_ms, "queries": get_slow_queries(limit)}
+
+@metrics_router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def prometheus_metrics():
+    """All metrics in the Prometheus text format"""
+    return PlainTextResponse(render_prometheus(), media_type="text/plain; version=0.0.4")
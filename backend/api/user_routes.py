@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 import logging
 
-from database.database import get_db
+from database.database import get_read_db, get_write_db
 from schemas import UserCreate, UserLogin, UserLogout, UserResponse, TokenResponse
 from services import get_user, login_user_service, register_user_service
 from utils.dependencies import get_current_user
@@ -16,7 +16,7 @@ router = APIRouter(prefix="/users", tags=["users"])
 
 # Registration endpoints
 @router.post("/registration/signup", response_model=TokenResponse)
-def register_user_endpoint(user: UserCreate, db: Session = Depends(get_db)):
+def register_user_endpoint(user: UserCreate, db: Session = Depends(get_write_db)):
     """Register a new user"""
     logger.info(f"Registering new user with email: {user.email}")
 
@@ -25,7 +25,7 @@ def register_user_endpoint(user: UserCreate, db: Session = Depends(get_db)):
     return token_response
 
 @router.post("/registration/login", response_model=TokenResponse)
-def login_user_endpoint(credentials: UserLogin, db: Session = Depends(get_db)):
+def login_user_endpoint(credentials: UserLogin, db: Session = Depends(get_read_db)):
     """Login a user"""
     logger.info(f"Login attempt for user: {credentials.email}")
 
@@ -34,7 +34,7 @@ def login_user_endpoint(credentials: UserLogin, db: Session = Depends(get_db)):
     return token_response
 
 @router.post("/registration/logout")
-def logout_user(credentials: UserLogout, db: Session = Depends(get_db)):
+def logout_user(credentials: UserLogout, db: Session = Depends(get_read_db)):
     """Logout a user"""
     logger.info("User logout request")
     # In a real app, you would invalidate the token here
@@ -52,7 +52,7 @@ def get_current_user_data(current_user: User = Depends(get_current_user)):
     return current_user
 
 @router.get("/{id}", response_model=UserResponse)
-def get_user_details(id: str, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+def get_user_details(id: str, current_user: User = Depends(get_current_user), db: Session = Depends(get_read_db)):
     """Get user details by ID"""
     logger.info(f"Retrieving user details for ID: {id} by user: {current_user.id}")
 
@@ -0,0 +1,124 @@
+"""
+End-to-end latency benchmark for assessment creation and regeneration.
+
+Runs create_assessment and regenerate_assessment in-process against a throwaway
+SQLite database, using the mock AI provider with artificial latency added to
+question generation and duration estimation. This models the real provider
+round-trips, which dominate assessment creation. Each operation is measured in three modes:
+- sequential: the LLM duration estimate waits for the generated questions
+- pipelined: the LLM duration estimate runs while the questions are generated
+- local: the deterministic local estimator, which makes no provider call (the default)
+
+The response cache, question bank and pre-generation are disabled, so every run
+calls the provider.
+
+Usage (from the backend directory):
+    python -m benchmarks.assessment_pipeline                  # compare with the stored baseline
+    python -m benchmarks.assessment_pipeline --generation-latency 2.0 --duration-latency 1.0
+    python -m benchmarks.assessment_pipeline --update-baseline
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+from benchmarks.baseline import check_against_baseline
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(BACKEND_DIR, "benchmarks", "baselines", "assessment_pipeline.json")
+
+
+def run_benchmark(runs: int, generation_latency: float, duration_latency: float) -> Dict[str, float]:
+    """Measure create and regenerate in each mode and keep the median of each metric"""
+    workdir = tempfile.mkdtemp()
+    os.environ.update(
+        DATABASE_URL=f"sqlite:///{os.path.join(workdir, 'pipeline.db')}",
+        LOG_FILE=os.path.join(workdir, "pipeline.log"),
+        LOG_LEVEL="WARNING",
+        AI_PROVIDER="mock",
+        AI_CACHE_ENABLED="false",
+        QUESTION_BANK_ENABLED="false",
+        PREGENERATION_ENABLED="false",
+    )
+
+    # Imported after the environment is set so the settings pick it up
+    from config import settings
+    from database.database import SessionLocal, engine
+    from integrations.ai_integration.ai_factory import AIGeneratorFactory, AIProvider
+    from integrations.ai_integration.mock_ai_generator import MockAIGenerator
+    from models import Base, Job
+    from schemas.assessment import AssessmentCreate
+    from schemas.enums import QuestionType
+    from services.assessment_service import create_assessment, regenerate_assessment
+
+    class DelayedMockAIGenerator(MockAIGenerator):
+        """Mock provider that takes as long as a real provider round-trip"""
+
+        def generate_questions(self, *args, **kwargs):
+            time.sleep(generation_latency)
+            return super().generate_questions(*args, **kwargs)
+
+        def estimate_duration(self, prompt):
+            time.sleep(duration_latency)
+            return "30"
+
+    AIGeneratorFactory.register_provider(AIProvider.MOCK, DelayedMockAIGenerator)
+    Base.metadata.create_all(bind=engine)
+
+    samples: Dict[str, List[float]] = {}
+    with SessionLocal() as db:
+        job = Job(title="Backend Engineer", seniority="mid", skill_categories='["python", "sql"]')
+        db.add(job)
+        db.commit()
+
+        for run in range(runs):
+            for mode, estimator_mode, pipelined in (("sequential", "llm", False), ("pipelined", "llm", True), ("local", "local", True)):
+                settings.duration_estimator_mode = estimator_mode
+                settings.pipeline_duration_estimate = pipelined
+
+                started = time.perf_counter()
+                assessment = create_assessment(db, job.id, AssessmentCreate(
+                    title="Benchmark Assessment",
+                    passing_score=60,
+                    questions_types=[QuestionType.choose_one, QuestionType.choose_many, QuestionType.text_based],
+                ))
+                samples.setdefault(f"create.{mode}_ms", []).append((time.perf_counter() - started) * 1000)
+
+                started = time.perf_counter()
+                regenerate_assessment(db, assessment.id, questions_types=[QuestionType.text_based, QuestionType.choose_one])
+                samples.setdefault(f"regenerate.{mode}_ms", []).append((time.perf_counter() - started) * 1000)
+
+            print(f"Run {run + 1}/{runs}: create sequential {samples['create.sequential_ms'][-1]:.0f} ms, "
+                  f"pipelined {samples['create.pipelined_ms'][-1]:.0f} ms, local {samples['create.local_ms'][-1]:.0f} ms")
+
+    return {metric: round(statistics.median(values), 3) for metric, values in samples.items()}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure assessment creation latency for each duration estimation mode")
+    parser.add_argument("--runs", type=int, default=5, help="Number of creations and regenerations per mode")
+    parser.add_argument("--generation-latency", type=float, default=0.5, help="Seconds added to each question generation call")
+    parser.add_argument("--duration-latency", type=float, default=0.3, help="Seconds added to each duration estimate call")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Path of the baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative regression, e.g. 0.25 for 25%%")
+    parser.add_argument("--min-delta", type=float, default=20.0, help="Ignore regressions smaller than this absolute amount")
+    parser.add_argument("--update-baseline", action="store_true", help="Store the results as the new baseline")
+    parser.add_argument("--output", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    metrics = run_benchmark(args.runs, args.generation_latency, args.duration_latency)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(metrics, output_file, indent=2, sort_keys=True)
+
+    print("\nAssessment pipeline (median):")
+    return check_against_baseline(metrics, args.baseline, args.threshold, args.update_baseline, args.min_delta)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""
+Baseline storage and regression checks shared by the benchmark harnesses.
+
+A baseline is a JSON file mapping metric names to numbers where lower is better
+(milliseconds, kilobytes, ...). A metric regresses when its current value exceeds
+the baseline by more than the allowed relative threshold and by more than an
+absolute noise floor, so sub-millisecond metrics don't flap.
+"""
+
+import json
+import os
+import platform
+from datetime import datetime, timezone
+from typing import Dict, List, NamedTuple, Optional
+
+
+class Regression(NamedTuple):
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+def load_baseline(path: str) -> Optional[Dict[str, float]]:
+    """Load the metrics of a stored baseline, or None if there is none yet"""
+    if not os.path.exists(path):
+        return None
+    with open(path) as baseline_file:
+        return json.load(baseline_file)["metrics"]
+
+
+def save_baseline(path: str, metrics: Dict[str, float]) -> None:
+    """Store metrics as the new baseline together with where they were measured"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as baseline_file:
+        json.dump(
+            {
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "python": platform.python_version(),
+                "machine": platform.platform(),
+                "metrics": metrics,
+            },
+            baseline_file,
+            indent=2,
+            sort_keys=True,
+        )
+
+
+def find_regressions(metrics: Dict[str, float], baseline: Dict[str, float], threshold: float, min_delta: float = 0.0) -> List[Regression]:
+    """Return the metrics that got worse than the baseline by more than the threshold"""
+    regressions = []
+    for metric, current in metrics.items():
+        previous = baseline.get(metric)
+        if previous is None:
+            continue
+        if current > previous * (1 + threshold) and current - previous > min_delta:
+            regressions.append(Regression(metric, previous, current))
+    return regressions
+
+
+def print_comparison(metrics: Dict[str, float], baseline: Optional[Dict[str, float]]) -> None:
+    """Print every metric next to its baseline value"""
+    width = max(len(metric) for metric in metrics)
+    for metric, current in metrics.items():
+        line = f"  {metric:<{width}}  {current:>12.2f}"
+        if baseline and metric in baseline:
+            previous = baseline[metric]
+            change = (current - previous) / previous * 100 if previous else 0.0
+            line += f"  (baseline {previous:.2f}, {change:+.1f}%)"
+        print(line)
+
+
+def check_against_baseline(metrics: Dict[str, float], baseline_path: str, threshold: float, update: bool, min_delta: float = 0.0) -> int:
+    """
+    Compare metrics with the stored baseline and optionally replace it.
+
+    A missing baseline is an error rather than a reason to record one, so that a wrong
+    --baseline path or a fresh checkout never passes a check by comparing with itself.
+
+    Returns:
+        Process exit code: 1 when a regression exceeds the threshold, 2 when there is no
+        baseline to compare with, 0 otherwise
+    """
+    baseline = load_baseline(baseline_path)
+    print_comparison(metrics, baseline)
+
+    if update:
+        save_baseline(baseline_path, metrics)
+        print(f"\nBaseline written to {baseline_path}")
+        return 0
+    if baseline is None:
+        print(f"\nNo baseline at {baseline_path}: nothing was compared. Record one with --update-baseline")
+        return 2
+
+    regressions = find_regressions(metrics, baseline, threshold, min_delta)
+    if regressions:
+        print(f"\nRegressions over {threshold:.0%}:")
+        for regression in regressions:
+            print(f"  {regression.metric}: {regression.baseline:.2f} -> {regression.current:.2f} ({regression.ratio:.2f}x)")
+        return 1
+
+    print(f"\nNo regression over {threshold:.0%} against {baseline_path}")
+    return 0
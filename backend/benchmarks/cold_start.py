@@ -0,0 +1,168 @@
+"""
+Import-time and cold-start benchmark.
+
+Every run starts a fresh interpreter against a throwaway SQLite database and the
+mock AI provider, then measures:
+- wall time and resident memory for `import main`
+- the FastAPI lifespan startup
+- time from process start to the first successful /api/health and /api/jobs responses
+- the cumulative import cost of heavy modules (via `python -X importtime`),
+  including mistralai, which is only imported when the Mistral provider is first used
+
+Usage (from the backend directory):
+    python -m benchmarks.cold_start                  # compare with the stored baseline
+    python -m benchmarks.cold_start --update-baseline
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List
+
+from benchmarks.baseline import check_against_baseline
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(BACKEND_DIR, "benchmarks", "baselines", "cold_start.json")
+
+# Modules whose cumulative import time is reported separately
+TRACKED_MODULES = ["fastapi", "pydantic", "pydantic_settings", "sqlalchemy", "passlib.context", "jwt", "schemas", "models", "services", "api"]
+
+SETUP_SCRIPT = """
+from models import Base
+from database.database import engine
+Base.metadata.create_all(bind=engine)
+"""
+
+PROBE_SCRIPT = """
+import json
+import resource
+import time
+
+def rss_kb():
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+started = time.perf_counter()
+rss_before = rss_kb()
+
+import main
+
+imported = time.perf_counter()
+rss_after_import = rss_kb()
+
+from fastapi.testclient import TestClient
+
+client = TestClient(main.app)
+lifespan_started = time.perf_counter()
+client.__enter__()
+lifespan_done = time.perf_counter()
+
+response = client.get("/api/health")
+assert response.status_code == 200, response.text
+first_health = time.perf_counter()
+
+response = client.get("/api/jobs")
+assert response.status_code == 200, response.text
+first_jobs = time.perf_counter()
+
+client.__exit__(None, None, None)
+
+print(json.dumps({
+    "import_main_ms": (imported - started) * 1000,
+    "import_main_rss_kb": rss_after_import - rss_before,
+    "lifespan_startup_ms": (lifespan_done - lifespan_started) * 1000,
+    "time_to_first_health_ms": (first_health - started) * 1000,
+    "time_to_first_jobs_ms": (first_jobs - started) * 1000,
+    "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+}))
+"""
+
+
+def run_python(args: List[str], env: Dict[str, str]) -> subprocess.CompletedProcess:
+    """Run the interpreter in the backend directory and fail loudly on errors"""
+    result = subprocess.run([sys.executable, *args], cwd=BACKEND_DIR, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Benchmark subprocess failed:\n{result.stderr}")
+    return result
+
+
+def parse_importtime(stderr: str) -> Dict[str, float]:
+    """Map module names to cumulative import time in milliseconds from `-X importtime` output"""
+    cumulative = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, module = line.split("|")
+        # A module is only listed the first time it is imported
+        cumulative.setdefault(module.strip(), int(cumulative_us) / 1000)
+    return cumulative
+
+
+def measure_modules(env: Dict[str, str]) -> Dict[str, float]:
+    """Break the import cost down per module"""
+    metrics = {}
+    main_imports = parse_importtime(run_python(["-X", "importtime", "-c", "import main"], env).stderr)
+    for module in TRACKED_MODULES:
+        if module in main_imports:
+            metrics[f"module.{module}_ms"] = main_imports[module]
+
+    # mistralai is loaded lazily, so measure what the first Mistral call pays for it
+    mistral_imports = parse_importtime(
+        run_python(["-X", "importtime", "-c", "import integrations.ai_integration.mistral_generator"], env).stderr
+    )
+    if "mistralai" in mistral_imports:
+        metrics["module.mistralai_first_use_ms"] = mistral_imports["mistralai"]
+    return metrics
+
+
+def run_benchmark(runs: int) -> Dict[str, float]:
+    """Run the probe and module breakdown several times and keep the median of each metric"""
+    samples: Dict[str, List[float]] = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        env = dict(
+            os.environ,
+            DATABASE_URL=f"sqlite:///{os.path.join(workdir, 'cold_start.db')}",
+            LOG_FILE=os.path.join(workdir, "cold_start.log"),
+            AI_PROVIDER="mock",
+            AI_WARM_UP_ON_STARTUP="false",
+        )
+        run_python(["-c", SETUP_SCRIPT], env)
+
+        for run in range(runs):
+            probe = json.loads(run_python(["-c", PROBE_SCRIPT], env).stdout.strip().splitlines()[-1])
+            probe.update(measure_modules(env))
+            for metric, value in probe.items():
+                samples.setdefault(metric, []).append(value)
+            print(f"Run {run + 1}/{runs}: import main {probe['import_main_ms']:.1f} ms")
+
+    return {metric: round(statistics.median(values), 3) for metric, values in samples.items()}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure import time and cold start of the backend")
+    parser.add_argument("--runs", type=int, default=5, help="Number of fresh interpreters to measure")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Path of the baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative regression, e.g. 0.25 for 25%%")
+    parser.add_argument("--min-delta", type=float, default=2.0, help="Ignore regressions smaller than this absolute amount")
+    parser.add_argument("--update-baseline", action="store_true", help="Store the results as the new baseline")
+    parser.add_argument("--output", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    metrics = run_benchmark(args.runs)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(metrics, output_file, indent=2, sort_keys=True)
+
+    print("\nCold start (median):")
+    return check_against_baseline(metrics, args.baseline, args.threshold, args.update_baseline, args.min_delta)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
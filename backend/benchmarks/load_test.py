@@ -0,0 +1,358 @@
+"""
+HTTP load test driving realistic user journeys against the API.
+
+Starts the app under uvicorn against a throwaway SQLite database and the mock or
+replay AI provider (or targets a running server with --base-url), seeds an HR user,
+jobs with assessments and candidates, then runs virtual users concurrently for a
+fixed time. Each virtual user repeats one of two journeys:
+- candidate: list jobs, open a job, list its assessments, open one, submit an application
+- HR: list the applications of an assessment and open some of them
+
+The report gives the throughput and, per endpoint (route template), the request count,
+error rate and p50/p95/p99 latency. It is written as JSON with --output, and the
+latencies and error rates are compared with the stored baseline like the other harnesses.
+
+Usage (from the backend directory):
+    python -m benchmarks.load_test --concurrency 20 --duration 60
+    python -m benchmarks.load_test --provider replay --replay-path recordings.jsonl --output load_test.json
+    python -m benchmarks.load_test --base-url http://localhost:8000 --no-baseline
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+import httpx
+
+from benchmarks.baseline import check_against_baseline
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(BACKEND_DIR, "benchmarks", "baselines", "load_test.json")
+PASSWORD = "load-test-password"
+
+SETUP_SCRIPT = """
+from models import Base
+from database.database import engine
+Base.metadata.create_all(bind=engine)
+"""
+
+
+class Sample(NamedTuple):
+    endpoint: str
+    status: int
+    latency_ms: float
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 400
+
+
+class LoadTestClient:
+    """HTTP client that records the latency and status of every request per endpoint"""
+
+    def __init__(self, client: httpx.AsyncClient):
+        self.client = client
+        self.samples: List[Sample] = []
+        self.recording = True
+
+    async def request(self, method: str, endpoint: str, url: str, token: Optional[str] = None, **kwargs) -> httpx.Response:
+        """Send a request, recording it under the endpoint's route template, e.g. "GET /api/jobs/{id}" """
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, headers=headers, **kwargs)
+            status = response.status_code
+        except httpx.HTTPError:
+            response, status = None, 0
+        if self.recording:
+            self.samples.append(Sample(f"{method} {endpoint}", status, (time.perf_counter() - started) * 1000))
+        if response is None:
+            raise RuntimeError(f"{method} {url} failed to connect")
+        return response
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of already sorted values"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(samples: List[Sample], elapsed: float) -> Dict[str, Any]:
+    """Aggregate the samples into throughput, error rates and latency percentiles per endpoint"""
+    by_endpoint: Dict[str, List[Sample]] = defaultdict(list)
+    for sample in samples:
+        by_endpoint[sample.endpoint].append(sample)
+
+    def stats(group: List[Sample]) -> Dict[str, float]:
+        latencies = sorted(s.latency_ms for s in group)
+        errors = sum(1 for s in group if not s.ok)
+        return {
+            "requests": len(group),
+            "errors": errors,
+            "error_rate": round(errors / len(group), 4),
+            "throughput_rps": round(len(group) / elapsed, 2),
+            "mean_ms": round(sum(latencies) / len(latencies), 2),
+            "p50_ms": round(percentile(latencies, 0.50), 2),
+            "p95_ms": round(percentile(latencies, 0.95), 2),
+            "p99_ms": round(percentile(latencies, 0.99), 2),
+            "max_ms": round(latencies[-1], 2),
+        }
+
+    return {
+        "total": stats(samples) if samples else {},
+        "endpoints": {endpoint: stats(group) for endpoint, group in sorted(by_endpoint.items())},
+    }
+
+
+async def signup(client: LoadTestClient, role: str, index: int) -> Dict[str, str]:
+    """Register a user and return its id and token"""
+    email = f"load-{role}-{index}-{int(time.time() * 1000)}@example.com"
+    response = await client.request("POST", "/api/users/registration/signup", "/api/users/registration/signup", json={
+        "first_name": "Load", "last_name": f"{role.title()}{index}", "email": email, "role": role, "password": PASSWORD
+    })
+    response.raise_for_status()
+    token = response.json()["token"]
+    me = await client.request("GET", "/api/users/me", "/api/users/me", token=token)
+    me.raise_for_status()
+    return {"id": me.json()["id"], "token": token}
+
+
+async def create_assessment(client: LoadTestClient, hr: Dict[str, str], job_id: str, questions: int) -> str:
+    """Queue an assessment creation and wait for its operation to finish"""
+    types = ["choose_one", "choose_many", "text_based"]
+    response = await client.request("POST", "/api/assessments/jobs/{id}", f"/api/assessments/jobs/{job_id}", token=hr["token"], json={
+        "title": f"Load test assessment {job_id[:8]}",
+        "passing_score": 50,
+        "questions_types": [types[i % len(types)] for i in range(questions)],
+    })
+    response.raise_for_status()
+    operation_id = response.json()["operation_id"]
+    while True:
+        operation = (await client.request("GET", "/api/assessments/operations/{oid}", f"/api/assessments/operations/{operation_id}", token=hr["token"])).json()
+        if operation["status"] == "succeeded":
+            return operation["assessment_id"]
+        if operation["status"] == "failed":
+            raise RuntimeError(f"Assessment creation failed: {operation['error']}")
+        await asyncio.sleep(0.1)
+
+
+async def seed(client: LoadTestClient, jobs: int, candidates: int, questions: int) -> Dict[str, Any]:
+    """Create the HR user, jobs with one assessment each, and the candidates the journeys use"""
+    hr = await signup(client, "hr", 0)
+    targets = []
+    for index in range(jobs):
+        response = await client.request("POST", "/api/jobs", "/api/jobs", token=hr["token"], json={
+            "title": f"Load Test Engineer {index}",
+            "seniority": random.choice(["junior", "mid", "senior"]),
+            "description": "Job created by the load test",
+            "skill_categories": ["python", "sql", "testing"],
+        })
+        response.raise_for_status()
+        job_id = response.json()["id"]
+        targets.append({"job_id": job_id, "assessment_id": await create_assessment(client, hr, job_id, questions), "applications": []})
+    return {"hr": hr, "targets": targets, "candidates": [await signup(client, "applicant", i) for i in range(candidates)]}
+
+
+def _answers(questions: List[Dict[str, Any]], rng: random.Random) -> List[Dict[str, Any]]:
+    answers = []
+    for question in questions:
+        options = [option["value"] for option in question.get("options") or []]
+        if question["type"] == "text_based" or not options:
+            answers.append({"question_id": question["id"], "text": "I would profile first, then fix the slowest query."})
+        else:
+            count = 1 if question["type"] == "choose_one" else rng.randint(1, len(options))
+            answers.append({"question_id": question["id"], "options": rng.sample(options, count)})
+    return answers
+
+
+async def candidate_journey(client: LoadTestClient, data: Dict[str, Any], rng: random.Random) -> None:
+    candidate = rng.choice(data["candidates"])
+    target = rng.choice(data["targets"])
+    jid, aid = target["job_id"], target["assessment_id"]
+
+    await client.request("GET", "/api/jobs", "/api/jobs", params={"page": 1, "limit": 10})
+    await client.request("GET", "/api/jobs/{id}", f"/api/jobs/{jid}")
+    await client.request("GET", "/api/assessments/jobs/{jid}", f"/api/assessments/jobs/{jid}")
+    assessment = await client.request("GET", "/api/assessments/jobs/{jid}/{aid}", f"/api/assessments/jobs/{jid}/{aid}")
+    if assessment.status_code != 200:
+        return
+    response = await client.request(
+        "POST", "/api/applications/jobs/{jid}/assessments/{aid}", f"/api/applications/jobs/{jid}/assessments/{aid}",
+        token=candidate["token"],
+        json={"job_id": jid, "assessment_id": aid, "user_id": candidate["id"], "answers": _answers(assessment.json()["questions"], rng)},
+    )
+    if response.status_code == 200:
+        target["applications"].append(response.json()["id"])
+
+
+async def hr_journey(client: LoadTestClient, data: Dict[str, Any], rng: random.Random) -> None:
+    token = data["hr"]["token"]
+    target = rng.choice(data["targets"])
+    jid, aid = target["job_id"], target["assessment_id"]
+
+    await client.request("GET", "/api/applications/jobs/{jid}/assessments/{aid}", f"/api/applications/jobs/{jid}/assessments/{aid}", token=token)
+    for application_id in rng.sample(target["applications"], min(3, len(target["applications"]))):
+        await client.request(
+            "GET", "/api/applications/jobs/{jid}/assessment_id/{aid}/applications/{id}",
+            f"/api/applications/jobs/{jid}/assessment_id/{aid}/applications/{application_id}", token=token,
+        )
+
+
+async def virtual_user(client: LoadTestClient, data: Dict[str, Any], deadline: float, hr_share: float, seed: int) -> int:
+    """Repeat journeys until the deadline and return how many were completed"""
+    rng = random.Random(seed)
+    journeys = 0
+    while time.perf_counter() < deadline:
+        journey = hr_journey if rng.random() < hr_share else candidate_journey
+        await journey(client, data, rng)
+        journeys += 1
+    return journeys
+
+
+async def run_load(base_url: str, args: argparse.Namespace) -> Dict[str, Any]:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=args.request_timeout, limits=limits) as http:
+        client = LoadTestClient(http)
+        client.recording = False
+        data = await seed(client, args.jobs, args.candidates, args.questions)
+        client.recording = True
+
+        print(f"Running {args.concurrency} virtual users for {args.duration:.0f} s against {base_url}")
+        started = time.perf_counter()
+        deadline = started + args.duration
+        journeys = await asyncio.gather(*(
+            virtual_user(client, data, deadline, args.hr_share, args.seed + i) for i in range(args.concurrency)
+        ))
+        elapsed = time.perf_counter() - started
+
+    report = summarize(client.samples, elapsed)
+    report["config"] = {
+        "provider": args.provider, "concurrency": args.concurrency, "duration_seconds": args.duration,
+        "hr_share": args.hr_share, "jobs": args.jobs, "candidates": args.candidates, "questions": args.questions, "seed": args.seed,
+    }
+    report["elapsed_seconds"] = round(elapsed, 3)
+    report["journeys"] = sum(journeys)
+    report["created_at"] = datetime.now(timezone.utc).isoformat()
+    return report
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def local_server(args: argparse.Namespace) -> Iterator[str]:
+    """Run the app under uvicorn against a throwaway database and yield its base URL"""
+    with tempfile.TemporaryDirectory() as workdir:
+        env = dict(
+            os.environ,
+            DATABASE_URL=f"sqlite:///{os.path.join(workdir, 'load_test.db')}",
+            LOG_FILE=os.path.join(workdir, "load_test.log"),
+            LOG_LEVEL="WARNING",
+            AI_PROVIDER=args.provider,
+            PREGENERATION_ENABLED="false",
+        )
+        if args.replay_path:
+            env["AI_REPLAY_PATH"] = os.path.abspath(args.replay_path)
+        subprocess.run([sys.executable, "-c", SETUP_SCRIPT], cwd=BACKEND_DIR, env=env, check=True)
+
+        port = _free_port()
+        server = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+            cwd=BACKEND_DIR, env=env,
+        )
+        base_url = f"http://127.0.0.1:{port}"
+        try:
+            deadline = time.perf_counter() + 30
+            while True:
+                try:
+                    if httpx.get(f"{base_url}/api/health", timeout=1).status_code == 200:
+                        break
+                except httpx.HTTPError:
+                    pass
+                if server.poll() is not None or time.perf_counter() > deadline:
+                    raise RuntimeError("The server did not become healthy")
+                time.sleep(0.1)
+            yield base_url
+        finally:
+            server.terminate()
+            server.wait(timeout=10)
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    total = report["total"]
+    print(f"\n{report['journeys']} journeys, {total.get('requests', 0)} requests in {report['elapsed_seconds']:.1f} s "
+          f"({total.get('throughput_rps', 0):.1f} req/s, error rate {total.get('error_rate', 0):.2%})\n")
+    width = max((len(endpoint) for endpoint in report["endpoints"]), default=10)
+    print(f"  {'endpoint':<{width}}  {'requests':>8}  {'errors':>7}  {'p50 ms':>8}  {'p95 ms':>8}  {'p99 ms':>8}")
+    for endpoint, stats in report["endpoints"].items():
+        print(f"  {endpoint:<{width}}  {stats['requests']:>8}  {stats['error_rate']:>7.2%}  "
+              f"{stats['p50_ms']:>8.1f}  {stats['p95_ms']:>8.1f}  {stats['p99_ms']:>8.1f}")
+
+
+def baseline_metrics(report: Dict[str, Any]) -> Dict[str, float]:
+    """The lower-is-better metrics of a report, as compared against the baseline"""
+    metrics = {}
+    for endpoint, stats in report["endpoints"].items():
+        for key in ("p50_ms", "p95_ms", "p99_ms", "error_rate"):
+            metrics[f"{endpoint}.{key}"] = stats[key]
+    return metrics
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Drive candidate and HR journeys against the API and report latency percentiles")
+    parser.add_argument("--base-url", help="Target a running server instead of starting one")
+    parser.add_argument("--provider", default="mock", choices=["mock", "replay"], help="AI provider of the started server")
+    parser.add_argument("--replay-path", help="Recordings replayed by the replay provider")
+    parser.add_argument("--concurrency", type=int, default=10, help="Number of virtual users")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run the journeys for")
+    parser.add_argument("--hr-share", type=float, default=0.2, help="Share of journeys made by HR users")
+    parser.add_argument("--jobs", type=int, default=5, help="Jobs (each with one assessment) to seed")
+    parser.add_argument("--candidates", type=int, default=20, help="Candidate accounts to seed")
+    parser.add_argument("--questions", type=int, default=6, help="Questions per seeded assessment")
+    parser.add_argument("--request-timeout", type=float, default=30.0, help="Per-request timeout in seconds")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the journey choices")
+    parser.add_argument("--output", help="Write the report to this JSON file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Path of the baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative regression, e.g. 0.25 for 25%%")
+    parser.add_argument("--min-delta", type=float, default=5.0, help="Ignore regressions smaller than this absolute amount")
+    parser.add_argument("--update-baseline", action="store_true", help="Store the results as the new baseline")
+    parser.add_argument("--no-baseline", action="store_true", help="Only report, without comparing with the baseline")
+    args = parser.parse_args()
+
+    if args.base_url:
+        report = asyncio.run(run_load(args.base_url, args))
+    else:
+        with local_server(args) as base_url:
+            report = asyncio.run(run_load(base_url, args))
+
+    print_report(report)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent=2, sort_keys=True)
+        print(f"\nReport written to {args.output}")
+
+    if args.no_baseline or not report["endpoints"]:
+        return 0
+    print("\nLatency and error rates:")
+    return check_against_baseline(baseline_metrics(report), args.baseline, args.threshold, args.update_baseline, args.min_delta)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+"""
+Micro-benchmarks of backend hot functions.
+
+Times each function in-process against a throwaway SQLite database and the mock AI
+provider, and reports the median time per call in microseconds:
+- calculate_application_score for an MCQ-only and a mixed (MCQ and text) application
+- is_authenticated and verify_token for a valid token
+- get_password_hash
+- JSON parsing of application answers and assessment questions
+- construction of ApplicationAnswerWithQuestion and JobResponse
+- MistralGenerator._convert_to_assessment_questions on a provider-shaped response
+
+Usage (from the backend directory):
+    python -m benchmarks.micro                        # compare with the stored baseline
+    python -m benchmarks.micro --filter score --repeat 9
+    python -m benchmarks.micro --update-baseline
+    python -m benchmarks.micro --no-baseline          # only report the timings
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import timeit
+import uuid
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from benchmarks.baseline import check_against_baseline
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(BACKEND_DIR, "benchmarks", "baselines", "micro.json")
+
+QUESTION_COUNT = 10
+
+
+class Benchmark(NamedTuple):
+    name: str
+    func: Callable[[], object]
+    # Calls per timed repetition; slow functions use fewer
+    number: int
+
+
+def _questions(mixed: bool) -> List[dict]:
+    """Assessment questions as stored in the database"""
+    questions = []
+    for i in range(QUESTION_COUNT):
+        question_type = "text_based" if mixed and i % 3 == 2 else ("choose_one" if i % 2 else "choose_many")
+        question = {
+            "id": f"mistral_{i}",
+            "text": f"Which approach best solves problem {i}?",
+            "weight": i % 5 + 1,
+            "skill_categories": ["python", "sql"],
+            "type": question_type,
+            "options": [],
+            "correct_options": [],
+        }
+        if question_type != "text_based":
+            question["options"] = [{"text": f"Option {value}", "value": value} for value in "abcd"]
+            question["correct_options"] = ["a"] if question_type == "choose_one" else ["a", "c"]
+        questions.append(question)
+    return questions
+
+
+def _answers(questions: List[dict]) -> List[dict]:
+    return [
+        {"question_id": q["id"], "text": "I would measure first, then optimize the slowest query.", "options": []}
+        if q["type"] == "text_based" else {"question_id": q["id"], "text": None, "options": q["correct_options"]}
+        for q in questions
+    ]
+
+
+def build_benchmarks() -> List[Benchmark]:
+    """Seed the database and return the benchmarks, with their inputs prepared up front"""
+    # Imported after the environment is set so the settings pick it up
+    from database.database import SessionLocal, engine
+    from integrations.ai_integration.mistral_generator import MistralGenerator
+    from models import Application, Assessment, Base, Job, User
+    from schemas.application import ApplicationAnswerWithQuestion
+    from schemas.enums import QuestionType
+    from schemas.job import JobResponse
+    from services.application_service import calculate_application_score
+    from utils.jwt_utils import create_access_token, is_authenticated, verify_token
+    from utils.password_utils import get_password_hash
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    user = User(id=str(uuid.uuid4()), first_name="Bench", last_name="Mark", email="bench@example.com", password="x", role="applicant")
+    job = Job(id=str(uuid.uuid4()), title="Backend Engineer", seniority="mid", description="Benchmark job",
+              skill_categories=json.dumps(["python", "sql"]), active=True)
+    db.add_all([user, job])
+    application_ids = {}
+    for kind, mixed in (("mcq", False), ("mixed", True)):
+        questions = _questions(mixed)
+        assessment = Assessment(id=str(uuid.uuid4()), job_id=job.id, title=f"{kind} assessment", duration=600,
+                                passing_score=50, questions=json.dumps(questions), active=True)
+        application = Application(id=str(uuid.uuid4()), job_id=job.id, assessment_id=assessment.id, user_id=user.id,
+                                  answers=json.dumps(_answers(questions)))
+        db.add_all([assessment, application])
+        application_ids[kind] = application.id
+    db.commit()
+    db.refresh(job)
+
+    token = create_access_token({"sub": user.id})
+    questions_json = json.dumps(_questions(True))
+    answers_json = json.dumps(_answers(_questions(True)))
+    question, answer = _questions(True)[1], _answers(_questions(True))[1]
+    job_dict = {**job.__dict__, "skill_categories": json.loads(job.skill_categories), "applicants_count": 3}
+
+    mistral = MistralGenerator.__new__(MistralGenerator)
+    mistral_response = [
+        {"type": "MCQ", "prompt": f"Question {i}?", "choices": ["A", "B", "C", "D"], "correct_answer": "B", "skill": "python"}
+        if i % 2 else {"type": "TEXT", "prompt": f"Explain topic {i}.", "correct_answer": None, "skill": "sql"}
+        for i in range(QUESTION_COUNT)
+    ]
+
+    return [
+        Benchmark("calculate_application_score.mcq", lambda: calculate_application_score(db, application_ids["mcq"]), 200),
+        Benchmark("calculate_application_score.mixed", lambda: calculate_application_score(db, application_ids["mixed"]), 50),
+        Benchmark("is_authenticated", lambda: is_authenticated(token), 200),
+        Benchmark("verify_token", lambda: verify_token(token), 2000),
+        Benchmark("get_password_hash", lambda: get_password_hash("benchmark-password"), 2),
+        Benchmark("json.parse_questions", lambda: json.loads(questions_json), 5000),
+        Benchmark("json.parse_answers", lambda: json.loads(answers_json), 5000),
+        Benchmark("ApplicationAnswerWithQuestion", lambda: ApplicationAnswerWithQuestion(
+            question_id=answer["question_id"], text=answer["text"], options=answer["options"],
+            question_text=question["text"], weight=question["weight"], skill_categories=question["skill_categories"],
+            type=QuestionType(question["type"]), question_options=question["options"],
+            correct_options=question["correct_options"], rationale="Selected the correct options"
+        ), 5000),
+        Benchmark("JobResponse", lambda: JobResponse(**job_dict), 5000),
+        Benchmark("MistralGenerator._convert_to_assessment_questions", lambda: mistral._convert_to_assessment_questions(mistral_response), 1000),
+    ]
+
+
+def run_benchmark(repeat: int, name_filter: Optional[str]) -> Dict[str, float]:
+    """Time every selected benchmark and keep the median time per call in microseconds"""
+    workdir = tempfile.mkdtemp()
+    os.environ.update(
+        DATABASE_URL=f"sqlite:///{os.path.join(workdir, 'micro.db')}",
+        LOG_FILE=os.path.join(workdir, "micro.log"),
+        LOG_LEVEL="WARNING",
+        AI_PROVIDER="mock",
+        AI_CACHE_ENABLED="false",
+        PREGENERATION_ENABLED="false",
+    )
+
+    metrics = {}
+    for benchmark in build_benchmarks():
+        if name_filter and name_filter not in benchmark.name:
+            continue
+        # One untimed call so lazy imports and first-use caches are not measured
+        benchmark.func()
+        times = timeit.Timer(benchmark.func).repeat(repeat=repeat, number=benchmark.number)
+        metrics[f"{benchmark.name}_us"] = round(statistics.median(times) / benchmark.number * 1_000_000, 3)
+        print(f"  {benchmark.name}: {metrics[f'{benchmark.name}_us']:.2f} us")
+    return metrics
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Time backend hot functions")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed repetitions per benchmark; the median is kept")
+    parser.add_argument("--filter", help="Only run benchmarks whose name contains this text")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Path of the baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative regression, e.g. 0.25 for 25%%")
+    parser.add_argument("--min-delta", type=float, default=0.5, help="Ignore regressions smaller than this absolute amount")
+    parser.add_argument("--update-baseline", action="store_true", help="Store the results as the new baseline")
+    parser.add_argument("--no-baseline", action="store_true", help="Only report, without comparing with the baseline")
+    parser.add_argument("--output", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+    if args.filter and args.update_baseline:
+        parser.error("--update-baseline stores every benchmark, so it cannot be combined with --filter")
+    if args.no_baseline and args.update_baseline:
+        parser.error("--no-baseline cannot be combined with --update-baseline")
+
+    metrics = run_benchmark(args.repeat, args.filter)
+    if not metrics:
+        print(f"No benchmark matches {args.filter!r}")
+        return 1
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(metrics, output_file, indent=2, sort_keys=True)
+
+    if args.no_baseline:
+        return 0
+    print("\nMicro-benchmarks (median microseconds per call):")
+    return check_against_baseline(metrics, args.baseline, args.threshold, args.update_baseline, args.min_delta)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,265 @@
+"""
+Mixed read/write throughput of the SQLite engine profiles.
+
+Seeds a database with the synthetic data generator, then runs the same workload against
+a fresh copy of it for each profile: worker threads that, for a fixed time, each open an
+ORM session per operation as the endpoints do and run either a read (a candidate's
+applications, a job with its applicant count, or an application by id) or, at
+--write-share, a write (submitting an application or updating one's answers).
+- default: the engine as configured before the production profile (rollback journal,
+  pysqlite defaults and SQLAlchemy's default pool of 5 plus 10 overflow connections)
+- production: the application's engines, with the pragmas from the settings; reads go
+  through the read-only engine and its pool, writes through the small writer pool
+
+Reports the throughput of each profile, read and write latency percentiles, and the share
+of operations that failed, e.g. with "database is locked".
+
+Usage (from the backend directory):
+    python -m benchmarks.sqlite_profile                        # compare with the stored baseline
+    python -m benchmarks.sqlite_profile --threads 32 --write-share 0.3 --duration 20
+    python -m benchmarks.sqlite_profile --update-baseline
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Tuple
+
+from benchmarks.baseline import check_against_baseline
+from benchmarks.load_test import percentile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(BACKEND_DIR, "benchmarks", "baselines", "sqlite_profile.json")
+
+PROFILES = ("default", "production")
+
+
+def seed_database(path: str, counts: Dict[str, int], seed: int) -> Dict[str, List[str]]:
+    """Fill a database with synthetic rows and return the ids the workload picks from"""
+    from sqlalchemy import create_engine, select
+    from benchmarks.synthetic_data import Generator, PASSWORD, insert_table
+    from models import Application, Assessment, Base, Job, User
+    from utils.password_utils import get_password_hash
+
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    generator = Generator(seed, counts, 0.01, get_password_hash(PASSWORD))
+    for table, make_rows in ((User.__table__, generator.users), (Job.__table__, generator.jobs),
+                             (Assessment.__table__, generator.assessments), (Application.__table__, generator.applications)):
+        insert_table(engine, table, counts[table.name], make_rows, 10_000, 200_000)
+
+    with engine.connect() as connection:
+        applications = connection.execute(select(Application.id, Application.user_id, Application.job_id, Application.assessment_id)).all()
+    engine.dispose()
+    return {
+        "applications": [row.id for row in applications],
+        "users": sorted({row.user_id for row in applications}),
+        "pairs": sorted({(row.job_id, row.assessment_id) for row in applications}),
+    }
+
+
+def build_engines(profile: str, path: str) -> Tuple[Any, Any]:
+    """The read and write engines of a profile"""
+    from sqlalchemy import create_engine
+    from config import settings
+    from database.database import create_database_engine, create_read_engine
+
+    url = f"sqlite:///{path}"
+    if profile == "default":
+        engine = create_engine(url, connect_args={"check_same_thread": False})
+        return engine, engine
+    write_engine = create_database_engine(url, settings.db_write_pool_size, settings.db_write_max_overflow)
+    return create_read_engine(url, write_engine), write_engine
+
+
+def build_operations(ids: Dict[str, List[str]]) -> Dict[str, Callable[[Any, random.Random], None]]:
+    """The reads and writes of the workload, each run in its own session"""
+    from models import Application
+    from services.application_service import get_application, get_applications_by_user
+    from services.job_service import get_job, get_job_applicants_count
+
+    def candidate_applications(db, rng):
+        get_applications_by_user(db, rng.choice(ids["users"]))
+
+    def job_with_applicants(db, rng):
+        job_id, _ = rng.choice(ids["pairs"])
+        get_job(db, job_id)
+        get_job_applicants_count(db, job_id)
+
+    def application_by_id(db, rng):
+        get_application(db, rng.choice(ids["applications"]))
+
+    def submit_application(db, rng):
+        job_id, assessment_id = rng.choice(ids["pairs"])
+        db.add(Application(id=str(uuid.uuid4()), job_id=job_id, assessment_id=assessment_id,
+                           user_id=rng.choice(ids["users"]), answers="[]"))
+        db.commit()
+
+    def update_answers(db, rng):
+        application = get_application(db, rng.choice(ids["applications"]))
+        application.answers = json.dumps([{"question_id": "mistral_0", "text": None, "options": [rng.choice("abcd")]}])
+        db.commit()
+
+    return {
+        "read.candidate_applications": candidate_applications,
+        "read.job_with_applicants": job_with_applicants,
+        "read.application_by_id": application_by_id,
+        "write.submit_application": submit_application,
+        "write.update_answers": update_answers,
+    }
+
+
+def run_profile(read_engine, write_engine, operations: Dict[str, Callable], threads: int, duration: float,
+                write_share: float, seed: int) -> Dict[str, Any]:
+    """Run the workload on a profile's engines and aggregate throughput, latency and errors"""
+    from sqlalchemy.orm import sessionmaker
+
+    session_factories = {
+        "read": sessionmaker(autocommit=False, autoflush=False, bind=read_engine),
+        "write": sessionmaker(autocommit=False, autoflush=False, bind=write_engine),
+    }
+    reads = [name for name in operations if name.startswith("read.")]
+    writes = [name for name in operations if name.startswith("write.")]
+    latencies = {"read": [], "write": []}
+    errors = {"read": 0, "write": 0}
+    error_messages: Dict[str, int] = {}
+    lock = threading.Lock()
+    start_barrier = threading.Barrier(threads + 1)
+
+    def worker(index: int) -> None:
+        rng = random.Random(f"{seed}:{index}")
+        start_barrier.wait()
+        while time.perf_counter() < deadline:
+            kind = "write" if rng.random() < write_share else "read"
+            name = rng.choice(writes if kind == "write" else reads)
+            started = time.perf_counter()
+            db = session_factories[kind]()
+            try:
+                operations[name](db, rng)
+                failure = None
+            except Exception as e:
+                db.rollback()
+                failure = str(e).splitlines()[0][:120]
+            finally:
+                db.close()
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            with lock:
+                if failure is None:
+                    latencies[kind].append(elapsed_ms)
+                else:
+                    errors[kind] += 1
+                    error_messages[failure] = error_messages.get(failure, 0) + 1
+
+    workers = [threading.Thread(target=worker, args=(index,)) for index in range(threads)]
+    for thread in workers:
+        thread.start()
+    deadline = time.perf_counter() + duration
+    start_barrier.wait()
+    for thread in workers:
+        thread.join()
+
+    completed = sum(len(values) for values in latencies.values())
+    attempted = completed + sum(errors.values())
+    result = {
+        "operations": completed,
+        "throughput_ops": round(completed / duration, 1),
+        "error_rate": round(sum(errors.values()) / attempted, 4) if attempted else 0.0,
+        "errors": error_messages,
+    }
+    for kind, values in latencies.items():
+        values.sort()
+        result[f"{kind}_p50_ms"] = round(percentile(values, 0.50), 2)
+        result[f"{kind}_p95_ms"] = round(percentile(values, 0.95), 2)
+        result[f"{kind}_p99_ms"] = round(percentile(values, 0.99), 2)
+    return result
+
+
+def run_benchmark(args: argparse.Namespace) -> Dict[str, Dict[str, Any]]:
+    workdir = tempfile.mkdtemp()
+    os.environ.update(
+        DATABASE_URL=f"sqlite:///{os.path.join(workdir, 'unused.db')}",
+        LOG_FILE=os.path.join(workdir, "sqlite_profile.log"),
+        # The contention this creates logs many slow query warnings
+        LOG_LEVEL="ERROR",
+        AI_PROVIDER="mock",
+        PREGENERATION_ENABLED="false",
+    )
+
+    template = os.path.join(workdir, "template.db")
+    counts = {"users": args.users, "jobs": args.jobs, "assessments": args.assessments, "applications": args.applications}
+    print(f"Seeding {', '.join(f'{count:,} {table}' for table, count in counts.items())}")
+    ids = seed_database(template, counts, args.seed)
+    operations = build_operations(ids)
+
+    results = {}
+    for profile in PROFILES:
+        # A fresh copy per profile, since the journal mode is stored in the database file
+        path = os.path.join(workdir, f"{profile}.db")
+        shutil.copyfile(template, path)
+        read_engine, write_engine = build_engines(profile, path)
+        print(f"\nRunning the {profile} profile: {args.threads} threads for {args.duration:.0f} s, {args.write_share:.0%} writes")
+        try:
+            results[profile] = run_profile(read_engine, write_engine, operations, args.threads, args.duration, args.write_share, args.seed)
+        finally:
+            read_engine.dispose()
+            write_engine.dispose()
+    shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+
+def print_report(results: Dict[str, Dict[str, Any]]) -> None:
+    print(f"\n  {'profile':<10}  {'ops/s':>8}  {'errors':>7}  {'read p50':>9}  {'read p95':>9}  {'write p50':>10}  {'write p95':>10}")
+    for profile, result in results.items():
+        print(f"  {profile:<10}  {result['throughput_ops']:>8.1f}  {result['error_rate']:>7.2%}  "
+              f"{result['read_p50_ms']:>9.1f}  {result['read_p95_ms']:>9.1f}  {result['write_p50_ms']:>10.1f}  {result['write_p95_ms']:>10.1f}")
+        for message, count in sorted(result["errors"].items(), key=lambda item: -item[1]):
+            print(f"    {count} x {message}")
+    if all(results[profile]["throughput_ops"] for profile in PROFILES):
+        print(f"\n  production / default throughput: {results['production']['throughput_ops'] / results['default']['throughput_ops']:.2f}x")
+
+
+def baseline_metrics(results: Dict[str, Dict[str, Any]]) -> Dict[str, float]:
+    """The lower-is-better metrics of the production profile, as compared against the baseline"""
+    production = results["production"]
+    metrics = {key: production[key] for key in ("read_p50_ms", "read_p95_ms", "write_p50_ms", "write_p95_ms", "error_rate")}
+    # Inverse throughput, so that lower is better like every other metric
+    metrics["ms_per_operation"] = round(1000 / production["throughput_ops"], 4) if production["throughput_ops"] else float("inf")
+    return metrics
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare mixed read/write throughput of the default and production SQLite profiles")
+    parser.add_argument("--threads", type=int, default=16, help="Concurrent worker threads")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds each profile runs")
+    parser.add_argument("--write-share", type=float, default=0.2, help="Share of operations that write")
+    parser.add_argument("--users", type=int, default=10_000, help="Seeded users")
+    parser.add_argument("--jobs", type=int, default=500, help="Seeded jobs")
+    parser.add_argument("--assessments", type=int, default=2_000, help="Seeded assessments")
+    parser.add_argument("--applications", type=int, default=50_000, help="Seeded applications")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the data and the workload")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Path of the baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative regression, e.g. 0.25 for 25%%")
+    parser.add_argument("--min-delta", type=float, default=1.0, help="Ignore regressions smaller than this absolute amount")
+    parser.add_argument("--update-baseline", action="store_true", help="Store the results as the new baseline")
+    parser.add_argument("--output", help="Also write the full results to this JSON file")
+    args = parser.parse_args()
+
+    results = run_benchmark(args)
+    print_report(results)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+
+    print("\nProduction profile:")
+    return check_against_baseline(baseline_metrics(results), args.baseline, args.threshold, args.update_baseline, args.min_delta)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,285 @@
+"""
+Synthetic dataset generator for performance work.
+
+Bulk-inserts realistic users, jobs, assessments (with question JSON shaped like the AI
+providers' output) and applications (with answers to those questions) using Core
+executemany in large transactions. The default counts at --scale 1 are 1M users,
+50k jobs, 200k assessments and 5M applications; --scale multiplies all of them and the
+per-table options override single tables. The same --seed always produces the same rows,
+ids included.
+
+All users share one password ("benchmark-password"), hashed once, since hashing millions
+of passwords would dominate the run.
+
+Usage (from the backend directory):
+    python -m benchmarks.synthetic_data --database-url sqlite:///./benchmark.db --scale 0.1
+    python -m benchmarks.synthetic_data --database-url sqlite:///./benchmark.db --scale 1 --seed 7
+    python -m benchmarks.synthetic_data --database-url sqlite:///./benchmark.db --users 20000 --applications 100000
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import sys
+import time
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.engine import Engine
+
+_VARIANT = {digit: "89ab"[int(digit, 16) & 3] for digit in "0123456789abcdef"}
+
+# Row counts at --scale 1
+FULL_SCALE = {"users": 1_000_000, "jobs": 50_000, "assessments": 200_000, "applications": 5_000_000}
+PASSWORD = "benchmark-password"
+MAX_QUESTIONS = 15
+
+FIRST_NAMES = ["Ava", "Liam", "Maya", "Omar", "Lena", "Noah", "Sara", "Yusuf", "Nora", "Ali", "Mia", "Karim", "Hana", "Leo", "Rami", "Zoe"]
+LAST_NAMES = ["Haddad", "Smith", "Khoury", "Garcia", "Nasser", "Müller", "Rossi", "Tanaka", "Silva", "Brown", "Saleh", "Novak", "Kim", "Dubois"]
+ROLES = ["Backend Engineer", "Frontend Engineer", "Data Engineer", "QA Engineer", "DevOps Engineer", "Mobile Developer", "Data Scientist", "Security Engineer"]
+SENIORITIES = ["intern", "junior", "mid", "senior"]
+SKILLS = {
+    "Backend Engineer": ["python", "sql", "apis", "caching", "concurrency"],
+    "Frontend Engineer": ["typescript", "react", "css", "accessibility", "performance"],
+    "Data Engineer": ["sql", "spark", "data modeling", "airflow", "python"],
+    "QA Engineer": ["testing", "automation", "selenium", "ci", "bug tracking"],
+    "DevOps Engineer": ["docker", "kubernetes", "terraform", "monitoring", "linux"],
+    "Mobile Developer": ["kotlin", "swift", "ui design", "offline storage", "testing"],
+    "Data Scientist": ["statistics", "python", "machine learning", "sql", "visualization"],
+    "Security Engineer": ["threat modeling", "cryptography", "networking", "auditing", "linux"],
+}
+TEXT_ANSWERS = [
+    "I would start by measuring, then fix the slowest part and measure again.",
+    "Add an index on the filtered column and check the query plan afterwards.",
+    "Split the work into smaller tasks and process them in parallel with a bounded pool.",
+    "Cache the result with a short TTL and invalidate it when the source changes.",
+    "Write a failing test that reproduces the bug before changing the code.",
+]
+
+
+def entity_id(seed: int, kind: str, index: int) -> str:
+    """Deterministic UUID (version 4 layout) of the index-th row of a kind, so rows can reference each other without lookups"""
+    h = hashlib.blake2b(f"{seed}:{kind}:{index}".encode(), digest_size=16).hexdigest()
+    # Formatted by hand; building uuid.UUID objects was a large share of the generation time
+    return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{_VARIANT[h[16]]}{h[17:20]}-{h[20:]}"
+
+
+def build_question_pool(rng: random.Random, size: int = 2000) -> List[Dict[str, Any]]:
+    """Questions shaped like provider output, which assessments pick from"""
+    pool = []
+    for index in range(size):
+        role = rng.choice(ROLES)
+        skill = rng.choice(SKILLS[role])
+        question_type = rng.choice(["choose_one", "choose_many", "text_based"])
+        question = {
+            "text": f"As a {role.lower()}, how would you approach {skill} problem #{index}?",
+            "weight": rng.randint(1, 5),
+            "skill_categories": [skill] + rng.sample(SKILLS[role], 1),
+            "type": question_type,
+            "options": [],
+            "correct_options": [],
+        }
+        if question_type != "text_based":
+            values = ["a", "b", "c", "d"]
+            question["options"] = [{"text": f"Option {value.upper()} about {skill}", "value": value} for value in values]
+            question["correct_options"] = rng.sample(values, 1 if question_type == "choose_one" else rng.randint(2, 3))
+        pool.append(question)
+    return pool
+
+
+class Generator:
+    """Produces the rows of each table in batches"""
+
+    def __init__(self, seed: int, counts: Dict[str, int], hr_share: float, password_hash: str):
+        self.seed = seed
+        self.counts = counts
+        self.rng = random.Random(seed)
+        self.password_hash = password_hash
+        self.hr_count = max(1, int(counts["users"] * hr_share))
+        self.pool = build_question_pool(self.rng)
+        # Answers are assembled from pre-encoded JSON, since json.dumps per application was the bottleneck
+        self.answer_prefixes = [f'{{"question_id": "mistral_{position}", ' for position in range(MAX_QUESTIONS)]
+        self.answer_choices = [self._encode_answers(question) for question in self.pool]
+        self.now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        # State needed to keep applications consistent with their assessments
+        self.job_roles = array("B")
+        self.job_ids: List[str] = []
+        self.assessment_jobs = array("I")
+        self.assessment_ids: List[str] = []
+        self.assessment_questions: List[Tuple[int, ...]] = []
+
+    @staticmethod
+    def _encode_answers(question: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+        """Likely and unlikely answers to a question as JSON, without the leading question id"""
+        if question["type"] == "text_based":
+            return [json.dumps({"text": text, "options": []})[1:] for text in TEXT_ANSWERS], []
+        correct = json.dumps({"text": None, "options": question["correct_options"]})[1:]
+        wrong = [json.dumps({"text": None, "options": [value]})[1:] for value in "abcd"]
+        return [correct], wrong
+
+    def users(self, start: int, stop: int) -> List[Dict[str, Any]]:
+        rng = self.rng
+        rows = []
+        for i in range(start, stop):
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            rows.append({
+                "id": entity_id(self.seed, "user", i),
+                "first_name": first,
+                "last_name": last,
+                "email": f"{first.lower()}.{last.lower()}.{i}@example.com",
+                "password": self.password_hash,
+                "role": "hr" if i < self.hr_count else "applicant",
+            })
+        return rows
+
+    def jobs(self, start: int, stop: int) -> List[Dict[str, Any]]:
+        rng = self.rng
+        rows = []
+        for i in range(start, stop):
+            role_index = rng.randrange(len(ROLES))
+            role = ROLES[role_index]
+            seniority = rng.choice(SENIORITIES)
+            self.job_roles.append(role_index)
+            self.job_ids.append(entity_id(self.seed, "job", i))
+            rows.append({
+                "id": self.job_ids[-1],
+                "title": f"{seniority.title()} {role}",
+                "seniority": seniority,
+                "description": f"We are hiring a {seniority} {role.lower()} to join a growing team.",
+                "skill_categories": json.dumps(rng.sample(SKILLS[role], 3)),
+                "active": rng.random() < 0.9,
+            })
+        return rows
+
+    def assessments(self, start: int, stop: int) -> List[Dict[str, Any]]:
+        rng = self.rng
+        rows = []
+        for i in range(start, stop):
+            job_index = rng.randrange(self.counts["jobs"])
+            picks = tuple(rng.sample(range(len(self.pool)), rng.randint(5, MAX_QUESTIONS)))
+            self.assessment_jobs.append(job_index)
+            self.assessment_ids.append(entity_id(self.seed, "assessment", i))
+            self.assessment_questions.append(picks)
+            questions = [dict(self.pool[pick], id=f"mistral_{position}") for position, pick in enumerate(picks)]
+            rows.append({
+                "id": self.assessment_ids[-1],
+                "job_id": self.job_ids[job_index],
+                "title": f"{ROLES[self.job_roles[job_index]]} assessment {i}",
+                "duration": 60 * sum(3 if self.pool[pick]["type"] == "text_based" else 1 for pick in picks),
+                "passing_score": rng.randrange(20, 81, 5),
+                "questions": json.dumps(questions),
+                "active": rng.random() < 0.95,
+            })
+        return rows
+
+    def applications(self, start: int, stop: int) -> List[Dict[str, Any]]:
+        rng = self.rng
+        applicants = self.counts["users"] - self.hr_count
+        rows = []
+        for i in range(start, stop):
+            assessment_index = rng.randrange(self.counts["assessments"])
+            answers = []
+            for position, pick in enumerate(self.assessment_questions[assessment_index]):
+                likely, unlikely = self.answer_choices[pick]
+                # Mostly right answers, so scores spread like a real candidate pool
+                choices = likely if not unlikely or rng.random() < 0.6 else unlikely
+                answers.append(self.answer_prefixes[position] + choices[rng.randrange(len(choices))])
+            created_at = self.now - timedelta(seconds=rng.randrange(365 * 24 * 3600))
+            rows.append({
+                "id": entity_id(self.seed, "application", i),
+                "job_id": self.job_ids[self.assessment_jobs[assessment_index]],
+                "assessment_id": self.assessment_ids[assessment_index],
+                "user_id": entity_id(self.seed, "user", self.hr_count + rng.randrange(applicants)),
+                "answers": "[" + ", ".join(answers) + "]",
+                "created_at": created_at,
+                "updated_at": None,
+            })
+        return rows
+
+
+def batches(total: int, batch_size: int) -> Iterator[Tuple[int, int]]:
+    for start in range(0, total, batch_size):
+        yield start, min(start + batch_size, total)
+
+
+def insert_table(engine: Engine, table, total: int, make_rows: Callable[[int, int], List[Dict[str, Any]]],
+                 batch_size: int, transaction_rows: int) -> float:
+    """Insert the rows of a table with executemany, committing every transaction_rows rows; returns rows per second"""
+    started = time.perf_counter()
+    uncommitted = 0
+    connection = engine.connect()
+    transaction = connection.begin()
+    try:
+        for start, stop in batches(total, batch_size):
+            connection.execute(table.insert(), make_rows(start, stop))
+            uncommitted += stop - start
+            if uncommitted >= transaction_rows or stop == total:
+                transaction.commit()
+                uncommitted = 0
+                elapsed = time.perf_counter() - started
+                print(f"  {table.name}: {stop:,}/{total:,} rows ({stop / elapsed:,.0f} rows/s)", end="\r", flush=True)
+                if stop < total:
+                    transaction = connection.begin()
+    finally:
+        if transaction.is_active:
+            transaction.rollback()
+        connection.close()
+    elapsed = time.perf_counter() - started
+    rate = total / elapsed if elapsed else 0.0
+    print(f"  {table.name}: {total:,} rows in {elapsed:.1f} s ({rate:,.0f} rows/s)" + " " * 10)
+    return rate
+
+
+def resolve_counts(args: argparse.Namespace) -> Dict[str, int]:
+    counts = {table: max(1, int(count * args.scale)) for table, count in FULL_SCALE.items()}
+    for table in FULL_SCALE:
+        if getattr(args, table) is not None:
+            counts[table] = getattr(args, table)
+    return counts
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Bulk-generate a reproducible synthetic dataset for benchmarks")
+    parser.add_argument("--database-url", required=True, help="Database to fill, e.g. sqlite:///./benchmark.db")
+    parser.add_argument("--scale", type=float, default=0.01, help="Multiplier of the full-scale row counts (1M users, 5M applications)")
+    parser.add_argument("--users", type=int, help="Number of users, overriding --scale")
+    parser.add_argument("--jobs", type=int, help="Number of jobs, overriding --scale")
+    parser.add_argument("--assessments", type=int, help="Number of assessments, overriding --scale")
+    parser.add_argument("--applications", type=int, help="Number of applications, overriding --scale")
+    parser.add_argument("--hr-share", type=float, default=0.01, help="Share of users with the HR role")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the generated data")
+    parser.add_argument("--batch-size", type=int, default=10_000, help="Rows per executemany call")
+    parser.add_argument("--transaction-rows", type=int, default=200_000, help="Rows per committed transaction")
+    args = parser.parse_args()
+
+    # Imported here so that a bad --database-url fails before the models are loaded
+    from models import Application, Assessment, Base, Job, User
+    from utils.password_utils import get_password_hash
+
+    engine = create_engine(args.database_url)
+    Base.metadata.create_all(bind=engine)
+    with engine.connect() as connection:
+        if connection.execute(select(func.count()).select_from(User.__table__)).scalar():
+            print(f"{args.database_url} already has users; generate into an empty database so ids do not collide")
+            return 1
+
+    counts = resolve_counts(args)
+    print(f"Generating {', '.join(f'{count:,} {table}' for table, count in counts.items())} with seed {args.seed}")
+    generator = Generator(args.seed, counts, args.hr_share, get_password_hash(PASSWORD))
+
+    started = time.perf_counter()
+    for table, make_rows in ((User.__table__, generator.users), (Job.__table__, generator.jobs),
+                             (Assessment.__table__, generator.assessments), (Application.__table__, generator.applications)):
+        insert_table(engine, table, counts[table.name], make_rows, args.batch_size, args.transaction_rows)
+
+    elapsed = time.perf_counter() - started
+    total = sum(counts.values())
+    print(f"\n{total:,} rows in {elapsed:.1f} s ({total / elapsed:,.0f} rows/s overall)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Dict, List, Optional
 import os
 from dotenv import load_dotenv
 
@@ -9,6 +9,29 @@ load_dotenv()
 class Settings(BaseSettings):
     # Database Configuration
     database_url: str = "sqlite:///./assessment_platform.db"
+    slow_query_threshold_ms: float = 100.0
+    slow_query_explain: bool = True  # log SQLite's EXPLAIN QUERY PLAN with each slow query
+    slow_query_top_n: int = 20
+    # SQLite production profile, set on every new connection
+    sqlite_pragmas_enabled: bool = True
+    sqlite_journal_mode: str = "WAL"  # readers no longer block on the writer
+    sqlite_synchronous: str = "NORMAL"  # durable against crashes in WAL mode; a power loss may drop the last commits
+    sqlite_busy_timeout_ms: int = 5000  # wait this long for a lock before "database is locked"
+    sqlite_cache_size_kib: int = 65536  # page cache per connection
+    sqlite_mmap_size_bytes: int = 268435456  # read through a memory map instead of read() calls
+    sqlite_temp_store: str = "MEMORY"  # temporary tables and sort spills
+    # Reads use their own read-only engine, which can point at a replica; defaults to database_url
+    database_read_url: Optional[str] = None
+    # Connection pools of on-disk databases. Reads get enough connections for the 40 threads that
+    # run sync endpoints. SQLite runs one write transaction at a time, so more writers only wait on
+    # each other until "database is locked"; writes queue for one of two connections instead.
+    # Generations give their connection back before calling the provider, so their cache and bank
+    # writes never need a second one
+    db_read_pool_size: int = 20
+    db_read_max_overflow: int = 20
+    db_write_pool_size: int = 2
+    db_write_max_overflow: int = 0
+    db_pool_timeout_seconds: float = 30.0
 
     # Server Configuration
     host: str = "0.0.0.0"
@@ -26,7 +49,85 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = 30
 
     # AI Provider Configuration
+    ai_provider: str = "mistral"  # mock, openai, anthropic, google, mistral or replay
     mistral_api_key: Optional[str] = None
+    mistral_model: str = "mistral-small-latest"
+    ai_http_max_connections: int = 100
+    ai_http_max_keepalive_connections: int = 20
+    ai_http_keepalive_expiry_seconds: float = 60.0
+    ai_warm_up_on_startup: bool = False
+    ai_cache_enabled: bool = True
+    ai_cache_ttl_seconds: int = 7 * 24 * 60 * 60
+    question_bank_enabled: bool = True
+    duration_estimator_mode: str = "local"  # local (deterministic, no AI call) or llm
+    duration_coefficients_path: Optional[str] = None  # calibrated coefficients for the local estimator
+    pipeline_duration_estimate: bool = True  # in llm mode, estimate the duration while questions are generated
+    duration_estimate_threads: int = 4
+    generation_chunk_size: int = 10  # larger requests are split into chunks generated in parallel
+    generation_chunk_threads: int = 4
+
+    # AI Resilience Configuration
+    ai_resilience_enabled: bool = True
+    ai_call_timeout_seconds: float = 60.0  # per attempt, also the HTTP timeout of the provider SDK
+    ai_call_deadline_seconds: float = 150.0  # all attempts of one call together
+    ai_max_retries: int = 2
+    ai_retry_backoff_seconds: float = 0.5
+    ai_retry_max_backoff_seconds: float = 8.0
+    ai_circuit_failure_threshold: int = 5
+    ai_circuit_reset_seconds: float = 30.0
+    ai_hedge_after_seconds: Optional[float] = None  # race a second request when an attempt is this slow
+    ai_fallback_provider: Optional[str] = None  # e.g. mock, used when the configured provider fails
+    ai_call_threads: int = 32
+
+    # AI Call Scheduling Configuration
+    ai_scheduler_enabled: bool = True
+    ai_rate_limit_per_second: Optional[float] = None  # match the provider quota, e.g. 1.0 for Mistral's free tier
+    ai_rate_limit_burst: int = 5
+    ai_max_concurrency: int = 8  # lowered automatically while the provider answers 429
+    ai_bulk_concurrency_share: float = 0.5  # bulk calls never hold more of the concurrency limit than this
+    ai_queue_timeout_seconds: float = 60.0
+
+    # AI Instrumentation Configuration
+    ai_instrumentation_enabled: bool = True
+    # [prompt, completion] US dollars per million tokens, used to estimate the cost of AI calls
+    ai_token_prices_usd_per_million: Dict[str, List[float]] = {
+        "mistral-small-latest": [0.1, 0.3],
+        "mistral-medium-latest": [0.4, 2.0],
+        "mistral-large-latest": [2.0, 6.0],
+    }
+
+    # AI Replay Configuration (the replay provider, for load testing without network access)
+    ai_replay_mode: str = "replay"  # record (call ai_replay_record_provider and save) or replay
+    ai_replay_path: str = "ai_recordings.jsonl"
+    ai_replay_record_provider: str = "mistral"
+    ai_replay_latency: str = "recorded"  # recorded, lognormal or none
+    ai_replay_latency_median_seconds: float = 2.0  # for lognormal, and recordings without a latency
+    ai_replay_latency_sigma: float = 0.5
+    ai_replay_latency_scale: float = 1.0  # multiplies every replayed latency
+    ai_replay_error_rate: float = 0.0
+    ai_replay_timeout_rate: float = 0.0  # calls that hang for ai_call_timeout_seconds, then fail
+    ai_replay_seed: int = 0
+
+    # Assessment Operation Configuration
+    assessment_worker_threads: int = 4
+    assessment_operation_lease_seconds: float = 60.0  # unfinished operations of a process silent this long are failed
+
+    # Question Pre-generation Configuration
+    pregeneration_enabled: bool = True
+    pregeneration_delay_seconds: float = 5.0  # head start for interactive requests
+    pregeneration_questions_per_type: int = 3
+    pregeneration_max_pending_jobs: int = 20
+    pregeneration_max_jobs_per_hour: int = 30
+
+    # Tracing Configuration
+    tracing_enabled: bool = False
+    tracing_exporter: str = "file"  # file, console or otlp
+    tracing_file_path: str = "traces.jsonl"
+    tracing_otlp_endpoint: Optional[str] = None  # defaults to the OTLP exporter's own endpoint settings
+    tracing_sample_rate: float = 1.0  # share of traces recorded; a caller's sampling decision is kept
+
+    # Startup Configuration
+    startup_time_budget_ms: int = 3000
 
     # Application Configuration
     app_name: str = "AI-Powered Hiring Assessment Platform"
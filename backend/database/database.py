@@ -1,26 +1,71 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from config import settings
+from database.slow_query_log import install_slow_query_log
+from database.sqlite_pragmas import install_sqlite_pragmas, install_sqlite_read_only, is_file_database
+from utils.tracing import install_sql_tracing
 from logging_config import get_logger
 
 # Create logger for this module
 logger = get_logger(__name__)
 
-# Database setup using SQLAlchemy
-engine = create_engine(
-    settings.database_url, connect_args={"check_same_thread": False}
-)
+def create_database_engine(database_url: str, pool_size: int, max_overflow: int, read_only: bool = False) -> Engine:
+    """Create an engine with the given pool and, for SQLite, the production pragmas"""
+    options = {}
+    sqlite = make_url(database_url).get_backend_name() == "sqlite"
+    if sqlite:
+        options["connect_args"] = {"check_same_thread": False}
+    # In-memory SQLite databases live in a single connection, so they get no pool sizing
+    if not sqlite or is_file_database(database_url):
+        options.update(pool_size=pool_size, max_overflow=max_overflow, pool_timeout=settings.db_pool_timeout_seconds)
+
+    engine = create_engine(database_url, **options)
+    if settings.sqlite_pragmas_enabled:
+        install_sqlite_pragmas(engine)
+    # Other databases are expected to be read-only replicas, or read-only by the account in the URL
+    if read_only:
+        install_sqlite_read_only(engine)
+    install_slow_query_log(engine)
+    install_sql_tracing(engine)
+    return engine
+
+def create_read_engine(database_url: str, write_engine: Engine) -> Engine:
+    """Create the read-only engine, or share the writer's for in-memory SQLite, which can't be opened twice"""
+    if make_url(database_url).get_backend_name() == "sqlite" and not is_file_database(database_url):
+        logger.warning("In-memory SQLite database: reads share the writer engine")
+        return write_engine
+    return create_database_engine(database_url, settings.db_read_pool_size, settings.db_read_max_overflow, read_only=True)
+
+# Database setup using SQLAlchemy: writes go through a small bounded pool, reads through a
+# separate read-only engine so they never queue for a writer connection
+engine = create_database_engine(settings.database_url, settings.db_write_pool_size, settings.db_write_max_overflow)
+read_engine = create_read_engine(settings.database_read_url or settings.database_url, engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
 
 Base = declarative_base()
 
-def get_db():
-    """Dependency to get database session"""
+def get_write_db():
+    """Dependency to get a database session for routes that write"""
     logger.debug("Creating database session")
     db = SessionLocal()
     try:
         yield db
     finally:
         logger.debug("Closing database session")
-        db.close()
\ No newline at end of file
+        db.close()
+
+def get_read_db():
+    """Dependency to get a read-only database session for routes that only read"""
+    logger.debug("Creating read-only database session")
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        logger.debug("Closing read-only database session")
+        db.close()
+
+# The writer is the default for code that doesn't say what it needs
+get_db = get_write_db
@@ -0,0 +1,118 @@
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from config import settings
+from logging_config import get_logger
+
+# Create logger for this module
+logger = get_logger(__name__)
+
+# Fingerprints tracked at once; the least costly one is dropped to make room for a new one
+MAX_TRACKED_FINGERPRINTS = 500
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+_WHITESPACE = re.compile(r"\s+")
+
+_slow_queries: Dict[str, Dict[str, Any]] = {}
+_lock = threading.Lock()
+
+
+def fingerprint(statement: str) -> str:
+    """Normalize a statement so that runs differing only in literals or IN-list lengths group together"""
+    statement = _STRING_LITERAL.sub("?", statement)
+    statement = _NUMBER_LITERAL.sub("?", statement)
+    statement = _PLACEHOLDER_LIST.sub("?, ...", statement)
+    return _WHITESPACE.sub(" ", statement).strip()
+
+def redact_parameters(parameters: Any) -> Any:
+    """Replace bound parameter values with their type names, keeping their shape"""
+    if isinstance(parameters, dict):
+        return {key: f"<{type(value).__name__}>" for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [f"<{type(value).__name__}>" for value in parameters]
+    return "<redacted>"
+
+def explain_query_plan(cursor, statement: str, parameters: Any) -> Optional[List[str]]:
+    """Get SQLite's EXPLAIN QUERY PLAN for a statement, as one line per plan step"""
+    try:
+        explain_cursor = cursor.connection.cursor()
+        try:
+            explain_cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            return [row[-1] for row in explain_cursor.fetchall()]
+        finally:
+            explain_cursor.close()
+    except Exception as e:
+        logger.debug(f"Could not explain slow query: {e}")
+        return None
+
+
+def _record(statement: str, duration_ms: float, plan: Optional[List[str]]) -> None:
+    key = fingerprint(statement)
+    with _lock:
+        entry = _slow_queries.get(key)
+        if entry is None:
+            if len(_slow_queries) >= MAX_TRACKED_FINGERPRINTS:
+                cheapest = min(_slow_queries, key=lambda k: _slow_queries[k]["total_ms"])
+                del _slow_queries[cheapest]
+            entry = _slow_queries[key] = {"fingerprint": key, "count": 0, "total_ms": 0.0, "max_ms": 0.0, "plan": None}
+        entry["count"] += 1
+        entry["total_ms"] += duration_ms
+        entry["max_ms"] = max(entry["max_ms"], duration_ms)
+        entry["last_seen"] = time.time()
+        if plan is not None:
+            entry["plan"] = plan
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get("query_started")
+    if not started:
+        return
+    duration_ms = (time.perf_counter() - started.pop()) * 1000
+    if duration_ms < settings.slow_query_threshold_ms:
+        return
+
+    plan = None
+    if settings.slow_query_explain and not executemany and conn.dialect.name == "sqlite":
+        plan = explain_query_plan(cursor, statement, parameters)
+    _record(statement, duration_ms, plan)
+    logger.warning(
+        f"Slow query took {duration_ms:.1f} ms: {_WHITESPACE.sub(' ', statement).strip()} "
+        f"parameters={redact_parameters(parameters)} plan={plan}"
+    )
+
+def _handle_error(exception_context):
+    started = exception_context.connection.info.get("query_started") if exception_context.connection else None
+    if started:
+        started.pop()
+
+
+def install_slow_query_log(engine: Engine) -> None:
+    """Time every statement run on the engine and record the ones over the slow query threshold"""
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+def get_slow_queries(limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Get the slow statement fingerprints that took the most time in total, costliest first"""
+    with _lock:
+        entries = [dict(entry) for entry in _slow_queries.values()]
+    entries.sort(key=lambda entry: entry["total_ms"], reverse=True)
+    for entry in entries:
+        entry["total_ms"] = round(entry["total_ms"], 3)
+        entry["max_ms"] = round(entry["max_ms"], 3)
+        entry["mean_ms"] = round(entry["total_ms"] / entry["count"], 3)
+    return entries[:limit or settings.slow_query_top_n]
+
+def reset_slow_queries() -> None:
+    """Forget the recorded slow queries"""
+    with _lock:
+        _slow_queries.clear()
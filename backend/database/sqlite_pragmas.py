@@ -0,0 +1,75 @@
+from typing import Any, Dict
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from config import settings
+from logging_config import get_logger
+
+# Create logger for this module
+logger = get_logger(__name__)
+
+JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+SYNCHRONOUS_MODES = {"OFF", "NORMAL", "FULL", "EXTRA"}
+TEMP_STORES = {"DEFAULT", "FILE", "MEMORY"}
+
+
+def is_file_database(database_url: str) -> bool:
+    """Whether the URL points at an on-disk SQLite database, rather than an in-memory one"""
+    url = make_url(database_url)
+    if url.get_backend_name() != "sqlite":
+        return False
+    database = url.database or ""
+    return database not in ("", ":memory:") and url.query.get("mode") != "memory"
+
+def sqlite_pragmas() -> Dict[str, Any]:
+    """The pragmas of the production profile, in the order they are set on a new connection"""
+    journal_mode = settings.sqlite_journal_mode.upper()
+    synchronous = settings.sqlite_synchronous.upper()
+    temp_store = settings.sqlite_temp_store.upper()
+    # Pragma values can't be bound as parameters, so only known values are interpolated
+    if journal_mode not in JOURNAL_MODES:
+        raise ValueError(f"Unknown SQLite journal mode: {settings.sqlite_journal_mode}")
+    if synchronous not in SYNCHRONOUS_MODES:
+        raise ValueError(f"Unknown SQLite synchronous mode: {settings.sqlite_synchronous}")
+    if temp_store not in TEMP_STORES:
+        raise ValueError(f"Unknown SQLite temp store: {settings.sqlite_temp_store}")
+
+    return {
+        # First, so that a locked database is waited for while the others are set
+        "busy_timeout": int(settings.sqlite_busy_timeout_ms),
+        "journal_mode": journal_mode,
+        "synchronous": synchronous,
+        # A negative cache size is in KiB rather than pages
+        "cache_size": -int(settings.sqlite_cache_size_kib),
+        "mmap_size": int(settings.sqlite_mmap_size_bytes),
+        "temp_store": temp_store,
+    }
+
+def install_sqlite_pragmas(engine: Engine) -> None:
+    """Set the production pragmas on every connection the engine opens to a SQLite database"""
+    if engine.dialect.name != "sqlite":
+        return
+    pragmas = sqlite_pragmas()
+
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+    event.listen(engine, "connect", set_pragmas)
+    logger.info(f"SQLite pragmas set on new connections: {', '.join(f'{name}={value}' for name, value in pragmas.items())}")
+
+def _set_query_only(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA query_only=ON")
+    finally:
+        cursor.close()
+
+def install_sqlite_read_only(engine: Engine) -> None:
+    """Make every connection the engine opens to a SQLite database refuse writes"""
+    if engine.dialect.name != "sqlite" or event.contains(engine, "connect", _set_query_only):
+        return
+    event.listen(engine, "connect", _set_query_only)
@@ -1,11 +1,13 @@
+import importlib
+import threading
 from enum import Enum
-from typing import Dict, Type
+from typing import Dict, Type, Iterable, List, Union
 from integrations.ai_integration.ai_generator_interface import AIGeneratorInterface
-from integrations.ai_integration.mock_ai_generator import MockAIGenerator
-from integrations.ai_integration.openai_generator import OpenAIGenerator
-from integrations.ai_integration.anthropic_generator import AnthropicGenerator
-from integrations.ai_integration.google_ai_generator import GoogleAIGenerator
-from integrations.ai_integration.mistral_generator import MistralGenerator
+from config import settings
+from logging_config import get_logger
+
+# Create logger for this module
+logger = get_logger(__name__)
 
 
 class AIProvider(Enum):
@@ -17,26 +19,39 @@ class AIProvider(Enum):
     ANTHROPIC = "anthropic"
     GOOGLE = "google"
     MISTRAL = "mistral"
+    REPLAY = "replay"
 
 
 class AIGeneratorFactory:
     """
     Factory class for creating AI generator instances.
     Allows for easy addition of new AI providers without changing existing code.
+
+    create_generator always builds a fresh instance, while get_generator hands out
+    one shared instance per provider so its HTTP connection pool is reused.
+
+    Providers are registered by dotted import path and only imported on first use,
+    so heavy SDKs are never loaded for providers that are not configured.
     """
     
-    _providers: Dict[AIProvider, Type[AIGeneratorInterface]] = {}
+    _providers: Dict[AIProvider, Union[str, Type[AIGeneratorInterface]]] = {}
+    _instances: Dict[AIProvider, AIGeneratorInterface] = {}
+    _instances_lock = threading.RLock()
     
     @classmethod
-    def register_provider(cls, provider: AIProvider, generator_class: Type[AIGeneratorInterface]):
+    def register_provider(cls, provider: AIProvider, generator_class: Union[str, Type[AIGeneratorInterface]]):
         """
         Register a new AI provider with the factory.
         
         Args:
             provider: The AI provider enum value
-            generator_class: The class that implements AIGeneratorInterface
+            generator_class: The class that implements AIGeneratorInterface, or its
+                dotted import path (e.g. "package.module.ClassName") to import it lazily
         """
-        cls._providers[provider] = generator_class
+        with cls._instances_lock:
+            cls._providers[provider] = generator_class
+            # Drop any instance built from a previously registered class
+            cls._instances.pop(provider, None)
     
     @classmethod
     def create_generator(cls, provider: AIProvider) -> AIGeneratorInterface:
@@ -55,8 +70,82 @@ class AIGeneratorFactory:
         if provider not in cls._providers:
             raise ValueError(f"AI provider {provider} is not registered")
         
-        generator_class = cls._providers[provider]
+        generator_class = cls._resolve_provider_class(provider)
         return generator_class()
+
+    @classmethod
+    def _resolve_provider_class(cls, provider: AIProvider) -> Type[AIGeneratorInterface]:
+        """
+        Import the class registered for a provider if it was registered by path.
+        """
+        generator_class = cls._providers[provider]
+        if isinstance(generator_class, str):
+            import_path = generator_class
+            module_path, _, class_name = import_path.rpartition(".")
+            generator_class = getattr(importlib.import_module(module_path), class_name)
+            logger.info(f"Loaded AI provider {provider.value} from {module_path}")
+            with cls._instances_lock:
+                # Keep the newer registration if the provider was re-registered meanwhile
+                if cls._providers.get(provider) == import_path:
+                    cls._providers[provider] = generator_class
+        return generator_class
+
+    @classmethod
+    def get_generator(cls, provider: AIProvider) -> AIGeneratorInterface:
+        """
+        Get the shared instance of the specified AI generator, creating it on first use.
+
+        Args:
+            provider: The AI provider to get
+
+        Returns:
+            The shared instance of the requested AI generator
+
+        Raises:
+            ValueError: If the provider is not registered
+        """
+        instance = cls._instances.get(provider)
+        if instance is None:
+            with cls._instances_lock:
+                # Another thread may have created it while we waited for the lock
+                instance = cls._instances.get(provider)
+                if instance is None:
+                    instance = cls.create_generator(provider)
+                    cls._instances[provider] = instance
+                    logger.info(f"Created shared AI generator for provider: {provider.value}")
+        return instance
+
+    @classmethod
+    def warm_up(cls, providers: Iterable[AIProvider]) -> None:
+        """
+        Create the shared instances of the given providers and open their connections.
+        Failures are logged rather than raised so a provider outage cannot block startup.
+
+        Args:
+            providers: The AI providers to warm up
+        """
+        for provider in providers:
+            try:
+                cls.get_generator(provider).warm_up()
+                logger.info(f"Warmed up AI provider: {provider.value}")
+            except Exception as e:
+                logger.warning(f"Failed to warm up AI provider {provider.value}: {str(e)}")
+
+    @classmethod
+    async def aclose_all(cls) -> None:
+        """
+        Close and forget every shared generator instance.
+        """
+        with cls._instances_lock:
+            instances = list(cls._instances.items())
+            cls._instances.clear()
+
+        for provider, instance in instances:
+            try:
+                await instance.aclose()
+                logger.info(f"Closed AI provider: {provider.value}")
+            except Exception as e:
+                logger.warning(f"Failed to close AI provider {provider.value}: {str(e)}")
     
     @classmethod
     def get_available_providers(cls) -> list:
@@ -68,14 +157,25 @@ class AIGeneratorFactory:
         """
         return list(cls._providers.keys())
 
+    @classmethod
+    def get_loaded_providers(cls) -> List[AIProvider]:
+        """
+        Get the providers whose implementation has already been imported.
+
+        Returns:
+            List of loaded AI providers
+        """
+        return [provider for provider, generator_class in cls._providers.items() if not isinstance(generator_class, str)]
+
 
-# Register all available providers
-AIGeneratorFactory.register_provider(AIProvider.MOCK, MockAIGenerator)
-AIGeneratorFactory.register_provider(AIProvider.OPENAI, OpenAIGenerator)
-AIGeneratorFactory.register_provider(AIProvider.ANTHROPIC, AnthropicGenerator)
-AIGeneratorFactory.register_provider(AIProvider.GOOGLE, GoogleAIGenerator)
-AIGeneratorFactory.register_provider(AIProvider.MISTRAL, MistralGenerator)
+# Register all available providers (imported on first use)
+AIGeneratorFactory.register_provider(AIProvider.MOCK, "integrations.ai_integration.mock_ai_generator.MockAIGenerator")
+AIGeneratorFactory.register_provider(AIProvider.OPENAI, "integrations.ai_integration.openai_generator.OpenAIGenerator")
+AIGeneratorFactory.register_provider(AIProvider.ANTHROPIC, "integrations.ai_integration.anthropic_generator.AnthropicGenerator")
+AIGeneratorFactory.register_provider(AIProvider.GOOGLE, "integrations.ai_integration.google_ai_generator.GoogleAIGenerator")
+AIGeneratorFactory.register_provider(AIProvider.MISTRAL, "integrations.ai_integration.mistral_generator.MistralGenerator")
+AIGeneratorFactory.register_provider(AIProvider.REPLAY, "integrations.ai_integration.replay_ai_generator.ReplayAIGenerator")
 
 
-# Optional: Create a default provider
-DEFAULT_PROVIDER = AIProvider.MISTRAL
\ No newline at end of file
+# The provider used when callers do not ask for a specific one
+DEFAULT_PROVIDER = AIProvider(settings.ai_provider)
\ No newline at end of file
@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import AsyncIterator, List, Dict, Any
 from schemas.assessment import AssessmentQuestion
 
 
@@ -7,8 +8,15 @@ class AIGeneratorInterface(ABC):
     """
     Interface for AI question generators.
     Defines the contract that all AI providers must implement.
+
+    Every blocking method has an ``a``-prefixed async counterpart. The default
+    async implementations run the blocking method in a worker thread, so
+    providers only need to override them when they can do real non-blocking I/O.
     """
 
+    # Name of the underlying model, used to tell cached responses of different models apart
+    model: str = None
+
     @abstractmethod
     def generate_questions(
         self,
@@ -70,4 +78,99 @@ class AIGeneratorInterface(ABC):
         Returns:
             String response from the AI containing the estimated duration
         """
-        pass
\ No newline at end of file
+        pass
+
+    async def agenerate_questions(
+        self,
+        title: str,
+        questions_types: List[str],
+        additional_note: str = None,
+        job_info: Dict[str, Any] = None
+    ) -> List[AssessmentQuestion]:
+        """
+        Async counterpart of generate_questions.
+
+        Returns:
+            List of generated AssessmentQuestion objects
+        """
+        return await asyncio.to_thread(
+            self.generate_questions,
+            title=title,
+            questions_types=questions_types,
+            additional_note=additional_note,
+            job_info=job_info
+        )
+
+    async def astream_questions(
+        self,
+        title: str,
+        questions_types: List[str],
+        additional_note: str = None,
+        job_info: Dict[str, Any] = None
+    ) -> AsyncIterator[AssessmentQuestion]:
+        """
+        Yield generated questions as each one becomes available.
+
+        Providers that cannot stream their response yield all questions once agenerate_questions returns.
+
+        Returns:
+            Async iterator of generated AssessmentQuestion objects
+        """
+        questions = await self.agenerate_questions(
+            title=title,
+            questions_types=questions_types,
+            additional_note=additional_note,
+            job_info=job_info
+        )
+        for question in questions:
+            yield question
+
+    async def ascore_answer(
+        self,
+        question: AssessmentQuestion,
+        answer_text: str,
+        selected_options: List[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Async counterpart of score_answer.
+
+        Returns:
+            Dictionary containing score information (see score_answer)
+        """
+        return await asyncio.to_thread(
+            self.score_answer,
+            question=question,
+            answer_text=answer_text,
+            selected_options=selected_options
+        )
+
+    async def aestimate_duration(
+        self,
+        prompt: str
+    ) -> str:
+        """
+        Async counterpart of estimate_duration.
+
+        Returns:
+            String response from the AI containing the estimated duration
+        """
+        return await asyncio.to_thread(self.estimate_duration, prompt)
+
+    def warm_up(self) -> None:
+        """
+        Prepare the provider for its first call, e.g. by opening connections.
+        Providers without anything to prepare can rely on this no-op default.
+        """
+        pass
+
+    def close(self) -> None:
+        """
+        Release resources held by the provider, such as pooled HTTP connections.
+        """
+        pass
+
+    async def aclose(self) -> None:
+        """
+        Async counterpart of close, used when shutting down inside the event loop.
+        """
+        self.close()
@@ -0,0 +1,90 @@
+from typing import AsyncIterator, List, Dict, Any
+from schemas.assessment import AssessmentQuestion
+from integrations.ai_integration.ai_generator_interface import AIGeneratorInterface
+
+
+class AIGeneratorWrapper(AIGeneratorInterface):
+    """
+    Base class for generators that add behaviour around another generator.
+
+    Every call is forwarded to the wrapped generator through ``_call`` and ``_acall``,
+    so subclasses only override those two hooks. The wrapped generator is owned by
+    the factory, so closing a wrapper leaves it open.
+    """
+
+    def __init__(self, inner: AIGeneratorInterface):
+        self.inner = inner
+
+    @property
+    def model(self) -> str:
+        return self.inner.model
+
+    def _call(self, method: str, **kwargs) -> Any:
+        """Run a blocking method of the wrapped generator"""
+        return getattr(self.inner, method)(**kwargs)
+
+    async def _acall(self, method: str, **kwargs) -> Any:
+        """Run an async method of the wrapped generator"""
+        return await getattr(self.inner, method)(**kwargs)
+
+    def generate_questions(
+        self,
+        title: str,
+        questions_types: List[str],
+        additional_note: str = None,
+        job_info: Dict[str, Any] = None
+    ) -> List[AssessmentQuestion]:
+        return self._call("generate_questions", title=title, questions_types=questions_types,
+                          additional_note=additional_note, job_info=job_info)
+
+    def score_answer(
+        self,
+        question: AssessmentQuestion,
+        answer_text: str,
+        selected_options: List[str] = None
+    ) -> Dict[str, Any]:
+        return self._call("score_answer", question=question, answer_text=answer_text, selected_options=selected_options)
+
+    def estimate_duration(
+        self,
+        prompt: str
+    ) -> str:
+        return self._call("estimate_duration", prompt=prompt)
+
+    async def agenerate_questions(
+        self,
+        title: str,
+        questions_types: List[str],
+        additional_note: str = None,
+        job_info: Dict[str, Any] = None
+    ) -> List[AssessmentQuestion]:
+        return await self._acall("agenerate_questions", title=title, questions_types=questions_types,
+                                 additional_note=additional_note, job_info=job_info)
+
+    async def ascore_answer(
+        self,
+        question: AssessmentQuestion,
+        answer_text: str,
+        selected_options: List[str] = None
+    ) -> Dict[str, Any]:
+        return await self._acall("ascore_answer", question=question, answer_text=answer_text, selected_options=selected_options)
+
+    async def aestimate_duration(
+        self,
+        prompt: str
+    ) -> str:
+        return await self._acall("aestimate_duration", prompt=prompt)
+
+    async def astream_questions(
+        self,
+        title: str,
+        questions_types: List[str],
+        additional_note: str = None,
+        job_info: Dict[str, Any] = None
+    ) -> AsyncIterator[AssessmentQuestion]:
+        async for question in self.inner.astream_questions(title=title, questions_types=questions_types,
+                                                           additional_note=additional_note, job_info=job_info):
+            yield question
+
+    def warm_up(self) -> None:
+        self.inner.warm_up()
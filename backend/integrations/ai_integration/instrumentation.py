@@ -0,0 +1,169 @@
+import contextvars
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
+from opentelemetry import trace
+from opentelemetry.trace import Span, SpanKind, Status, StatusCode
+from schemas.assessment import AssessmentQuestion
+from integrations.ai_integration.ai_generator_interface import AIGeneratorInterface
+from integrations.ai_integration.ai_generator_wrapper import AIGeneratorWrapper
+from utils.metrics import registry
+from utils.request_context import get_current_route
+from utils.tracing import tracer
+from config import settings
+from logging_config import get_logger
+
+# Create logger for this module
+logger = get_logger(__name__)
+
+AI_CALLS = registry.counter("ai_calls_total", "AI provider calls", ("provider", "model", "method", "route", "status"))
+AI_CALL_LATENCY = registry.histogram("ai_call_latency_seconds", "AI provider call latency, including retries and queueing", ("provider", "method", "route"))
+AI_TOKENS = registry.counter("ai_tokens_total", "Tokens used by AI provider calls", ("provider", "model", "method", "route", "kind"))
+AI_COST = registry.counter("ai_cost_usd_total", "Estimated cost of AI provider calls in US dollars", ("provider", "model", "route"))
+
+# Token usage of the instrumented call in progress; providers add to it as responses arrive
+_call_usage: contextvars.ContextVar[Optional[Dict[str, int]]] = contextvars.ContextVar("ai_call_usage", default=None)
+
+
+def record_token_usage(prompt_tokens: Optional[int], completion_tokens: Optional[int]) -> None:
+    """Add a provider response's token usage to the instrumented call in progress"""
+    usage = _call_usage.get()
+    if usage is None:
+        return
+    usage["prompt"] += prompt_tokens or 0
+    usage["completion"] += completion_tokens or 0
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """Estimate the cost in US dollars from the configured per-million-token prices of a model"""
+    prices = settings.ai_token_prices_usd_per_million.get(model)
+    if not prices:
+        return 0.0
+    return (prompt_tokens * prices[0] + completion_tokens * prices[1]) / 1_000_000
+
+
+class InstrumentedAIGenerator(AIGeneratorWrapper):
+    """
+    Records the latency, token usage, estimated cost and outcome of every call to the
+    wrapped generator, labelled with the provider, model, method and originating route,
+    and runs each call in a client span carrying the same details.
+    """
+
+    def __init__(self, inner: AIGeneratorInterface, provider: str):
+        super().__init__(inner)
+        self.provider = provider
+
+    def _start(self) -> contextvars.Token:
+        # Retries run in copies of this context, so they all add to the same usage
+        return _call_usage.set({"prompt": 0, "completion": 0})
+
+    def _span(self, method: str) -> Span:
+        return tracer.start_span(f"ai.{method}", kind=SpanKind.CLIENT, attributes={"ai.provider": self.provider, "ai.model": self.model or "unknown"})
+
+    def _record(self, method: str, started: float, token: contextvars.Token, error: Optional[Exception], span: Span,
+                cancelled: bool = False) -> None:
+        latency = time.perf_counter() - started
+        usage = _call_usage.get()
+        try:
+            _call_usage.reset(token)
+        except ValueError:
+            # A stream closed from another context; its context is discarded anyway
+            pass
+
+        model = self.model or "unknown"
+        route = get_current_route()
+        status = "cancelled" if cancelled else "ok" if error is None else "error"
+        cost = estimate_cost(model, usage["prompt"], usage["completion"])
+
+        AI_CALLS.inc(provider=self.provider, model=model, method=method, route=route, status=status)
+        AI_CALL_LATENCY.observe(latency, provider=self.provider, method=method, route=route)
+        for kind in ("prompt", "completion"):
+            if usage[kind]:
+                AI_TOKENS.inc(usage[kind], provider=self.provider, model=model, method=method, route=route, kind=kind)
+        if cost:
+            AI_COST.inc(cost, provider=self.provider, model=model, route=route)
+
+        span.set_attributes({"ai.status": status, "ai.prompt_tokens": usage["prompt"], "ai.completion_tokens": usage["completion"], "ai.cost_usd": cost})
+        if error is not None:
+            span.record_exception(error)
+            span.set_status(Status(StatusCode.ERROR))
+        span.end()
+
+        message = (f"AI call provider={self.provider} model={model} method={method} route=\"{route}\" status={status} "
+                   f"latency_ms={latency * 1000:.1f} prompt_tokens={usage['prompt']} completion_tokens={usage['completion']} cost_usd={cost:.6f}")
+        if error is None:
+            logger.info(message)
+        else:
+            logger.warning(f"{message} error={type(error).__name__}")
+
+    def _call(self, method: str, **kwargs) -> Any:
+        span = self._span(method)
+        started, token = time.perf_counter(), self._start()
+        # Anything that is neither a result nor an exception, such as an interrupt, ends the call as cancelled
+        error, cancelled = None, True
+        try:
+            with trace.use_span(span, end_on_exit=False, record_exception=False, set_status_on_exception=False):
+                result = super()._call(method, **kwargs)
+            cancelled = False
+            return result
+        except Exception as e:
+            error, cancelled = e, False
+            raise
+        finally:
+            self._record(method, started, token, error, span, cancelled)
+
+    async def _acall(self, method: str, **kwargs) -> Any:
+        span = self._span(method)
+        started, token = time.perf_counter(), self._start()
+        # A cancelled task raises CancelledError, which is not an Exception
+        error, cancelled = None, True
+        try:
+            with trace.use_span(span, end_on_exit=False, record_exception=False, set_status_on_exception=False):
+                result = await super()._acall(method, **kwargs)
+            cancelled = False
+            return result
+        except Exception as e:
+            error, cancelled = e, False
+            raise
+        finally:
+            self._record(method, started, token, error, span, cancelled)
+
+    async def astream_questions(
+        self,
+        title: str,
+        questions_types: List[str],
+        additional_note: str = None,
+        job_info: Dict[str, Any] = None
+    ) -> AsyncIterator[AssessmentQuestion]:
+        # Not made current, since a stream is resumed from whichever context reads it
+        span = self._span("astream_questions")
+        started, token = time.perf_counter(), self._start()
+        # A reader that stops early closes the stream with GeneratorExit, which is not an Exception
+        error, cancelled = None, True
+        try:
+            async for question in super().astream_questions(title=title, questions_types=questions_types,
+                                                            additional_note=additional_note, job_info=job_info):
+                yield question
+            cancelled = False
+        except Exception as e:
+            error, cancelled = e, False
+            raise
+        finally:
+            self._record("astream_questions", started, token, error, span, cancelled)
+
+def get_ai_call_stats() -> Dict[str, Any]:
+    """Get the AI call metrics, plus totals per originating route"""
+    routes: Dict[str, Dict[str, float]] = {}
+
+    def route_totals(route: str) -> Dict[str, float]:
+        return routes.setdefault(route, {"calls": 0, "errors": 0, "prompt_tokens": 0, "completion_tokens": 0, "cost_usd": 0.0})
+
+    for labels, value in ((dict(zip(AI_CALLS.labels, key)), value) for key, value in AI_CALLS.values().items()):
+        totals = route_totals(labels["route"])
+        totals["calls"] += value
+        if labels["status"] == "error":
+            totals["errors"] += value
+    for labels, value in ((dict(zip(AI_TOKENS.labels, key)), value) for key, value in AI_TOKENS.values().items()):
+        route_totals(labels["route"])[f"{labels['kind']}_tokens"] += value
+    for labels, value in ((dict(zip(AI_COST.labels, key)), value) for key, value in AI_COST.values().items()):
+        route_totals(labels["route"])["cost_usd"] += value
+
+    return {"routes": routes, "metrics": registry.snapshot(prefix="ai_")}
@@ -0,0 +1,75 @@
+import json
+from typing import Any, List
+
+
+class JSONArrayStreamParser:
+    """
+    Incremental parser for a JSON array of objects that arrives in chunks.
+
+    Text before the opening bracket (such as a markdown code fence) is skipped, and
+    each top-level object is returned by feed() as soon as its closing brace arrives.
+    """
+
+    def __init__(self):
+        self._buffer: List[str] = []
+        self._started = False
+        self._finished = False
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    @property
+    def finished(self) -> bool:
+        """Whether the closing bracket of the array has been read"""
+        return self._finished
+
+    def feed(self, text: str) -> List[Any]:
+        """
+        Consume the next chunk of the response.
+
+        Args:
+            text: The next piece of streamed text
+
+        Returns:
+            The objects completed by this chunk, in order
+
+        Raises:
+            ValueError: If a completed object is not valid JSON
+        """
+        items = []
+        for char in text:
+            if self._finished:
+                break
+            if not self._started:
+                self._started = char == '['
+                continue
+            if self._depth == 0:
+                # Between elements only the next object or the end of the array matters
+                if char == '{':
+                    self._buffer = [char]
+                    self._depth = 1
+                elif char == ']':
+                    self._finished = True
+                continue
+
+            self._buffer.append(char)
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == '\\':
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in '{[':
+                self._depth += 1
+            elif char in '}]':
+                self._depth -= 1
+                if self._depth == 0:
+                    try:
+                        items.append(json.loads(''.join(self._buffer)))
+                    except json.JSONDecodeError as e:
+                        raise ValueError(f"Invalid JSON object in stream: {str(e)}")
+                    self._buffer = []
+        return items
@@ -1,10 +1,15 @@
+import asyncio
 import json
 import os
-from typing import List, Dict, Any
+import re
+from typing import AsyncIterator, List, Dict, Any
+import httpx
 from mistralai import Mistral
 from schemas.assessment import AssessmentQuestion, AssessmentQuestionOption
 from schemas.enums import QuestionType
 from integrations.ai_integration.ai_generator_interface import AIGeneratorInterface
+from integrations.ai_integration.json_stream import JSONArrayStreamParser
+from integrations.ai_integration.instrumentation import record_token_usage
 from config import settings
 
 
@@ -18,11 +23,59 @@ class MistralGenerator(AIGeneratorInterface):
         Initialize the MistralGenerator with API key from settings.
         """
         api_key = os.getenv("MISTRAL_API_KEY") or getattr(settings, 'mistral_api_key', None)
+        self.model = settings.mistral_model
 
         if not api_key:
             raise ValueError("MISTRAL_API_KEY environment variable is not set")
 
-        self.client = Mistral(api_key=api_key)
+        # Share one pooled HTTP client per mode so concurrent calls reuse connections
+        limits = httpx.Limits(
+            max_connections=settings.ai_http_max_connections,
+            max_keepalive_connections=settings.ai_http_max_keepalive_connections,
+            keepalive_expiry=settings.ai_http_keepalive_expiry_seconds,
+        )
+        # Without a timeout a hung API call would hold its thread forever
+        timeout = httpx.Timeout(settings.ai_call_timeout_seconds, connect=10.0)
+        self._http_client = httpx.Client(follow_redirects=True, limits=limits, timeout=timeout)
+        self._async_http_client = httpx.AsyncClient(follow_redirects=True, limits=limits, timeout=timeout)
+        self.client = Mistral(
+            api_key=api_key,
+            client=self._http_client,
+            async_client=self._async_http_client,
+            timeout_ms=int(settings.ai_call_timeout_seconds * 1000),
+        )
+
+    def warm_up(self) -> None:
+        """
+        Open a pooled connection to the Mistral API so the first real call skips the TLS handshake.
+        """
+        self.client.models.list()
+
+    def close(self) -> None:
+        """
+        Close the pooled HTTP clients. The async client is closed on the running event loop
+        when there is one, since it cannot be awaited here; prefer aclose inside a loop.
+        """
+        self._http_client.close()
+        if self._async_http_client.is_closed:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is None:
+            asyncio.run(self._async_http_client.aclose())
+        else:
+            # Kept referenced so the task is not garbage collected before it runs
+            self._closing = loop.create_task(self._async_http_client.aclose())
+
+    async def aclose(self) -> None:
+        """
+        Close the pooled HTTP clients from inside the event loop.
+        """
+        self._http_client.close()
+        if not self._async_http_client.is_closed:
+            await self._async_http_client.aclose()
 
     def generate_questions(
         self,
@@ -34,38 +87,84 @@ class MistralGenerator(AIGeneratorInterface):
         """
         Generate questions using Mistral AI API based on the assessment title, job information, and specified question types.
         """
-        # Prepare the prompt for Mistral AI
-        prompt = self._create_prompt(title, questions_types, additional_note, job_info)
-
-        messages = [
-            {"role": "system", "content": "You generate technical assessment questions."},
-            {"role": "user", "content": prompt},
-        ]
+        messages = self._generation_messages(title, questions_types, additional_note, job_info)
 
         response = self.client.chat.complete(
-            model="mistral-small-latest",
+            model=self.model,
             messages=messages,
             temperature=0.2,
         )
+        self._record_usage(response)
 
-        content = response.choices[0].message.content
-        passed = 0
-        while passed < 5:
-            try:
-                try:
-                    # Parse the JSON response from Mistral
-                    questions_data = json.loads(content)
-                    passed = 10
-                except json.JSONDecodeError:
-                    content = content[7:-3].strip()
-                    questions_data = json.loads(content)
-                    passed = 10
-            except json.JSONDecodeError:
-                raise ValueError("Mistral returned invalid JSON")
+        questions_data = self._parse_json_content(
+            response.choices[0].message.content,
+            "Mistral returned invalid JSON"
+        )
 
         # Convert the response to AssessmentQuestion objects
         return self._convert_to_assessment_questions(questions_data)
 
+    async def agenerate_questions(
+        self,
+        title: str,
+        questions_types: List[str],
+        additional_note: str = None,
+        job_info: Dict[str, Any] = None
+    ) -> List[AssessmentQuestion]:
+        """
+        Generate questions without blocking the event loop.
+        """
+        messages = self._generation_messages(title, questions_types, additional_note, job_info)
+
+        response = await self.client.chat.complete_async(
+            model=self.model,
+            messages=messages,
+            temperature=0.2,
+        )
+        self._record_usage(response)
+
+        questions_data = self._parse_json_content(
+            response.choices[0].message.content,
+            "Mistral returned invalid JSON"
+        )
+
+        return self._convert_to_assessment_questions(questions_data)
+
+    async def astream_questions(
+        self,
+        title: str,
+        questions_types: List[str],
+        additional_note: str = None,
+        job_info: Dict[str, Any] = None
+    ) -> AsyncIterator[AssessmentQuestion]:
+        """
+        Stream the Mistral response and yield each question as soon as its JSON object is complete.
+        """
+        messages = self._generation_messages(title, questions_types, additional_note, job_info)
+
+        stream = await self.client.chat.stream_async(
+            model=self.model,
+            messages=messages,
+            temperature=0.2,
+        )
+
+        parser = JSONArrayStreamParser()
+        index = 0
+        async for event in stream:
+            # The last event carries the usage of the whole response
+            self._record_usage(event.data)
+            if not event.data.choices:
+                continue
+            content = event.data.choices[0].delta.content
+            if not isinstance(content, str):
+                continue
+            for q_data in parser.feed(content):
+                yield self._convert_to_assessment_question(index, q_data)
+                index += 1
+
+        if not parser.finished and index == 0:
+            raise ValueError("Mistral returned invalid JSON")
+
     def score_answer(
         self,
         question: AssessmentQuestion,
@@ -75,6 +174,72 @@ class MistralGenerator(AIGeneratorInterface):
         """
         Score an answer using Mistral AI API based on the question and the provided answer.
         """
+        messages = self._scoring_messages(question, answer_text, selected_options)
+
+        response = self.client.chat.complete(
+            model=self.model,
+            messages=messages,
+            temperature=0.2,
+        )
+        self._record_usage(response)
+
+        return self._parse_scoring_content(response.choices[0].message.content)
+
+    async def ascore_answer(
+        self,
+        question: AssessmentQuestion,
+        answer_text: str,
+        selected_options: List[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Score an answer without blocking the event loop.
+        """
+        messages = self._scoring_messages(question, answer_text, selected_options)
+
+        response = await self.client.chat.complete_async(
+            model=self.model,
+            messages=messages,
+            temperature=0.2,
+        )
+        self._record_usage(response)
+
+        return self._parse_scoring_content(response.choices[0].message.content)
+
+    def _record_usage(self, response: Any) -> None:
+        """
+        Report the token usage of a response to the AI call instrumentation.
+        """
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            record_token_usage(getattr(usage, "prompt_tokens", 0), getattr(usage, "completion_tokens", 0))
+
+    def _generation_messages(
+        self,
+        title: str,
+        questions_types: List[str],
+        additional_note: str = None,
+        job_info: Dict[str, Any] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Build the chat messages for question generation.
+        """
+        # Prepare the prompt for Mistral AI
+        prompt = self._create_prompt(title, questions_types, additional_note, job_info)
+
+        return [
+            {"role": "system", "content": "You generate technical assessment questions."},
+            {"role": "user", "content": prompt},
+        ]
+
+    def _scoring_messages(
+        self,
+        question: AssessmentQuestion,
+        answer_text: str,
+        selected_options: List[str] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Build the chat messages for answer scoring.
+        """
         # Create a prompt for scoring the answer
         if question.type == QuestionType.text_based:
             prompt = f"""
@@ -116,31 +281,16 @@ class MistralGenerator(AIGeneratorInterface):
             }}
             """
 
-        messages = [
+        return [
             {"role": "system", "content": "You are an expert at evaluating assessment answers."},
             {"role": "user", "content": prompt},
         ]
 
-        response = self.client.chat.complete(
-            model="mistral-small-latest",
-            messages=messages,
-            temperature=0.2,
-        )
-
-        content = response.choices[0].message.content
-        passed = 0
-        while passed < 5:
-            try:
-                try:
-                    result = json.loads(content)
-                    passed = 10  # Exit the loop successfully
-                except json.JSONDecodeError:
-                    # Try to strip markdown code block markers
-                    content = content[7:-3].strip()
-                    result = json.loads(content)
-                    passed = 10  # Exit the loop successfully
-            except json.JSONDecodeError:
-                raise ValueError("Mistral returned invalid JSON for answer scoring")
+    def _parse_scoring_content(self, content: str) -> Dict[str, Any]:
+        """
+        Parse a scoring response into the score dictionary returned by score_answer.
+        """
+        result = self._parse_json_content(content, "Mistral returned invalid JSON for answer scoring")
 
         return {
             'score': result.get('score', 0.0),
@@ -148,6 +298,21 @@ class MistralGenerator(AIGeneratorInterface):
             'correct': result.get('correct', False)
         }
 
+    def _parse_json_content(self, content: str, error_message: str) -> Any:
+        """
+        Parse JSON from a Mistral response, stripping markdown code block markers if present.
+        """
+        # Strip markdown code block markers such as ```json ... ```
+        fenced = re.match(r"^\s*```[a-zA-Z]*\s*(.*?)\s*```\s*$", content, re.DOTALL)
+        if fenced:
+            content = fenced.group(1)
+
+        # Retries happen around the whole call, so a malformed response asks the model again
+        try:
+            return json.loads(content)
+        except json.JSONDecodeError:
+            raise ValueError(error_message)
+
     def _create_prompt(
         self,
         title: str,
@@ -232,52 +397,51 @@ Return ONLY the JSON array.
         """
         Convert the JSON response from Mistral to AssessmentQuestion objects.
         """
-        assessment_questions = []
-
-        for i, q_data in enumerate(questions_data):
-            # Generate a unique ID for the question
-            question_id = f"mistral_{i}"
-
-            # Determine the question type based on the response
-            if q_data.get("type") == "MCQ":
-                # For multiple choice questions
-                question_type = QuestionType.choose_one  # Default to choose_one
-
-                # Create options
-                options = []
-                for choice in q_data.get("choices", []):
-                    option = AssessmentQuestionOption(text=choice, value=choice)
-                    options.append(option)
-
-                # Find the correct option
-                correct_options = []
-                correct_answer = q_data.get("correct_answer")
-                if correct_answer:
-                    # Find the option that matches the correct answer
-                    for opt in options:
-                        if opt.text == correct_answer:
-                            correct_options.append(opt.value)
-                            break
-            else:
-                # For text-based questions
-                question_type = QuestionType.text_based
-                options = []
-                correct_options = []
-
-            # Create the AssessmentQuestion object
-            question = AssessmentQuestion(
-                id=question_id,
-                text=q_data.get("prompt", ""),
-                weight=3,  # Default weight
-                skill_categories=[q_data.get("skill", "General")],  # Default to General if no skill specified
-                type=question_type,
-                options=options,
-                correct_options=correct_options
-            )
-
-            assessment_questions.append(question)
-
-        return assessment_questions
+        return [self._convert_to_assessment_question(i, q_data) for i, q_data in enumerate(questions_data)]
+
+    def _convert_to_assessment_question(self, index: int, q_data: Dict) -> AssessmentQuestion:
+        """
+        Convert one question object from the Mistral response to an AssessmentQuestion.
+        """
+        # Generate a unique ID for the question
+        question_id = f"mistral_{index}"
+
+        # Determine the question type based on the response
+        if q_data.get("type") == "MCQ":
+            # For multiple choice questions
+            question_type = QuestionType.choose_one  # Default to choose_one
+
+            # Create options
+            options = []
+            for choice in q_data.get("choices", []):
+                option = AssessmentQuestionOption(text=choice, value=choice)
+                options.append(option)
+
+            # Find the correct option
+            correct_options = []
+            correct_answer = q_data.get("correct_answer")
+            if correct_answer:
+                # Find the option that matches the correct answer
+                for opt in options:
+                    if opt.text == correct_answer:
+                        correct_options.append(opt.value)
+                        break
+        else:
+            # For text-based questions
+            question_type = QuestionType.text_based
+            options = []
+            correct_options = []
+
+        # Create the AssessmentQuestion object
+        return AssessmentQuestion(
+            id=question_id,
+            text=q_data.get("prompt", ""),
+            weight=3,  # Default weight
+            skill_categories=[q_data.get("skill", "General")],  # Default to General if no skill specified
+            type=question_type,
+            options=options,
+            correct_options=correct_options
+        )
 
     def estimate_duration(
         self,
@@ -292,16 +456,37 @@ Return ONLY the JSON array.
         Returns:
             String response from the AI containing the estimated duration
         """
-        messages = [
-            {"role": "system", "content": "You estimate assessment durations. Respond with only a number representing minutes."},
-            {"role": "user", "content": prompt},
-        ]
-
         response = self.client.chat.complete(
-            model="mistral-small-latest",
-            messages=messages,
+            model=self.model,
+            messages=self._duration_messages(prompt),
             temperature=0.2,
         )
+        self._record_usage(response)
 
         content = response.choices[0].message.content
         return content
+
+    async def aestimate_duration(
+        self,
+        prompt: str
+    ) -> str:
+        """
+        Estimate the duration for an assessment without blocking the event loop.
+        """
+        response = await self.client.chat.complete_async(
+            model=self.model,
+            messages=self._duration_messages(prompt),
+            temperature=0.2,
+        )
+        self._record_usage(response)
+
+        return response.choices[0].message.content
+
+    def _duration_messages(self, prompt: str) -> List[Dict[str, str]]:
+        """
+        Build the chat messages for duration estimation.
+        """
+        return [
+            {"role": "system", "content": "You estimate assessment durations. Respond with only a number representing minutes."},
+            {"role": "user", "content": prompt},
+        ]
@@ -61,6 +61,18 @@ class MockAIGenerator(AIGeneratorInterface):
         
         return generated_questions
 
+    async def agenerate_questions(
+        self,
+        title: str,
+        questions_types: List[str],
+        additional_note: str = None,
+        job_info: Dict[str, Any] = None
+    ) -> List[AssessmentQuestion]:
+        """
+        Async counterpart of generate_questions. The mock does no I/O, so it runs inline.
+        """
+        return self.generate_questions(title, questions_types, additional_note, job_info)
+
     def _generate_question_text(self, title: str, q_type: str, question_number: int, additional_note: str = None, job_info: Dict[str, Any] = None) -> str:
         """Generate a question text based on the assessment title, job info and question type."""
         # Normalize the title to lowercase for processing
@@ -343,6 +355,17 @@ class MockAIGenerator(AIGeneratorInterface):
             'correct': False
         }
 
+    async def ascore_answer(
+        self,
+        question: AssessmentQuestion,
+        answer_text: str,
+        selected_options: List[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Async counterpart of score_answer. The mock does no I/O, so it runs inline.
+        """
+        return self.score_answer(question, answer_text, selected_options)
+
     def _evaluate_text_answer(self, answer_text: str, question_text: str) -> float:
         """
         Evaluate a text-based answer (simulated AI evaluation).
@@ -403,4 +426,13 @@ class MockAIGenerator(AIGeneratorInterface):
         # Ensure it's within reasonable bounds
         estimated_minutes = min(180, max(5, estimated_minutes))
         
-        return f"{estimated_minutes} minutes"
\ No newline at end of file
+        return f"{estimated_minutes} minutes"
+
+    async def aestimate_duration(
+        self,
+        prompt: str
+    ) -> str:
+        """
+        Async counterpart of estimate_duration. The mock does no I/O, so it runs inline.
+        """
+        return self.estimate_duration(prompt)
\ No newline at end of file
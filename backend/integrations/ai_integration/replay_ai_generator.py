@@ -0,0 +1,262 @@
+import asyncio
+import hashlib
+import json
+import math
+import os
+import random
+import threading
+import time
+import uuid
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+from schemas.assessment import AssessmentQuestion
+from integrations.ai_integration.ai_generator_interface import AIGeneratorInterface
+from config import settings
+from logging_config import get_logger
+
+# Create logger for this module
+logger = get_logger(__name__)
+
+RECORD = "record"
+REPLAY = "replay"
+
+
+class ReplayInjectedError(RuntimeError):
+    """A provider failure injected by the replay provider"""
+
+    # Looks like a provider outage to the retry and scheduling layers
+    status_code = 503
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, AssessmentQuestion):
+        return value.model_dump(mode="json")
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    return value
+
+def _decode_response(method: str, response: Any) -> Any:
+    if method == "generate_questions":
+        return [AssessmentQuestion(**question) for question in response]
+    return response
+
+def request_key(method: str, request: Dict[str, Any]) -> str:
+    """Identify a request by its method and arguments"""
+    payload = json.dumps({"method": method, "request": request}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ReplayAIGenerator(AIGeneratorInterface):
+    """
+    Record/replay AI generator for load and performance testing.
+
+    In record mode, calls go to the provider set by ai_replay_record_provider and each
+    request, response and latency is appended to the recordings file. In replay mode,
+    recorded responses are returned without any network access, after a latency drawn
+    from the configured distribution, with errors and timeouts injected at the configured
+    rates. Everything random is seeded by the request and how often it was seen, so a
+    replayed run behaves the same every time.
+
+    Requests that were never recorded are answered from recordings of the same method;
+    generated questions are then picked from recorded questions of the requested types.
+    """
+
+    def __init__(self):
+        self.mode = settings.ai_replay_mode
+        self.path = settings.ai_replay_path
+        self._lock = threading.Lock()
+        self._seen: Dict[str, int] = defaultdict(int)
+        self._recordings: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._by_method: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._questions_by_type: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._inner: Optional[AIGeneratorInterface] = None
+
+        if self.mode == RECORD:
+            # Imported here to avoid a circular import with the factory that registers this class
+            from integrations.ai_integration.ai_factory import AIGeneratorFactory, AIProvider
+            self._inner = AIGeneratorFactory.create_generator(AIProvider(settings.ai_replay_record_provider))
+            self.model = self._inner.model
+        elif self.mode == REPLAY:
+            self._load()
+        else:
+            raise ValueError(f"Unknown AI replay mode: {self.mode}")
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            logger.warning(f"No AI recordings found at {self.path}; replayed calls will fail")
+            return
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    self._add(json.loads(line))
+        logger.info(f"Loaded {sum(len(r) for r in self._by_method.values())} AI recordings from {self.path}")
+
+    def _add(self, recording: Dict[str, Any]) -> None:
+        self.model = self.model or recording.get("model")
+        self._recordings[recording["key"]].append(recording)
+        self._by_method[recording["method"]].append(recording)
+        if recording["method"] == "generate_questions":
+            for question in recording["response"]:
+                self._questions_by_type[question["type"]].append(question)
+
+    def _save(self, method: str, request: Dict[str, Any], response: Any, latency: float) -> None:
+        recording = {
+            "key": request_key(method, request),
+            "method": method,
+            "model": self.model,
+            "request": request,
+            "response": _encode(response),
+            "latency_seconds": round(latency, 4)
+        }
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(recording) + "\n")
+            self._add(recording)
+
+    def _plan(self, method: str, request: Dict[str, Any]) -> Tuple[Any, float, Optional[str]]:
+        """Pick the response, latency and injected fault of a replayed call"""
+        key = request_key(method, request)
+        with self._lock:
+            occurrence = self._seen[key]
+            self._seen[key] += 1
+        rng = random.Random(f"{settings.ai_replay_seed}:{key}:{occurrence}")
+
+        recordings = self._recordings.get(key)
+        if recordings:
+            recording = recordings[occurrence % len(recordings)]
+            response = _decode_response(method, recording["response"])
+        else:
+            candidates = self._by_method.get(method)
+            if not candidates:
+                raise LookupError(f"No recorded {method} responses in {self.path}")
+            recording = rng.choice(candidates)
+            response = self._fallback_response(method, request, recording, rng)
+
+        fault = None
+        draw = rng.random()
+        if draw < settings.ai_replay_timeout_rate:
+            fault = "timeout"
+        elif draw < settings.ai_replay_timeout_rate + settings.ai_replay_error_rate:
+            fault = "error"
+        return response, self._latency(recording, rng), fault
+
+    def _fallback_response(self, method: str, request: Dict[str, Any], recording: Dict[str, Any], rng: random.Random) -> Any:
+        if method != "generate_questions":
+            return _decode_response(method, recording["response"])
+        questions = []
+        for question_type in request["questions_types"]:
+            pool = self._questions_by_type.get(question_type)
+            if not pool:
+                raise LookupError(f"No recorded {question_type} questions in {self.path}")
+            questions.append(AssessmentQuestion(**{**rng.choice(pool), "id": str(uuid.uuid4())}))
+        return questions
+
+    def _latency(self, recording: Dict[str, Any], rng: random.Random) -> float:
+        distribution = settings.ai_replay_latency
+        if distribution == "none":
+            return 0.0
+        if distribution == "recorded" and recording.get("latency_seconds") is not None:
+            return recording["latency_seconds"] * settings.ai_replay_latency_scale
+        # Log-normal, the usual shape of LLM response times: most calls near the median, a long slow tail
+        median = settings.ai_replay_latency_median_seconds
+        return rng.lognormvariate(math.log(median), settings.ai_replay_latency_sigma) * settings.ai_replay_latency_scale
+
+    def _fault(self, fault: Optional[str], method: str) -> None:
+        if fault == "timeout":
+            raise TimeoutError(f"Injected timeout in replayed {method}")
+        if fault == "error":
+            raise ReplayInjectedError(f"Injected error in replayed {method}")
+
+    def _call(self, method: str, **request) -> Any:
+        if self.mode == RECORD:
+            started = time.perf_counter()
+            response = getattr(self._inner, method)(**request)
+            self._save(method, {name: _encode(value) for name, value in request.items()}, response, time.perf_counter() - started)
+            return response
+
+        response, latency, fault = self._plan(method, {name: _encode(value) for name, value in request.items()})
+        # An injected timeout hangs for the whole per-attempt timeout before failing
+        time.sleep(settings.ai_call_timeout_seconds if fault == "timeout" else latency)
+        self._fault(fault, method)
+        return response
+
+    async def _acall(self, method: str, **request) -> Any:
+        if self.mode == RECORD:
+            started = time.perf_counter()
+            response = await getattr(self._inner, f"a{method}")(**request)
+            self._save(method, {name: _encode(value) for name, value in request.items()}, response, time.perf_counter() - started)
+            return response
+
+        response, latency, fault = self._plan(method, {name: _encode(value) for name, value in request.items()})
+        await asyncio.sleep(settings.ai_call_timeout_seconds if fault == "timeout" else latency)
+        self._fault(fault, method)
+        return response
+
+    def generate_questions(
+        self,
+        title: str,
+        questions_types: List[str],
+        additional_note: str = None,
+        job_info: Dict[str, Any] = None
+    ) -> List[AssessmentQuestion]:
+        """
+        Generate questions by recording or replaying a provider's response.
+        """
+        return self._call("generate_questions", title=title, questions_types=[getattr(qt, "value", qt) for qt in questions_types],
+                          additional_note=additional_note, job_info=job_info)
+
+    def score_answer(
+        self,
+        question: AssessmentQuestion,
+        answer_text: str,
+        selected_options: List[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Score an answer by recording or replaying a provider's response.
+        """
+        return self._call("score_answer", question=question, answer_text=answer_text, selected_options=selected_options)
+
+    def estimate_duration(
+        self,
+        prompt: str
+    ) -> str:
+        """
+        Estimate a duration by recording or replaying a provider's response.
+        """
+        return self._call("estimate_duration", prompt=prompt)
+
+    async def agenerate_questions(
+        self,
+        title: str,
+        questions_types: List[str],
+        additional_note: str = None,
+        job_info: Dict[str, Any] = None
+    ) -> List[AssessmentQuestion]:
+        return await self._acall("generate_questions", title=title, questions_types=[getattr(qt, "value", qt) for qt in questions_types],
+                                 additional_note=additional_note, job_info=job_info)
+
+    async def ascore_answer(
+        self,
+        question: AssessmentQuestion,
+        answer_text: str,
+        selected_options: List[str] = None
+    ) -> Dict[str, Any]:
+        return await self._acall("score_answer", question=question, answer_text=answer_text, selected_options=selected_options)
+
+    async def aestimate_duration(
+        self,
+        prompt: str
+    ) -> str:
+        return await self._acall("estimate_duration", prompt=prompt)
+
+    def warm_up(self) -> None:
+        if self._inner is not None:
+            self._inner.warm_up()
+
+    def close(self) -> None:
+        if self._inner is not None:
+            self._inner.close()
+
+    async def aclose(self) -> None:
+        if self._inner is not None:
+            await self._inner.aclose()
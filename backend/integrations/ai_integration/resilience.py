@@ -0,0 +1,386 @@
+import asyncio
+import contextvars
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import AsyncIterator, Any, Callable, Dict, List, Optional
+from schemas.assessment import AssessmentQuestion
+from integrations.ai_integration.ai_generator_interface import AIGeneratorInterface
+from integrations.ai_integration.ai_generator_wrapper import AIGeneratorWrapper
+from integrations.ai_integration.scheduling import AICallScheduler, AIQueueTimeoutError, get_call_priority
+from config import settings
+from logging_config import get_logger
+
+# Create logger for this module
+logger = get_logger(__name__)
+
+# Errors that no retry can fix, such as a provider without an implementation
+NON_RETRYABLE_ERRORS = (NotImplementedError,)
+
+
+class AICallTimeoutError(TimeoutError):
+    """Raised when an AI call does not finish within its deadline"""
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a provider whose circuit breaker is open"""
+
+
+class CircuitBreaker:
+    """
+    Stops calls to a provider after repeated failures.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and calls fail at
+    once. After ``reset_seconds`` one trial call is let through; its success closes the
+    circuit again and its failure reopens it.
+    """
+
+    def __init__(self, name: str, failure_threshold: int, reset_seconds: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """closed, open or half_open"""
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at >= self.reset_seconds:
+                return "half_open"
+            return "open"
+
+    def before_call(self) -> bool:
+        """
+        Raise CircuitOpenError unless a call may go ahead.
+
+        Returns:
+            Whether the call is the half-open trial, which ends with record_success,
+            record_failure, or release_trial when it is cancelled without an outcome
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return False
+            if time.monotonic() - self._opened_at >= self.reset_seconds and not self._trial_running:
+                self._trial_running = True
+                return True
+        raise CircuitOpenError(f"Circuit breaker for AI provider {self.name} is open")
+
+    def release_trial(self) -> None:
+        """Give up a cancelled trial call, so the next call becomes the trial"""
+        with self._lock:
+            self._trial_running = False
+
+    def reset(self) -> None:
+        """Close the circuit and forget past failures"""
+        self.record_success()
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info(f"Circuit breaker for AI provider {self.name} closed")
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_running or (self._opened_at is None and self._failures >= self.failure_threshold):
+                logger.warning(f"Circuit breaker for AI provider {self.name} opened after {self._failures} failures")
+                self._opened_at = time.monotonic()
+            self._trial_running = False
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """Get the circuit breaker of a provider, creating it on first use"""
+    with _breakers_lock:
+        if name not in _breakers:
+            _breakers[name] = CircuitBreaker(name, settings.ai_circuit_failure_threshold, settings.ai_circuit_reset_seconds)
+        return _breakers[name]
+
+def reset_circuit_breakers() -> None:
+    """Close every provider's circuit breaker"""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    for breaker in breakers:
+        breaker.reset()
+
+def get_circuit_breaker_states() -> Dict[str, str]:
+    """Get the state of every provider's circuit breaker"""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.name: breaker.state for breaker in breakers}
+
+
+# Blocking calls run here so the caller can stop waiting at the deadline
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Create the AI call workers on first use"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=settings.ai_call_threads, thread_name_prefix="ai-call")
+        return _executor
+
+
+class ResilientAIGenerator(AIGeneratorWrapper):
+    """
+    Wraps a generator with per-call deadlines, jittered retries, a circuit breaker
+    and an optional fallback generator.
+
+    Each attempt is limited to ``ai_call_timeout_seconds`` and all attempts together to
+    ``ai_call_deadline_seconds``. With ``ai_hedge_after_seconds`` set, an attempt that is
+    still running after that long is raced against a second identical request.
+
+    With a scheduler, every request to the provider, including retries and hedges, takes
+    its own slot and reports its own rate limiting. Time spent queued for a slot is added
+    to the deadlines rather than counted against them.
+    """
+
+    def __init__(self, inner: AIGeneratorInterface, breaker: CircuitBreaker,
+                 fallback: Optional[Callable[[], AIGeneratorInterface]] = None,
+                 scheduler: Optional[AICallScheduler] = None):
+        super().__init__(inner)
+        self.breaker = breaker
+        self.fallback = fallback
+        self.scheduler = scheduler
+
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff before the next attempt"""
+        return random.uniform(0, min(settings.ai_retry_max_backoff_seconds, settings.ai_retry_backoff_seconds * 2 ** attempt))
+
+    def _wait_for_slot(self, priority: str) -> float:
+        """Wait until the scheduler lets a request start and return the seconds spent queued"""
+        if self.scheduler is None:
+            return 0.0
+        started = time.monotonic()
+        self.scheduler.acquire(priority, settings.ai_queue_timeout_seconds)
+        return time.monotonic() - started
+
+    async def _await_slot(self, priority: str) -> float:
+        """Async counterpart of _wait_for_slot"""
+        if self.scheduler is None:
+            return 0.0
+        started = time.monotonic()
+        await self.scheduler.aacquire(priority, settings.ai_queue_timeout_seconds)
+        return time.monotonic() - started
+
+    def _try_slot(self, priority: str) -> bool:
+        """Take a slot for a hedged request if one is free right away"""
+        return self.scheduler is None or self.scheduler.try_acquire(priority)
+
+    def _free_slot_when_done(self, future, priority: str) -> None:
+        """Free the request's slot once it ends, even if the attempt stopped waiting for it"""
+        if self.scheduler is not None:
+            future.add_done_callback(lambda f: self.scheduler.finish(priority, None if f.cancelled() else f.exception()))
+
+    def _call(self, method: str, **kwargs) -> Any:
+        try:
+            return self._call_with_retries(method, kwargs)
+        except NON_RETRYABLE_ERRORS:
+            raise
+        except Exception as e:
+            if self.fallback is None:
+                raise
+            logger.warning(f"AI provider {self.breaker.name} failed on {method}, using fallback: {str(e)}")
+            return getattr(self.fallback(), method)(**kwargs)
+
+    def _call_with_retries(self, method: str, kwargs: Dict[str, Any]) -> Any:
+        deadline = time.monotonic() + settings.ai_call_deadline_seconds
+        priority = get_call_priority()
+        for attempt in range(settings.ai_max_retries + 1):
+            trial = self.breaker.before_call()
+            try:
+                deadline += self._wait_for_slot(priority)
+                result = self._attempt(method, kwargs, priority, min(deadline, time.monotonic() + settings.ai_call_timeout_seconds))
+            except NON_RETRYABLE_ERRORS:
+                self.breaker.record_success()
+                raise
+            except AIQueueTimeoutError:
+                # Local congestion says nothing about the provider, so it is neither a failure nor retried
+                if trial:
+                    self.breaker.release_trial()
+                raise
+            except Exception as e:
+                self.breaker.record_failure()
+                delay = self._backoff(attempt)
+                if attempt == settings.ai_max_retries or time.monotonic() + delay >= deadline:
+                    raise
+                logger.warning(f"AI provider {self.breaker.name} failed on {method} (attempt {attempt + 1}), retrying in {delay:.2f}s: {str(e)}")
+                time.sleep(delay)
+                continue
+            except BaseException:
+                # Cancelled or interrupted without an outcome; a trial left running would keep the circuit open
+                if trial:
+                    self.breaker.release_trial()
+                raise
+            self.breaker.record_success()
+            return result
+
+    def _submit(self, call: Callable, kwargs: Dict[str, Any], priority: str) -> Future:
+        # Requests run in a copy of the caller's context so context such as the call priority carries over
+        future = _get_executor().submit(contextvars.copy_context().run, call, **kwargs)
+        self._free_slot_when_done(future, priority)
+        return future
+
+    def _attempt(self, method: str, kwargs: Dict[str, Any], priority: str, attempt_deadline: float) -> Any:
+        """Run one attempt, hedged if configured, and return the first successful result"""
+        call = getattr(self.inner, method)
+        futures: List[Future] = [self._submit(call, kwargs, priority)]
+
+        hedge_after = settings.ai_hedge_after_seconds
+        if hedge_after is not None and time.monotonic() + hedge_after < attempt_deadline:
+            done, _ = wait(futures, timeout=hedge_after)
+            if not done and self._try_slot(priority):
+                logger.info(f"Hedging slow {method} call to AI provider {self.breaker.name}")
+                futures.append(self._submit(call, kwargs, priority))
+
+        pending = set(futures)
+        error = None
+        while pending:
+            done, pending = wait(pending, timeout=max(0.0, attempt_deadline - time.monotonic()), return_when=FIRST_COMPLETED)
+            if not done:
+                raise AICallTimeoutError(f"AI provider {self.breaker.name} did not answer {method} in time")
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    async def _acall(self, method: str, **kwargs) -> Any:
+        try:
+            return await self._acall_with_retries(method, kwargs)
+        except NON_RETRYABLE_ERRORS:
+            raise
+        except Exception as e:
+            if self.fallback is None:
+                raise
+            logger.warning(f"AI provider {self.breaker.name} failed on {method}, using fallback: {str(e)}")
+            return await getattr(self.fallback(), method)(**kwargs)
+
+    async def _acall_with_retries(self, method: str, kwargs: Dict[str, Any]) -> Any:
+        deadline = time.monotonic() + settings.ai_call_deadline_seconds
+        priority = get_call_priority()
+        for attempt in range(settings.ai_max_retries + 1):
+            trial = self.breaker.before_call()
+            try:
+                deadline += await self._await_slot(priority)
+                result = await self._aattempt(method, kwargs, priority, min(deadline, time.monotonic() + settings.ai_call_timeout_seconds))
+            except NON_RETRYABLE_ERRORS:
+                self.breaker.record_success()
+                raise
+            except AIQueueTimeoutError:
+                # Local congestion says nothing about the provider, so it is neither a failure nor retried
+                if trial:
+                    self.breaker.release_trial()
+                raise
+            except Exception as e:
+                self.breaker.record_failure()
+                delay = self._backoff(attempt)
+                if attempt == settings.ai_max_retries or time.monotonic() + delay >= deadline:
+                    raise
+                logger.warning(f"AI provider {self.breaker.name} failed on {method} (attempt {attempt + 1}), retrying in {delay:.2f}s: {str(e)}")
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                # Cancelled or interrupted without an outcome; a trial left running would keep the circuit open
+                if trial:
+                    self.breaker.release_trial()
+                raise
+            self.breaker.record_success()
+            return result
+
+    def _start_task(self, call: Callable, kwargs: Dict[str, Any], priority: str) -> asyncio.Future:
+        task = asyncio.ensure_future(call(**kwargs))
+        self._free_slot_when_done(task, priority)
+        return task
+
+    async def _aattempt(self, method: str, kwargs: Dict[str, Any], priority: str, attempt_deadline: float) -> Any:
+        """Async counterpart of _attempt; losing requests are cancelled"""
+        call = getattr(self.inner, method)
+        tasks = [self._start_task(call, kwargs, priority)]
+        try:
+            hedge_after = settings.ai_hedge_after_seconds
+            if hedge_after is not None and time.monotonic() + hedge_after < attempt_deadline:
+                done, _ = await asyncio.wait(tasks, timeout=hedge_after)
+                if not done and self._try_slot(priority):
+                    logger.info(f"Hedging slow {method} call to AI provider {self.breaker.name}")
+                    tasks.append(self._start_task(call, kwargs, priority))
+
+            pending = set(tasks)
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, timeout=max(0.0, attempt_deadline - time.monotonic()), return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    raise AICallTimeoutError(f"AI provider {self.breaker.name} did not answer {method} in time")
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def astream_questions(
+        self,
+        title: str,
+        questions_types: List[str],
+        additional_note: str = None,
+        job_info: Dict[str, Any] = None
+    ) -> AsyncIterator[AssessmentQuestion]:
+        """
+        Stream from the wrapped generator behind the circuit breaker. A stream cannot be
+        retried once questions were yielded, so only a failure before the first question
+        falls back to the fallback generator.
+        """
+        kwargs = dict(title=title, questions_types=questions_types, additional_note=additional_note, job_info=job_info)
+        priority = get_call_priority()
+        yielded, trial, slot = 0, False, False
+        try:
+            trial = self.breaker.before_call()
+            await self._await_slot(priority)
+            slot = self.scheduler is not None
+            async for question in self.inner.astream_questions(**kwargs):
+                yielded += 1
+                yield question
+        except NON_RETRYABLE_ERRORS:
+            self.breaker.record_success()
+            raise
+        except AIQueueTimeoutError:
+            if trial:
+                self.breaker.release_trial()
+            raise
+        except Exception as e:
+            if slot:
+                # The provider's slot is given back before the fallback streams
+                self.scheduler.finish(priority, e)
+                slot = False
+            if not isinstance(e, CircuitOpenError):
+                self.breaker.record_failure()
+            if self.fallback is None or yielded:
+                raise
+            logger.warning(f"AI provider {self.breaker.name} failed to stream questions, using fallback: {str(e)}")
+            async for question in self.fallback().astream_questions(**kwargs):
+                yield question
+            return
+        except BaseException:
+            # Closed early by its reader or cancelled; a trial left running would keep the circuit open
+            if trial:
+                self.breaker.release_trial()
+            raise
+        finally:
+            if slot:
+                self.scheduler.release(priority)
+        self.breaker.record_success()
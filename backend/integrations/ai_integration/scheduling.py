@@ -0,0 +1,316 @@
+import asyncio
+import contextvars
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Set, Tuple
+from schemas.assessment import AssessmentQuestion
+from integrations.ai_integration.ai_generator_interface import AIGeneratorInterface
+from integrations.ai_integration.ai_generator_wrapper import AIGeneratorWrapper
+from config import settings
+from logging_config import get_logger
+
+# Create logger for this module
+logger = get_logger(__name__)
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+PRIORITIES = (INTERACTIVE, BULK)
+
+# Priority of the AI calls made in the current context; background jobs switch to BULK
+_call_priority: contextvars.ContextVar[str] = contextvars.ContextVar("ai_call_priority", default=INTERACTIVE)
+
+
+@contextmanager
+def call_priority(priority: str) -> Iterator[None]:
+    """Make the AI calls inside the block with the given priority"""
+    token = _call_priority.set(priority)
+    try:
+        yield
+    finally:
+        _call_priority.reset(token)
+
+def get_call_priority() -> str:
+    """Get the priority of AI calls made in the current context"""
+    return _call_priority.get()
+
+
+class AIQueueTimeoutError(TimeoutError):
+    """Raised when an AI call waits too long for the scheduler to let it start"""
+
+
+def _is_throttled(error: Exception) -> bool:
+    """Whether a provider error means the request was rate limited"""
+    status_code = getattr(error, "status_code", None) or getattr(getattr(error, "response", None), "status_code", None)
+    return status_code == 429
+
+
+class AICallScheduler:
+    """
+    Decides when calls to one provider may start.
+
+    A token bucket keeps the request rate within the provider quota, and a concurrency
+    limit that halves on every rate-limited response (and grows back by one after a
+    limit's worth of successes) keeps requests in flight below what the provider accepts.
+    Interactive calls always go first: bulk calls wait while any interactive call is
+    queued and never take more than their share of the concurrency limit.
+    """
+
+    def __init__(self, name: str, rate_per_second: Optional[float], burst: int, max_concurrency: int, bulk_share: float):
+        self.name = name
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.bulk_share = bulk_share
+        self._limit = max_concurrency
+        self._successes = 0
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        self._in_flight = {priority: 0 for priority in PRIORITIES}
+        self._waiting = {priority: 0 for priority in PRIORITIES}
+        self._stats = {
+            priority: {"started": 0, "throttled": 0, "timed_out": 0, "wait_ms_total": 0.0, "wait_ms_max": 0.0}
+            for priority in PRIORITIES
+        }
+        self._condition = threading.Condition()
+        # Calls waiting in aacquire, woken through their event loop
+        self._async_waiters: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+
+    def _refill(self, now: float) -> None:
+        if self.rate_per_second:
+            self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate_per_second)
+        self._refilled_at = now
+
+    def _token_wait(self) -> float:
+        """Seconds until the bucket holds a token; must be called with the lock held"""
+        if not self.rate_per_second or self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self.rate_per_second
+
+    def _has_slot(self, priority: str) -> bool:
+        """Whether the concurrency limit lets a call of this priority start; must be called with the lock held"""
+        if sum(self._in_flight.values()) >= self._limit:
+            return False
+        if priority == BULK:
+            if self._waiting[INTERACTIVE]:
+                return False
+            return self._in_flight[BULK] < max(1, math.floor(self._limit * self.bulk_share))
+        return True
+
+    def _try_start(self, priority: str) -> bool:
+        """Start a call of this priority if it may; must be called with the lock held"""
+        self._refill(time.monotonic())
+        if not self._has_slot(priority) or self._token_wait() > 0:
+            return False
+        if self.rate_per_second:
+            self._tokens -= 1
+        self._in_flight[priority] += 1
+        return True
+
+    def _retry_after(self, priority: str) -> Optional[float]:
+        """Seconds until the next token, or None if only a release lets the call start; must be called with the lock held"""
+        return self._token_wait() if self._has_slot(priority) else None
+
+    def _notify_waiters(self) -> None:
+        """Wake the calls waiting in threads and on event loops; must be called with the lock held"""
+        self._condition.notify_all()
+        for loop, woken in list(self._async_waiters):
+            try:
+                loop.call_soon_threadsafe(woken.set)
+            except RuntimeError:
+                # The waiter's event loop was closed
+                self._async_waiters.discard((loop, woken))
+
+    def _timed_out(self, priority: str, timeout: float) -> AIQueueTimeoutError:
+        self._stats[priority]["timed_out"] += 1
+        return AIQueueTimeoutError(f"AI call to {self.name} waited more than {timeout:.1f}s to start")
+
+    def _record_start(self, priority: str, started: float) -> None:
+        waited_ms = (time.monotonic() - started) * 1000
+        with self._condition:
+            stats = self._stats[priority]
+            stats["started"] += 1
+            stats["wait_ms_total"] += waited_ms
+            stats["wait_ms_max"] = max(stats["wait_ms_max"], waited_ms)
+
+    def acquire(self, priority: str, timeout: float) -> None:
+        """
+        Wait until a call of the given priority may start.
+
+        Raises:
+            AIQueueTimeoutError: If the call could not start within the timeout
+        """
+        started = time.monotonic()
+        deadline = started + timeout
+        with self._condition:
+            self._waiting[priority] += 1
+            try:
+                while not self._try_start(priority):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise self._timed_out(priority, timeout)
+                    wait = self._retry_after(priority)
+                    self._condition.wait(min(remaining, wait) if wait else remaining)
+            finally:
+                self._waiting[priority] -= 1
+                # Bulk calls may have been held back only by this waiting interactive call
+                self._notify_waiters()
+        self._record_start(priority, started)
+
+    async def aacquire(self, priority: str, timeout: float) -> None:
+        """Async counterpart of acquire, which waits on the event loop without holding a thread"""
+        started = time.monotonic()
+        deadline = started + timeout
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        woken = waiter[1]
+        with self._condition:
+            self._waiting[priority] += 1
+            self._async_waiters.add(waiter)
+        try:
+            while True:
+                with self._condition:
+                    if self._try_start(priority):
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise self._timed_out(priority, timeout)
+                    wait = self._retry_after(priority)
+                    # Cleared with the lock held, so a release after this point still wakes the call
+                    woken.clear()
+                try:
+                    await asyncio.wait_for(woken.wait(), min(remaining, wait) if wait else remaining)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            with self._condition:
+                self._waiting[priority] -= 1
+                self._async_waiters.discard(waiter)
+                self._notify_waiters()
+        self._record_start(priority, started)
+
+    def try_acquire(self, priority: str) -> bool:
+        """Start a call of the given priority only if it may start right away"""
+        started = time.monotonic()
+        with self._condition:
+            if not self._try_start(priority):
+                return False
+        self._record_start(priority, started)
+        return True
+
+    def finish(self, priority: str, error: Optional[BaseException] = None) -> None:
+        """Release a call's slot, treating a rate-limited error as throttling"""
+        self.release(priority, error is not None and _is_throttled(error))
+
+    def release(self, priority: str, throttled: bool = False) -> None:
+        """Record the end of a call and adapt the concurrency limit to its outcome"""
+        with self._condition:
+            self._in_flight[priority] -= 1
+            if throttled:
+                self._stats[priority]["throttled"] += 1
+                self._limit = max(1, self._limit // 2)
+                self._successes = 0
+                logger.warning(f"AI provider {self.name} rate limited a request, concurrency limit lowered to {self._limit}")
+            else:
+                self._successes += 1
+                if self._successes >= self._limit and self._limit < self.max_concurrency:
+                    self._limit += 1
+                    self._successes = 0
+            self._notify_waiters()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the concurrency limit, queue depths and wait times"""
+        with self._condition:
+            stats: Dict[str, Any] = {"concurrency_limit": self._limit, "max_concurrency": self.max_concurrency}
+            for priority in PRIORITIES:
+                counters = self._stats[priority]
+                stats[priority] = {
+                    "queued": self._waiting[priority],
+                    "in_flight": self._in_flight[priority],
+                    "started": counters["started"],
+                    "throttled": counters["throttled"],
+                    "timed_out": counters["timed_out"],
+                    "wait_ms_avg": round(counters["wait_ms_total"] / counters["started"], 3) if counters["started"] else 0.0,
+                    "wait_ms_max": round(counters["wait_ms_max"], 3)
+                }
+            return stats
+
+
+_schedulers: Dict[str, AICallScheduler] = {}
+_schedulers_lock = threading.Lock()
+
+def get_scheduler(name: str) -> AICallScheduler:
+    """Get the scheduler of a provider, creating it on first use"""
+    with _schedulers_lock:
+        if name not in _schedulers:
+            _schedulers[name] = AICallScheduler(
+                name,
+                rate_per_second=settings.ai_rate_limit_per_second,
+                burst=settings.ai_rate_limit_burst,
+                max_concurrency=settings.ai_max_concurrency,
+                bulk_share=settings.ai_bulk_concurrency_share
+            )
+        return _schedulers[name]
+
+def get_scheduler_stats() -> Dict[str, Dict[str, Any]]:
+    """Get the stats of every provider's scheduler"""
+    with _schedulers_lock:
+        schedulers = list(_schedulers.values())
+    return {scheduler.name: scheduler.get_stats() for scheduler in schedulers}
+
+
+class ScheduledAIGenerator(AIGeneratorWrapper):
+    """
+    Runs every call to the wrapped generator through a provider's AICallScheduler.
+
+    Used when resilience is disabled; otherwise ResilientAIGenerator schedules each request
+    itself, so that time spent queued never counts against an attempt's deadline.
+    """
+
+    def __init__(self, inner: AIGeneratorInterface, scheduler: AICallScheduler):
+        super().__init__(inner)
+        self.scheduler = scheduler
+
+    def _call(self, method: str, **kwargs) -> Any:
+        priority = get_call_priority()
+        self.scheduler.acquire(priority, settings.ai_queue_timeout_seconds)
+        throttled = False
+        try:
+            return super()._call(method, **kwargs)
+        except Exception as e:
+            throttled = _is_throttled(e)
+            raise
+        finally:
+            self.scheduler.release(priority, throttled)
+
+    async def _acall(self, method: str, **kwargs) -> Any:
+        priority = get_call_priority()
+        await self.scheduler.aacquire(priority, settings.ai_queue_timeout_seconds)
+        throttled = False
+        try:
+            return await super()._acall(method, **kwargs)
+        except Exception as e:
+            throttled = _is_throttled(e)
+            raise
+        finally:
+            self.scheduler.release(priority, throttled)
+
+    async def astream_questions(
+        self,
+        title: str,
+        questions_types: List[str],
+        additional_note: str = None,
+        job_info: Dict[str, Any] = None
+    ) -> AsyncIterator[AssessmentQuestion]:
+        priority = get_call_priority()
+        await self.scheduler.aacquire(priority, settings.ai_queue_timeout_seconds)
+        throttled = False
+        try:
+            async for question in super().astream_questions(title=title, questions_types=questions_types,
+                                                            additional_note=additional_note, job_info=job_info):
+                yield question
+        except Exception as e:
+            throttled = _is_throttled(e)
+            raise
+        finally:
+            self.scheduler.release(priority, throttled)
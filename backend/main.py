@@ -1,3 +1,8 @@
+import time
+
+# Taken before any other import so the startup budget covers module loading
+_startup_started = time.perf_counter()
+
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, APIRouter
 from fastapi.middleware.cors import CORSMiddleware
@@ -5,28 +10,56 @@ import os
 
 # Import from our modules
 from models import Base
-from database.database import engine
-from api.routes import router as root_router
+from database.database import engine, SessionLocal
+from api.routes import router as root_router, metrics_router
 from api.user_routes import router as user_router
 from api.job_routes import router as job_router
 from api.assessment_routes import router as assessment_router
 from api.application_routes import router as application_router
 from config import settings
 from logging_config import get_logger
+from integrations.ai_integration.ai_factory import AIGeneratorFactory, DEFAULT_PROVIDER
+from services.pregeneration_service import shutdown_pregeneration
+from services.assessment_operation_service import fail_expired_operations, shutdown_operation_workers
+from utils.request_context import RequestContextMiddleware
+from utils.http_metrics import HTTPMetricsMiddleware
+from utils.tracing import TracingMiddleware, configure_tracing, shutdown_tracing
 
 # Create logger for this module
 logger = get_logger(__name__)
 
+def check_startup_budget():
+    """Warn when startup exceeded its time budget or loaded providers that are not configured"""
+    startup_ms = (time.perf_counter() - _startup_started) * 1000
+    if startup_ms > settings.startup_time_budget_ms:
+        logger.warning(f"Startup took {startup_ms:.0f} ms, over the budget of {settings.startup_time_budget_ms} ms")
+    else:
+        logger.info(f"Startup took {startup_ms:.0f} ms (budget: {settings.startup_time_budget_ms} ms)")
+
+    unexpected_providers = [p.value for p in AIGeneratorFactory.get_loaded_providers() if p != DEFAULT_PROVIDER]
+    if unexpected_providers:
+        logger.warning(f"AI providers loaded at startup besides {DEFAULT_PROVIDER.value}: {unexpected_providers}")
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Handle startup and shutdown events"""
     # Startup
     logger.info(f"Starting {settings.app_name} v{settings.app_version}")
     logger.info(f"Database URL: {settings.database_url}")
+    configure_tracing()
+    if settings.ai_warm_up_on_startup:
+        AIGeneratorFactory.warm_up([DEFAULT_PROVIDER])
+    with SessionLocal() as db:
+        fail_expired_operations(db)
+    check_startup_budget()
     logger.info("Application started successfully")
     yield
     # Shutdown
     logger.info("Application shutting down")
+    shutdown_pregeneration()
+    shutdown_operation_workers()
+    await AIGeneratorFactory.aclose_all()
+    shutdown_tracing()
 
 # Initialize FastAPI app with settings
 app = FastAPI(
@@ -47,6 +80,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Lets AI call metrics name the route that originated each call
+app.add_middleware(RequestContextMiddleware)
+# Records request counts, latency, response size and SQL statements per route for /metrics
+app.add_middleware(HTTPMetricsMiddleware)
+# Outermost, so the request span covers the other middleware too
+app.add_middleware(TracingMiddleware)
+
 api_router = APIRouter(prefix="/api")
 # Include API routes
 api_router.include_router(root_router)
@@ -56,6 +96,7 @@ api_router.include_router(assessment_router)
 api_router.include_router(application_router)
 
 app.include_router(api_router)
+app.include_router(metrics_router)
 
 logger.info("Application routes registered")
 
@@ -3,5 +3,9 @@ from .user import User
 from .job import Job
 from .assessment import Assessment
 from .application import Application
+from .ai_cache import AICacheEntry
+from .question import Question
+from .question_tag import QuestionTag
+from .assessment_operation import AssessmentOperation
 
-__all__ = ["Base", "User", "Job", "Assessment", "Application"]
\ No newline at end of file
+__all__ = ["Base", "User", "Job", "Assessment", "Application", "AICacheEntry", "Question", "QuestionTag", "AssessmentOperation"]
\ No newline at end of file
@@ -0,0 +1,12 @@
+from sqlalchemy import Column, String, Text, DateTime
+from sqlalchemy.sql import func
+from .base import Base
+
+class AICacheEntry(Base):
+    __tablename__ = "ai_cache_entries"
+
+    key = Column(String, primary_key=True)  # SHA-256 of the canonical request
+    kind = Column(String, nullable=False, index=True)  # e.g. 'questions' or 'duration'
+    value = Column(Text, nullable=False)  # Stored as JSON string
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
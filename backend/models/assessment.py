@@ -12,6 +12,7 @@ class Assessment(Base):
     job_id = Column(String, ForeignKey("jobs.id"), nullable=False)
     title = Column(String, nullable=False)
     duration = Column(Integer)  # in seconds
+    duration_source = Column(String)  # local or llm, whichever estimated the duration
     passing_score = Column(Integer)  # range 20-80
     questions = Column(Text)  # Stored as JSON string
     active = Column(Boolean, default=True)
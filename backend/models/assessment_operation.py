@@ -0,0 +1,21 @@
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey
+from sqlalchemy.sql import func
+from .base import Base
+import uuid
+
+class AssessmentOperation(Base):
+    """A background assessment creation or regeneration whose status clients poll"""
+    __tablename__ = "assessment_operations"
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()), index=True)
+    kind = Column(String, nullable=False)  # create, regenerate
+    status = Column(String, nullable=False, default="pending", index=True)  # pending, running, succeeded, failed
+    job_id = Column(String, ForeignKey("jobs.id"), nullable=False)
+    assessment_id = Column(String)  # Set once a create succeeds; known up front for regenerate
+    error = Column(Text)
+    created_by = Column(String, ForeignKey("users.id"))
+    # The process running the operation renews its lease while it is alive; an expired lease means it died
+    owner_id = Column(String)
+    lease_expires_at = Column(DateTime(timezone=True))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
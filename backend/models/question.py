@@ -0,0 +1,23 @@
+from sqlalchemy import Column, String, Integer, Text, DateTime, Index
+from sqlalchemy.sql import func
+from .base import Base
+import uuid
+
+class Question(Base):
+    """A reusable question in the question bank, filled from every AI generation"""
+    __tablename__ = "questions"
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()), index=True)
+    text = Column(Text, nullable=False)
+    text_hash = Column(String, nullable=False, unique=True)  # SHA-256 of type + normalized text, used to skip duplicates
+    type = Column(String, nullable=False, index=True)  # choose_one, choose_many, text_based
+    weight = Column(Integer, nullable=False, default=1)  # range 1-5
+    options = Column(Text)  # Stored as JSON string
+    correct_options = Column(Text)  # Stored as JSON string
+    seniority = Column(String, index=True)  # intern, junior, mid, senior
+    difficulty = Column(String, index=True)  # easy, medium, hard
+    source_provider = Column(String)  # AI provider that generated the question
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Assembly looks questions up by type, seniority and difficulty together
+    __table_args__ = (Index('ix_questions_type_seniority_difficulty', 'type', 'seniority', 'difficulty'),)
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, String, ForeignKey, UniqueConstraint, Index
+from .base import Base
+import uuid
+
+class QuestionTag(Base):
+    """A skill category of a question in the question bank"""
+    __tablename__ = "question_tags"
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()), index=True)
+    question_id = Column(String, ForeignKey("questions.id", ondelete="CASCADE"), nullable=False, index=True)
+    tag_name = Column(String, nullable=False)  # Lowercased skill category
+
+    __table_args__ = (
+        UniqueConstraint('question_id', 'tag_name', name='uq_question_tags_question_tag'),
+        # Assembly filters by skill first, then joins to the question
+        Index('ix_question_tags_tag_name_question_id', 'tag_name', 'question_id'),
+    )
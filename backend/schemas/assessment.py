@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Optional, List, Dict
 from pydantic import BaseModel, Field
 from .base import BaseSchema
 from .enums import QuestionType
@@ -28,6 +28,7 @@ class AssessmentCreate(BaseModel):
     passing_score: int = Field(..., ge=20, le=80)  # range 20-80
     questions_types: List[QuestionType]  # array of enum(choose_one, choose_many, text_based)
     additional_note: Optional[str] = Field(None, max_length=500)
+    bypass_cache: bool = False  # ask the AI provider even if an identical request is cached
 
 class AssessmentUpdate(BaseModel):
     title: Optional[str] = Field(None, min_length=1, max_length=200)
@@ -38,6 +39,9 @@ class AssessmentUpdate(BaseModel):
 class AssessmentRegenerate(BaseModel):
     questions_types: Optional[List[QuestionType]] = None  # array of enum(choose_one, choose_many, text_based)
     additional_note: Optional[str] = Field(None, max_length=500)
+    bypass_cache: bool = True  # regeneration asks for fresh questions unless told otherwise
+    question_ids: Optional[List[str]] = None  # replace only these questions and keep the rest
+    replacement_types: Optional[Dict[str, QuestionType]] = None  # new type per id in question_ids; others keep their type
 
 class AssessmentResponse(AssessmentBase):
     id: str
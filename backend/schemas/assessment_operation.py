@@ -0,0 +1,18 @@
+from typing import Optional
+from pydantic import BaseModel
+from datetime import datetime
+from .base import BaseSchema
+
+class AssessmentOperationAccepted(BaseModel):
+    operation_id: str
+    status: str
+
+class AssessmentOperationResponse(BaseSchema):
+    id: str
+    kind: str  # create, regenerate
+    status: str  # pending, running, succeeded, failed
+    job_id: str
+    assessment_id: Optional[str] = None
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
@@ -1,30 +1,35 @@
-from typing import Optional
-from pydantic import BaseModel
+from typing import Optional, List
+from pydantic import BaseModel, Field
 from datetime import datetime
 from .base import BaseSchema
+from .enums import QuestionType, JobSeniority
+from .assessment import AssessmentQuestionOption
 
 class QuestionBase(BaseSchema):
-    assessment_id: int
-    question_text: str
-    question_type: str  # 'text', 'true_false', 'multiple_choice'
-    is_knockout: bool = False
-    weight: int = 1
-    max_score: int = 10
+    text: str
+    type: QuestionType
+    weight: int = Field(1, ge=1, le=5)  # range 1-5
+    skill_categories: List[str] = []
+    options: Optional[List[AssessmentQuestionOption]] = []
+    correct_options: Optional[List[str]] = []
+    seniority: Optional[JobSeniority] = None
+    difficulty: Optional[str] = None  # easy, medium, hard
 
 class QuestionCreate(QuestionBase):
-    question_text: str
-    question_type: str
+    source_provider: Optional[str] = None
 
 class QuestionUpdate(BaseModel):
-    question_text: Optional[str] = None
-    question_type: Optional[str] = None
-    is_knockout: Optional[bool] = None
-    weight: Optional[int] = None
-    max_score: Optional[int] = None
+    text: Optional[str] = None
+    weight: Optional[int] = Field(None, ge=1, le=5)
+    options: Optional[List[AssessmentQuestionOption]] = None
+    correct_options: Optional[List[str]] = None
+    seniority: Optional[JobSeniority] = None
+    difficulty: Optional[str] = None
 
 class QuestionInDB(QuestionBase):
-    id: int
-    created_at: datetime
+    id: str
+    source_provider: Optional[str] = None
+    created_at: Optional[datetime] = None
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
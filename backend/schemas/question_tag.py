@@ -3,7 +3,7 @@ from pydantic import BaseModel
 from .base import BaseSchema
 
 class QuestionTagBase(BaseSchema):
-    question_id: int
+    question_id: str
     tag_name: str
 
 class QuestionTagCreate(QuestionTagBase):
@@ -13,7 +13,7 @@ class QuestionTagUpdate(BaseModel):
     tag_name: Optional[str] = None
 
 class QuestionTagInDB(QuestionTagBase):
-    id: int
+    id: str
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
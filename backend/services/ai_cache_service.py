@@ -0,0 +1,59 @@
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+import hashlib
+import json
+
+from models.ai_cache import AICacheEntry
+from logging_config import get_logger
+
+# Create logger for this module
+logger = get_logger(__name__)
+
+def make_cache_key(kind: str, payload: Dict[str, Any]) -> str:
+    """Build a cache key from a canonical JSON encoding of the request payload"""
+    canonical = json.dumps({"kind": kind, "payload": payload}, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+def get_cached_value(db: Session, key: str) -> Optional[Any]:
+    """Get a cached value by key, or None if it is missing or expired"""
+    # Cache I/O runs in its own session so it never commits or rolls back the caller's work
+    try:
+        with Session(bind=db.get_bind()) as cache_db:
+            # Expiry is compared in SQL: SQLite returns the stored UTC times without their time zone
+            entry = cache_db.query(AICacheEntry).filter(
+                AICacheEntry.key == key, AICacheEntry.expires_at > datetime.now(timezone.utc)
+            ).first()
+            if entry is None:
+                logger.debug(f"AI cache miss for key: {key[:12]}")
+                return None
+            logger.info(f"AI cache hit for {entry.kind} key: {key[:12]}")
+            return json.loads(entry.value)
+    except (SQLAlchemyError, json.JSONDecodeError) as e:
+        logger.warning(f"Could not read AI cache entry {key[:12]}: {str(e)}")
+        return None
+
+def set_cached_value(db: Session, key: str, kind: str, value: Any, ttl_seconds: int) -> None:
+    """Store a value in the cache, replacing any previous entry with the same key"""
+    now = datetime.now(timezone.utc)
+    try:
+        with Session(bind=db.get_bind()) as cache_db:
+            cache_db.merge(AICacheEntry(
+                key=key,
+                kind=kind,
+                value=json.dumps(value),
+                created_at=now,
+                expires_at=now + timedelta(seconds=ttl_seconds)
+            ))
+            cache_db.commit()
+            logger.debug(f"Stored AI cache entry for {kind} key: {key[:12]}")
+    except SQLAlchemyError as e:
+        logger.warning(f"Could not store AI cache entry {key[:12]}: {str(e)}")
+
+def delete_expired_entries(db: Session) -> int:
+    """Delete expired cache entries and return how many were removed"""
+    deleted = db.query(AICacheEntry).filter(AICacheEntry.expires_at <= datetime.now(timezone.utc)).delete()
+    db.commit()
+    logger.info(f"Deleted {deleted} expired AI cache entries")
+    return deleted
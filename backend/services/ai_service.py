@@ -1,14 +1,74 @@
+import asyncio
+import contextvars
+import math
 import re
-from typing import List, Dict, Any
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import AsyncIterator, Callable, List, Dict, Any, Optional, Tuple
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
 from schemas.assessment import AssessmentQuestion
 from schemas.application import ApplicationAnswerWithQuestion
-from integrations.ai_integration.ai_factory import AIGeneratorFactory, DEFAULT_PROVIDER
+from schemas.enums import QuestionType
+from integrations.ai_integration.ai_factory import AIGeneratorFactory, AIProvider, DEFAULT_PROVIDER
+from integrations.ai_integration.ai_generator_interface import AIGeneratorInterface
+from integrations.ai_integration.resilience import ResilientAIGenerator, get_circuit_breaker
+from integrations.ai_integration.scheduling import ScheduledAIGenerator, get_scheduler
+from integrations.ai_integration.instrumentation import InstrumentedAIGenerator
+from services.ai_cache_service import make_cache_key, get_cached_value, set_cached_value
+from services.question_service import add_questions_to_bank, _text_hash
+from services.duration_estimator import estimate_duration_minutes, estimate_duration_for_types
+from config import settings
+from utils.tracing import traced, set_span_attributes
 from logging_config import get_logger
 
 # Create logger for this module
 logger = get_logger(__name__)
 
-def generate_questions(title: str, questions_types: List[str], additional_note: str = None, job_info: dict = None, provider=None) -> List[AssessmentQuestion]:
+# Provider calls of pipelined duration estimates run here while questions are generated
+_duration_executor: Optional[ThreadPoolExecutor] = None
+_duration_executor_lock = threading.Lock()
+
+# Wrapped versions of the factory's shared generators, rebuilt when a provider is re-registered
+_wrapped_generators: Dict[AIProvider, Tuple[AIGeneratorInterface, AIGeneratorInterface]] = {}
+
+# Chunks of large question generations run here in parallel
+_generation_executor: Optional[ThreadPoolExecutor] = None
+_generation_executor_lock = threading.Lock()
+
+def get_ai_generator(provider: AIProvider) -> AIGeneratorInterface:
+    """
+    Get the generator used for a provider's calls.
+
+    The factory's shared generator is wrapped with deadlines, retries and the provider's
+    circuit breaker, falling back to AI_FALLBACK_PROVIDER when configured. The provider's
+    call scheduler, which enforces its rate limit and call priorities, is consulted by that
+    wrapper for every request it sends, or wraps the generator directly when resilience is
+    disabled. The outermost wrapper records latency, tokens and cost of each call as the
+    caller sees it.
+    """
+    generator = AIGeneratorFactory.get_generator(provider)
+    wrapped = _wrapped_generators.get(provider)
+    if wrapped is not None and wrapped[0] is generator:
+        return wrapped[1]
+
+    wrapper = generator
+    scheduler = get_scheduler(provider.value) if settings.ai_scheduler_enabled else None
+    if settings.ai_resilience_enabled:
+        fallback = None
+        fallback_provider = settings.ai_fallback_provider
+        if fallback_provider and fallback_provider != provider.value:
+            fallback = lambda: get_ai_generator(AIProvider(fallback_provider))
+        wrapper = ResilientAIGenerator(wrapper, get_circuit_breaker(provider.value), fallback, scheduler)
+    elif scheduler is not None:
+        wrapper = ScheduledAIGenerator(wrapper, scheduler)
+    if settings.ai_instrumentation_enabled:
+        wrapper = InstrumentedAIGenerator(wrapper, provider.value)
+    _wrapped_generators[provider] = (generator, wrapper)
+    return wrapper
+
+@traced()
+def generate_questions(title: str, questions_types: List[str], additional_note: str = None, job_info: dict = None, provider=None, db: Session = None, bypass_cache: bool = False) -> List[AssessmentQuestion]:
     """
     Generate questions based on the assessment title, job information, and specified question types.
 
@@ -18,6 +78,8 @@ def generate_questions(title: str, questions_types: List[str], additional_note:
         additional_note: Additional information to guide question generation
         job_info: Information about the job the assessment is for
         provider: The AI provider to use (defaults to the default provider)
+        db: Database session used for the response cache and question bank (neither is used when omitted)
+        bypass_cache: Always ask the provider for fresh questions, then refresh the cache
 
     Returns:
         List of generated AssessmentQuestion objects
@@ -28,20 +90,200 @@ def generate_questions(title: str, questions_types: List[str], additional_note:
     if provider is None:
         provider = DEFAULT_PROVIDER
 
-    # Get the AI generator from the factory
-    ai_generator = AIGeneratorFactory.create_generator(provider)
+    # Get the shared AI generator from the factory
+    ai_generator = get_ai_generator(provider)
+    set_span_attributes(provider=provider.value, question_count=len(questions_types))
+
+    cache_key = None
+    if db is not None and settings.ai_cache_enabled:
+        cache_key = make_cache_key("questions", {
+            "title": title,
+            "questions_types": [getattr(qt, 'value', qt) for qt in questions_types],
+            "additional_note": additional_note,
+            "job_info": job_info,
+            "provider": provider.value,
+            "model": ai_generator.model
+        })
+        if not bypass_cache:
+            cached_questions = get_cached_value(db, cache_key)
+            if cached_questions is not None:
+                logger.info(f"Using {len(cached_questions)} cached questions for assessment: '{title}'")
+                set_span_attributes(cache_hit=True)
+                return [AssessmentQuestion(**q) for q in cached_questions]
+
+    # Generate questions using the selected AI provider; large requests are split into parallel chunks
+    if len(questions_types) > settings.generation_chunk_size:
+        generated_questions = _generate_in_chunks(ai_generator, provider, title, questions_types, additional_note, job_info)
+    else:
+        generated_questions = ai_generator.generate_questions(
+            title=title,
+            questions_types=questions_types,
+            additional_note=additional_note,
+            job_info=job_info
+        )
+
+    if cache_key is not None:
+        set_cached_value(db, cache_key, "questions", [q.model_dump(mode="json") for q in generated_questions], settings.ai_cache_ttl_seconds)
+
+    # Every generation grows the question bank so later assessments can reuse its questions
+    if db is not None and settings.question_bank_enabled:
+        add_questions_to_bank(db, generated_questions, job_info=job_info, source_provider=provider.value)
+
+    logger.info(f"Generated {len(generated_questions)} questions for assessment: '{title}' using {provider.value} provider")
+    return generated_questions
+
+def _get_generation_executor() -> ThreadPoolExecutor:
+    """Create the chunked generation workers on first use"""
+    global _generation_executor
+    with _generation_executor_lock:
+        if _generation_executor is None:
+            _generation_executor = ThreadPoolExecutor(max_workers=settings.generation_chunk_threads, thread_name_prefix="question-chunk")
+        return _generation_executor
+
+def _chunk_questions_types(questions_types: List[str], chunk_size: int) -> List[List[int]]:
+    """Split the positions of the requested question types into similarly sized chunks, keeping questions of the same type together"""
+    first_seen: Dict[str, int] = {}
+    for question_type in questions_types:
+        first_seen.setdefault(question_type, len(first_seen))
+    grouped = sorted(range(len(questions_types)), key=lambda position: first_seen[questions_types[position]])
+
+    size = math.ceil(len(grouped) / math.ceil(len(grouped) / chunk_size))
+    return [grouped[i:i + size] for i in range(0, len(grouped), size)]
+
+def _chunk_job_info(job_info: dict, chunk_index: int, chunk_count: int) -> dict:
+    """Give each chunk its share of the job's skills so parallel chunks ask about different topics"""
+    skills = (job_info or {}).get('skill_categories') or []
+    chunk_skills = skills[chunk_index::chunk_count]
+    if not chunk_skills:
+        return job_info
+    return {**job_info, 'skill_categories': chunk_skills}
+
+# Some providers, such as Mistral, answer every multiple choice question as choose_one
+_MULTIPLE_CHOICE_TYPES = {QuestionType.choose_one.value, QuestionType.choose_many.value}
+
+def _question_family(question_type: str) -> str:
+    """The type a provider's answer may come back as for a requested question type"""
+    return "multiple_choice" if question_type in _MULTIPLE_CHOICE_TYPES else question_type
+
+def _fill_chunk_slots(slots: List[Optional[AssessmentQuestion]], positions: List[int], questions_types: List[str],
+                      new_questions: List[AssessmentQuestion], seen: set) -> List[AssessmentQuestion]:
+    """
+    Put each new question into the first empty slot of its family among the positions, dropping
+    questions whose text has been seen. Returns the new questions that found no such slot.
+    """
+    unplaced = []
+    for question in new_questions:
+        question_type = getattr(question.type, 'value', question.type)
+        text_hash = _text_hash(question_type, question.text)
+        if text_hash in seen:
+            continue
+        seen.add(text_hash)
+        family = _question_family(question_type)
+        position = next((p for p in positions if slots[p] is None and _question_family(questions_types[p]) == family), None)
+        if position is None:
+            unplaced.append(question)
+        else:
+            slots[position] = question
+    return unplaced
+
+def _generate_in_chunks(ai_generator, provider, title: str, questions_types: List[str], additional_note: str = None, job_info: dict = None) -> List[AssessmentQuestion]:
+    """
+    Generate a large set of questions as parallel chunks, so the wall time is that of the slowest chunk.
+
+    Questions repeated across chunks, or missing from a chunk's answer, are regenerated once. The
+    merged questions keep the requested order and get sequential ids, since each chunk numbers
+    its own questions.
+    """
+    questions_types = [getattr(qt, 'value', qt) for qt in questions_types]
+    chunks = _chunk_questions_types(questions_types, settings.generation_chunk_size)
+    logger.info(f"Generating {len(questions_types)} questions for assessment: '{title}' in {len(chunks)} parallel chunks")
+
+    executor = _get_generation_executor()
+    # Each chunk runs in a copy of the caller's context so it keeps the caller's call priority
+    futures = [
+        executor.submit(
+            contextvars.copy_context().run,
+            ai_generator.generate_questions,
+            title=title,
+            questions_types=[questions_types[position] for position in chunk],
+            additional_note=additional_note,
+            job_info=_chunk_job_info(job_info, i, len(chunks))
+        )
+        for i, chunk in enumerate(chunks)
+    ]
+
+    # Chunks hold the questions grouped by type, so each answer goes back to its requested position
+    slots: List[Optional[AssessmentQuestion]] = [None] * len(questions_types)
+    seen: set = set()
+    unplaced = []
+    for chunk, future in zip(chunks, futures):
+        unplaced += _fill_chunk_slots(slots, chunk, questions_types, future.result(), seen)
+
+    missing = [position for position, slot in enumerate(slots) if slot is None]
+    if missing:
+        logger.info(f"Regenerating {len(missing)} questions missing or repeated across chunks for assessment: '{title}'")
+        replacements = ai_generator.generate_questions(
+            title=title,
+            questions_types=[questions_types[position] for position in missing],
+            additional_note=additional_note,
+            job_info=job_info
+        )
+        unplaced += _fill_chunk_slots(slots, missing, questions_types, replacements, seen)
+        dropped = sum(slot is None for slot in slots)
+        if dropped:
+            logger.warning(f"Dropped {dropped} duplicate questions for assessment: '{title}'")
+
+    questions = [q for q in slots if q is not None] + unplaced
+    return [q.model_copy(update={"id": f"{provider.value}_{i}"}) for i, q in enumerate(questions)]
+
+async def astream_questions(title: str, questions_types: List[str], additional_note: str = None, job_info: dict = None, provider=None, bind: Engine = None) -> AsyncIterator[AssessmentQuestion]:
+    """
+    Yield generated questions as the provider produces them, for showing progress while an assessment is generated.
+
+    The response cache is not used, since a stream is only worth it when the provider is called;
+    the questions are added to the question bank once the stream is complete.
+
+    Args:
+        title: The title of the assessment
+        questions_types: List of question types to generate (choose_one, choose_many, text_based)
+        additional_note: Additional information to guide question generation
+        job_info: Information about the job the assessment is for
+        provider: The AI provider to use (defaults to the default provider)
+        bind: Engine of the question bank, written to from a worker thread (not used when omitted)
+
+    Returns:
+        Async iterator of generated AssessmentQuestion objects
+    """
+    logger.info(f"Streaming questions for assessment: '{title}' with types: {questions_types}")
+
+    # Use the default provider if none is specified
+    if provider is None:
+        provider = DEFAULT_PROVIDER
+
+    # Get the shared AI generator from the factory
+    ai_generator = get_ai_generator(provider)
 
-    # Generate questions using the selected AI provider
-    generated_questions = ai_generator.generate_questions(
+    generated_questions = []
+    async for question in ai_generator.astream_questions(
         title=title,
         questions_types=questions_types,
         additional_note=additional_note,
         job_info=job_info
-    )
+    ):
+        generated_questions.append(question)
+        yield question
 
-    logger.info(f"Generated {len(generated_questions)} questions for assessment: '{title}' using {provider.value} provider")
-    return generated_questions
+    if bind is not None and settings.question_bank_enabled:
+        await asyncio.to_thread(_add_to_bank, bind, generated_questions, job_info, provider.value)
 
+    logger.info(f"Streamed {len(generated_questions)} questions for assessment: '{title}' using {provider.value} provider")
+
+def _add_to_bank(bind: Engine, questions: List[AssessmentQuestion], job_info: dict, source_provider: str) -> None:
+    """Add streamed questions to the question bank in a session of the calling worker thread"""
+    with Session(bind=bind) as db:
+        add_questions_to_bank(db, questions, job_info=job_info, source_provider=source_provider)
+
+@traced()
 def score_answer(question: AssessmentQuestion, answer_text: str, selected_options: List[str] = None, provider=None) -> Dict[str, Any]:
     """
     Score an answer based on the question and the provided answer.
@@ -66,8 +308,8 @@ def score_answer(question: AssessmentQuestion, answer_text: str, selected_option
     if provider is None:
         provider = DEFAULT_PROVIDER
 
-    # Get the AI generator from the factory
-    ai_generator = AIGeneratorFactory.create_generator(provider)
+    # Get the shared AI generator from the factory
+    ai_generator = get_ai_generator(provider)
 
     # Score the answer using the selected AI provider
     score_result = ai_generator.score_answer(
@@ -79,30 +321,155 @@ def score_answer(question: AssessmentQuestion, answer_text: str, selected_option
     logger.info(f"Scored answer with score: {score_result['score']}, correct: {score_result['correct']}")
     return score_result
 
-def estimate_assessment_duration(title: str, job_info: dict, questions: List[AssessmentQuestion], additional_note: str = None, provider=None) -> int:
+@traced()
+def estimate_assessment_duration(title: str, job_info: dict, questions: List[AssessmentQuestion], additional_note: str = None, provider=None, db: Session = None, bypass_cache: bool = False) -> int:
     """
     Estimate the duration needed for an assessment based on its details and questions.
 
+    In the default local mode the estimate is computed from the questions without an AI call;
+    set DURATION_ESTIMATOR_MODE=llm to ask the AI provider instead.
+
     Args:
         title: The title of the assessment
         job_info: Information about the job the assessment is for
         questions: List of questions in the assessment
         additional_note: Additional information about the assessment
         provider: The AI provider to use (defaults to the default provider)
+        db: Database session used for the response cache (no caching when omitted)
+        bypass_cache: Always ask the provider for a fresh estimate, then refresh the cache
 
     Returns:
         Estimated duration in minutes
     """
     logger.info(f"Estimating duration for assessment: '{title}' with {len(questions)} questions")
 
+    if settings.duration_estimator_mode == "local":
+        duration_minutes = estimate_duration_minutes(questions, job_info)
+        logger.info(f"Estimated duration for assessment '{title}' locally: {duration_minutes} minutes")
+        return duration_minutes
+
+    # Use the default provider if none is specified
+    if provider is None:
+        provider = DEFAULT_PROVIDER
+
+    # Get the shared AI generator from the factory
+    ai_generator = get_ai_generator(provider)
+
+    cache_key = None
+    if db is not None and settings.ai_cache_enabled:
+        cache_key = make_cache_key("duration", {
+            "title": title,
+            "job_info": job_info,
+            "questions": [q.model_dump(mode="json") if hasattr(q, 'model_dump') else q for q in questions],
+            "additional_note": additional_note,
+            "provider": provider.value,
+            "model": ai_generator.model
+        })
+        if not bypass_cache:
+            cached_duration = get_cached_value(db, cache_key)
+            if cached_duration is not None:
+                logger.info(f"Using cached duration for assessment '{title}': {cached_duration} minutes")
+                return cached_duration
+
+    # Describe the first questions in the prompt; long lists only add tokens
+    question_lines = []
+    for question in questions[:5]:
+        line = f"({question.type}): {question.text[:100]}..."
+        if question.type == 'text_based':
+            line += " (Text-based question requiring written response)"
+        elif question.type in ['choose_one', 'choose_many']:
+            line += f" (Multiple choice with {len(question.options)} options)"
+        question_lines.append(line)
+    prompt = _duration_prompt(title, job_info, len(questions), question_lines, additional_note)
+
+    # Get the AI's estimation
+    duration_estimate = ai_generator.estimate_duration(prompt)
+    return _parse_duration(duration_estimate, len(questions), title, db, cache_key)
+
+def start_duration_estimate(title: str, job_info: dict, questions_types: List[str], additional_note: str = None, provider=None, db: Session = None, bypass_cache: bool = False) -> "PendingDuration":
+    """
+    Start estimating an assessment's duration from its requested question types, before the questions exist.
+
+    The provider call runs on a background thread so it overlaps with question generation;
+    the cache is read here and written by PendingDuration.result(), both on the caller's thread.
+
+    Args:
+        title: The title of the assessment
+        job_info: Information about the job the assessment is for
+        questions_types: Question types the assessment will contain
+        additional_note: Additional information about the assessment
+        provider: The AI provider to use (defaults to the default provider)
+        db: Database session used for the response cache (no caching when omitted)
+        bypass_cache: Always ask the provider for a fresh estimate, then refresh the cache
+
+    Returns:
+        A PendingDuration whose result() is the estimated duration in minutes
+    """
+    questions_types = [getattr(qt, 'value', qt) for qt in questions_types]
+    logger.info(f"Starting duration estimate for assessment: '{title}' with {len(questions_types)} questions")
+
+    if settings.duration_estimator_mode == "local":
+        return PendingDuration(value=estimate_duration_for_types(questions_types, job_info))
+
     # Use the default provider if none is specified
     if provider is None:
         provider = DEFAULT_PROVIDER
 
-    # Get the AI generator from the factory
-    ai_generator = AIGeneratorFactory.create_generator(provider)
+    # Get the shared AI generator from the factory
+    ai_generator = get_ai_generator(provider)
 
-    # Prepare the prompt for the AI
+    cache_key = None
+    if db is not None and settings.ai_cache_enabled:
+        cache_key = make_cache_key("duration", {
+            "title": title,
+            "job_info": job_info,
+            "questions_types": questions_types,
+            "additional_note": additional_note,
+            "provider": provider.value,
+            "model": ai_generator.model
+        })
+        if not bypass_cache:
+            cached_duration = get_cached_value(db, cache_key)
+            if cached_duration is not None:
+                logger.info(f"Using cached duration for assessment '{title}': {cached_duration} minutes")
+                return PendingDuration(value=cached_duration)
+
+    question_lines = []
+    for question_type in questions_types[:5]:
+        if question_type == 'text_based':
+            question_lines.append(f"({question_type}): Text-based question requiring written response")
+        else:
+            question_lines.append(f"({question_type}): Multiple choice question")
+    prompt = _duration_prompt(title, job_info, len(questions_types), question_lines, additional_note)
+
+    future = _get_duration_executor().submit(contextvars.copy_context().run, ai_generator.estimate_duration, prompt)
+    return PendingDuration(future=future, finish=lambda estimate: _parse_duration(estimate, len(questions_types), title, db, cache_key))
+
+class PendingDuration:
+    """A duration estimate that may still be running; result() waits for it"""
+
+    def __init__(self, value: int = None, future: Future = None, finish: Callable[[str], int] = None):
+        self._value = value
+        self._future = future
+        self._finish = finish
+
+    def result(self) -> int:
+        """Wait for the estimate and return the duration in minutes"""
+        if self._future is not None:
+            self._value = self._finish(self._future.result())
+            self._future = None
+        return self._value
+
+def _get_duration_executor() -> ThreadPoolExecutor:
+    """Create the duration estimate workers on first use"""
+    global _duration_executor
+    with _duration_executor_lock:
+        if _duration_executor is None:
+            _duration_executor = ThreadPoolExecutor(max_workers=settings.duration_estimate_threads, thread_name_prefix="duration-estimate")
+        return _duration_executor
+
+def _duration_prompt(title: str, job_info: dict, question_count: int, question_lines: List[str], additional_note: str = None) -> str:
+    """Build the prompt asking the AI for an assessment duration"""
     prompt = f"""
     Based on the following assessment details, estimate how many minutes a candidate would need to complete this assessment.
     Consider the complexity of the questions and the job requirements.
@@ -115,25 +482,21 @@ def estimate_assessment_duration(title: str, job_info: dict, questions: List[Ass
     - Description: {job_info.get('description', 'N/A')}
     - Skill Categories: {', '.join(job_info.get('skill_categories', []))}
     
-    Questions Count: {len(questions)}
+    Questions Count: {question_count}
     """
 
     # Add question details to the prompt
-    for i, question in enumerate(questions[:5]):  # Limit to first 5 questions to avoid overly long prompts
-        prompt += f"\nQuestion {i+1} ({question.type}): {question.text[:100]}..."
-        if question.type == 'text_based':
-            prompt += " (Text-based question requiring written response)"
-        elif question.type in ['choose_one', 'choose_many']:
-            prompt += f" (Multiple choice with {len(question.options)} options)"
+    for i, line in enumerate(question_lines):
+        prompt += f"\nQuestion {i+1} {line}"
 
     if additional_note:
         prompt += f"\nAdditional Notes: {additional_note}"
 
     prompt += "\n\nPlease provide only a number representing the estimated duration in minutes."
+    return prompt
 
-    # Get the AI's estimation
-    duration_estimate = ai_generator.estimate_duration(prompt)
-
+def _parse_duration(duration_estimate: str, question_count: int, title: str, db: Session = None, cache_key: str = None) -> int:
+    """Extract the duration from the AI's answer, caching it when a cache key is given"""
     # Extract the first number from the response using regex
     duration_match = re.search(r'\d+', duration_estimate)
     if duration_match:
@@ -141,9 +504,11 @@ def estimate_assessment_duration(title: str, job_info: dict, questions: List[Ass
         # Ensure the duration is within reasonable bounds (1-180 minutes)
         duration_minutes = max(1, min(180, duration_minutes))
         logger.info(f"Estimated duration for assessment '{title}': {duration_minutes} minutes")
+        if cache_key is not None:
+            set_cached_value(db, cache_key, "duration", duration_minutes, settings.ai_cache_ttl_seconds)
         return duration_minutes
     else:
         # If no number is found in the response, return a default duration based on question count
-        default_duration = min(60, max(5, len(questions) * 3))  # 3 minutes per question, capped at 60
+        default_duration = min(60, max(5, question_count * 3))  # 3 minutes per question, capped at 60
         logger.warning(f"No duration found in AI response. Using default: {default_duration} minutes")
-        return default_duration
\ No newline at end of file
+        return default_duration
@@ -6,6 +6,7 @@ import json
 from models.application import Application
 from schemas.application import ApplicationCreate, ApplicationUpdate
 from logging_config import get_logger
+from utils.tracing import traced, set_span_attributes
 
 # Create logger for this module
 logger = get_logger(__name__)
@@ -50,6 +51,7 @@ def get_applications_by_user(db: Session, user_id: str, skip: int = 0, limit: in
     logger.debug(f"Retrieved {len(applications)} applications for user ID: {user_id}")
     return applications
 
+@traced()
 def create_application(db: Session, application: ApplicationCreate) -> Application:
     """Create a new application"""
     logger.info(f"Creating new application for job ID: {application.job_id}, assessment ID: {application.assessment_id}, user ID: {application.user_id}")
@@ -66,6 +68,7 @@ def create_application(db: Session, application: ApplicationCreate) -> Applicati
     logger.info(f"Successfully created application with ID: {db_application.id}")
     return db_application
 
+@traced()
 def update_application(db: Session, application_id: str, **kwargs) -> Optional[Application]:
     """Update an application"""
     logger.info(f"Updating application with ID: {application_id}")
@@ -95,6 +98,7 @@ def delete_application(db: Session, application_id: str) -> bool:
     logger.warning(f"Failed to delete application - application not found: {application_id}")
     return False
 
+@traced()
 def calculate_application_score(db: Session, application_id: str) -> float:
     """Calculate the score for an application"""
     logger.debug(f"Calculating score for application ID: {application_id}")
@@ -188,4 +192,5 @@ def calculate_application_score(db: Session, application_id: str) -> float:
         score = 0.0
 
     logger.debug(f"Calculated score for application ID {application_id}: {score}% ({earned_points}/{total_points} points)")
+    set_span_attributes(assessment_id=application.assessment_id, answer_count=len(answers), score=round(score, 2))
     return round(score, 2)
\ No newline at end of file
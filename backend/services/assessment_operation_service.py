@@ -0,0 +1,181 @@
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Optional, Set
+import contextvars
+import os
+import socket
+import threading
+import uuid
+
+from models.assessment import Assessment
+from models.assessment_operation import AssessmentOperation
+from schemas.assessment import AssessmentCreate
+from services.assessment_service import create_assessment, get_assessment, regenerate_assessment
+from services.job_service import get_job
+from config import settings
+from logging_config import get_logger
+
+# Create logger for this module
+logger = get_logger(__name__)
+
+UNFINISHED = ["pending", "running"]
+
+# Identifies this process as the owner of the operations it queued, among all workers sharing the database
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+# Generation runs on these threads so HTTP workers are never held by AI provider latency
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+# Renews the leases of this process's operations and fails those whose owner died
+_heartbeat: Optional[threading.Thread] = None
+_heartbeat_stop = threading.Event()
+_leased_binds: Set[Any] = set()
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Create the background workers on first use"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=settings.assessment_worker_threads, thread_name_prefix="assessment-operation")
+        return _executor
+
+def _lease_expiry() -> datetime:
+    return datetime.now(timezone.utc) + timedelta(seconds=settings.assessment_operation_lease_seconds)
+
+def _start_heartbeat(bind: Any) -> None:
+    """Keep renewing the leases of operations queued on this bind while the process lives"""
+    global _heartbeat
+    with _executor_lock:
+        _leased_binds.add(bind)
+        if _heartbeat is None:
+            _heartbeat_stop.clear()
+            _heartbeat = threading.Thread(target=_heartbeat_loop, name="assessment-operation-heartbeat", daemon=True)
+            _heartbeat.start()
+
+def _heartbeat_loop() -> None:
+    # Renewing three times per lease keeps a live owner's lease from lapsing between beats
+    while not _heartbeat_stop.wait(settings.assessment_operation_lease_seconds / 3):
+        with _executor_lock:
+            binds = list(_leased_binds)
+        for bind in binds:
+            with Session(bind=bind) as db:
+                renew_leases(db)
+                fail_expired_operations(db)
+
+def renew_leases(db: Session) -> int:
+    """Extend the leases of the unfinished operations owned by this process"""
+    try:
+        renewed = db.query(AssessmentOperation).filter(
+            AssessmentOperation.owner_id == WORKER_ID, AssessmentOperation.status.in_(UNFINISHED)
+        ).update({"lease_expires_at": _lease_expiry()}, synchronize_session=False)
+        db.commit()
+        return renewed
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.warning(f"Could not renew assessment operation leases: {str(e)}")
+        return 0
+
+def get_operation(db: Session, operation_id: str) -> Optional[AssessmentOperation]:
+    """Get assessment operation by ID"""
+    return db.query(AssessmentOperation).filter(AssessmentOperation.id == operation_id).first()
+
+def _submit(db: Session, kind: str, job_id: str, assessment_id: Optional[str], user_id: Optional[str],
+            work: Callable[[Session], Optional[Assessment]]) -> AssessmentOperation:
+    """Record a pending operation and hand its work to the background workers"""
+    db_operation = AssessmentOperation(kind=kind, status="pending", job_id=job_id, assessment_id=assessment_id, created_by=user_id,
+                                       owner_id=WORKER_ID, lease_expires_at=_lease_expiry())
+    db.add(db_operation)
+    db.commit()
+    db.refresh(db_operation)
+    _start_heartbeat(db.get_bind())
+
+    # The worker runs in a copy of the request's context so its AI calls are attributed to the request's route
+    _get_executor().submit(contextvars.copy_context().run, _run_operation, db.get_bind(), db_operation.id, work)
+    logger.info(f"Queued assessment {kind} operation: {db_operation.id}")
+    return db_operation
+
+def _run_operation(bind: Any, operation_id: str, work: Callable[[Session], Optional[Assessment]]) -> None:
+    """Run an operation's work in its own session and record the outcome"""
+    with Session(bind=bind) as db:
+        # Only this process's pending operation is started; it may have been failed after its lease expired
+        owned = and_(AssessmentOperation.id == operation_id, AssessmentOperation.owner_id == WORKER_ID)
+        started = db.query(AssessmentOperation).filter(owned, AssessmentOperation.status == "pending").update(
+            {"status": "running", "lease_expires_at": _lease_expiry()}, synchronize_session=False
+        )
+        db.commit()
+        if not started:
+            logger.warning(f"Assessment operation {operation_id} is no longer pending; not running it")
+            return
+
+        try:
+            db_assessment = work(db)
+            if db_assessment is None:
+                raise ValueError("Assessment not found")
+            outcome = {"status": "succeeded", "assessment_id": db_assessment.id}
+            logger.info(f"Assessment operation {operation_id} succeeded")
+        except Exception as e:
+            db.rollback()
+            outcome = {"status": "failed", "error": str(e)}
+            logger.error(f"Assessment operation {operation_id} failed: {str(e)}")
+
+        finished = db.query(AssessmentOperation).filter(owned, AssessmentOperation.status == "running").update(
+            outcome, synchronize_session=False
+        )
+        db.commit()
+        if not finished:
+            logger.warning(f"Assessment operation {operation_id} lost its lease before finishing; its outcome was not recorded")
+
+def submit_create_assessment(db: Session, job_id: str, assessment: AssessmentCreate, user_id: str = None) -> Optional[AssessmentOperation]:
+    """Queue the creation of an assessment, or return None if the job does not exist"""
+    if not get_job(db, job_id):
+        logger.warning(f"Job not found for assessment creation: {job_id}")
+        return None
+    return _submit(db, "create", job_id, None, user_id, lambda worker_db: create_assessment(worker_db, job_id, assessment))
+
+def submit_regenerate_assessment(db: Session, assessment_id: str, user_id: str = None, **kwargs) -> Optional[AssessmentOperation]:
+    """Queue the regeneration of an assessment, or return None if the assessment does not exist"""
+    db_assessment = get_assessment(db, assessment_id)
+    if not db_assessment:
+        logger.warning(f"Assessment not found for regeneration: {assessment_id}")
+        return None
+    return _submit(db, "regenerate", db_assessment.job_id, assessment_id, user_id,
+                   lambda worker_db: regenerate_assessment(worker_db, assessment_id, **kwargs))
+
+def fail_expired_operations(db: Session) -> int:
+    """Mark unfinished operations whose owner stopped renewing their lease as failed"""
+    now = datetime.now(timezone.utc)
+    expired = or_(
+        AssessmentOperation.lease_expires_at < now,
+        # Operations queued before leases existed count as expired once they have been idle for a lease
+        and_(AssessmentOperation.lease_expires_at.is_(None),
+             AssessmentOperation.updated_at < now - timedelta(seconds=settings.assessment_operation_lease_seconds))
+    )
+    try:
+        interrupted = db.query(AssessmentOperation).filter(AssessmentOperation.status.in_(UNFINISHED), expired).update(
+            {"status": "failed", "error": "Interrupted: the server running it stopped"}, synchronize_session=False
+        )
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.warning(f"Could not check for interrupted assessment operations: {str(e)}")
+        return 0
+    if interrupted:
+        logger.warning(f"Marked {interrupted} interrupted assessment operations as failed")
+    return interrupted
+
+def shutdown_operation_workers() -> None:
+    """Stop the background workers; their queued operations are failed once their leases expire"""
+    global _executor, _heartbeat
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+        heartbeat, _heartbeat = _heartbeat, None
+        _leased_binds.clear()
+    _heartbeat_stop.set()
+    if heartbeat is not None:
+        heartbeat.join(timeout=5)
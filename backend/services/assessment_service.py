@@ -1,17 +1,26 @@
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, TypeVar
+import asyncio
 import uuid
 import json
 
 from models.assessment import Assessment
 from schemas.assessment import AssessmentCreate, AssessmentUpdate
 from logging_config import get_logger
-from services.ai_service import generate_questions
+from services.ai_service import generate_questions, astream_questions, estimate_assessment_duration, start_duration_estimate, PendingDuration
+from services.question_service import assemble_questions_from_bank
+from services.duration_estimator import current_duration_source
+from services.pregeneration_service import record_bank_lookup
 from integrations.ai_integration.ai_factory import AIProvider
+from config import settings
+from utils.tracing import traced, set_span_attributes
 
 # Create logger for this module
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
 def get_assessment(db: Session, assessment_id: str) -> Optional[Assessment]:
     """Get assessment by ID"""
     logger.debug(f"Retrieving assessment with ID: {assessment_id}")
@@ -36,51 +45,99 @@ def get_active_assessments_by_job(db: Session, job_id: str, skip: int = 0, limit
     logger.debug(f"Retrieved {len(assessments)} active assessments for job ID: {job_id}")
     return assessments
 
-def create_assessment(db: Session, job_id: str, assessment: AssessmentCreate) -> Assessment:
-    """Create a new assessment"""
-    logger.info(f"Creating new assessment for job ID: {job_id}, title: {assessment.title}")
+def _fill_question_slots(slots: list, new_questions: list) -> list:
+    """Put newly generated questions into the empty slots, keeping the requested question order"""
+    remaining = iter(new_questions)
+    questions = [slot if slot is not None else next(remaining, None) for slot in slots]
+    return [q for q in questions if q is not None] + list(remaining)
 
-    # Get the job information to include in the AI request
+def _get_job_info(db: Session, job_id: str) -> Optional[dict]:
+    """Get the job information included in AI requests, or None if the job does not exist"""
     from .job_service import get_job
     job = get_job(db, job_id)
     if not job:
-        logger.error(f"Job not found for ID: {job_id}")
-        raise ValueError(f"Job not found for ID: {job_id}")
-
-    # Prepare job information for the AI service
-    import json
-    job_info = {
+        return None
+    return {
         "title": job.title,
         "seniority": job.seniority,
         "description": job.description,
         "skill_categories": json.loads(job.skill_categories) if job.skill_categories else []
     }
 
-    # Generate questions using the AI service based on the provided question types and job info
-    generated_questions = generate_questions(
-        title=assessment.title,
-        questions_types=[qt.value for qt in assessment.questions_types],  # Convert enum values to strings
-        additional_note=assessment.additional_note,
-        job_info=job_info
-    )
+def _release_connection(db: Session) -> None:
+    """End the session's read transaction so its connection goes back to the pool while the provider is called"""
+    # Cache and bank writes during generation take their own connection; holding this one as
+    # well would need two writer connections per generation and exhaust the small writer pool
+    db.commit()
 
-    # Convert the generated questions to JSON
-    questions_json = json.dumps([q.model_dump() for q in generated_questions])
+def _in_own_session(bind: Engine, work: Callable[[Session], T]) -> T:
+    """Run database work in a short session of its own, so a worker thread never shares a session"""
+    with Session(bind=bind) as db:
+        return work(db)
 
-    # Estimate the duration using AI
-    from services.ai_service import estimate_assessment_duration
-    duration = estimate_assessment_duration(
-        title=assessment.title,
-        job_info=job_info,
-        questions=generated_questions,
-        additional_note=assessment.additional_note
-    )
+def _start_duration(db: Session, title: str, job_info: dict, questions_types: List[str], additional_note: str = None) -> Optional[PendingDuration]:
+    """Start the duration estimate from the question types so it overlaps with question generation"""
+    # The local estimator is instant and more accurate with the generated questions, so it runs afterwards
+    if settings.duration_estimator_mode == "local" or not settings.pipeline_duration_estimate:
+        return None
+    return start_duration_estimate(title=title, job_info=job_info, questions_types=questions_types, additional_note=additional_note, db=db)
+
+def _finish_duration(db: Session, pending_duration: Optional[PendingDuration], title: str, job_info: dict, questions: list, additional_note: str = None) -> int:
+    """Wait for a started duration estimate, or estimate from the generated questions when none was started"""
+    if pending_duration is not None:
+        return pending_duration.result()
+    return estimate_assessment_duration(title=title, job_info=job_info, questions=questions, additional_note=additional_note, db=db)
+
+@traced()
+def create_assessment(db: Session, job_id: str, assessment: AssessmentCreate) -> Assessment:
+    """Create a new assessment"""
+    logger.info(f"Creating new assessment for job ID: {job_id}, title: {assessment.title}")
+
+    # Get the job information to include in the AI request
+    job_info = _get_job_info(db, job_id)
+    if job_info is None:
+        logger.error(f"Job not found for ID: {job_id}")
+        raise ValueError(f"Job not found for ID: {job_id}")
+
+    questions_types = [qt.value for qt in assessment.questions_types]  # Convert enum values to strings
+    pending_duration = _start_duration(db, assessment.title, job_info, questions_types, assessment.additional_note)
+
+    # Reuse matching questions from the question bank; notes ask for tailored questions, so those always generate
+    bank_slots, shortfall_types = [None] * len(questions_types), questions_types
+    if settings.question_bank_enabled and not assessment.bypass_cache and not assessment.additional_note:
+        bank_slots, shortfall_types = assemble_questions_from_bank(db, questions_types, job_info)
+        record_bank_lookup(len(questions_types) - len(shortfall_types), len(shortfall_types))
+    _release_connection(db)
+
+    # Generate only the questions the bank could not provide
+    new_questions = []
+    if shortfall_types:
+        new_questions = generate_questions(
+            title=assessment.title,
+            questions_types=shortfall_types,
+            additional_note=assessment.additional_note,
+            job_info=job_info,
+            db=db,
+            bypass_cache=assessment.bypass_cache
+        )
+    generated_questions = _fill_question_slots(bank_slots, new_questions)
+
+    duration = _finish_duration(db, pending_duration, assessment.title, job_info, generated_questions, assessment.additional_note)
+    db_assessment = _store_assessment(db, job_id, assessment, generated_questions, duration)
+    set_span_attributes(assessment_id=db_assessment.id, question_count=len(generated_questions), bank_questions=len(questions_types) - len(shortfall_types))
+    return db_assessment
+
+def _store_assessment(db: Session, job_id: str, assessment: AssessmentCreate, questions: list, duration: int) -> Assessment:
+    """Store a new assessment with its generated questions"""
+    # Convert the generated questions to JSON
+    questions_json = json.dumps([q.model_dump() for q in questions])
 
     db_assessment = Assessment(
         id=str(uuid.uuid4()),
         job_id=job_id,
         title=assessment.title,
         duration=duration,
+        duration_source=current_duration_source(),
         passing_score=assessment.passing_score,
         questions=questions_json,  # Store as JSON string
         active=True
@@ -91,161 +148,241 @@ def create_assessment(db: Session, job_id: str, assessment: AssessmentCreate) ->
     logger.info(f"Successfully created assessment with ID: {db_assessment.id} for job ID: {job_id}")
     return db_assessment
 
+async def stream_assessment_creation(bind: Engine, job_id: str, assessment: AssessmentCreate) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Create a new assessment, yielding its questions as they become available.
+
+    Questions from the question bank are yielded first, then each generated question as the
+    provider streams it. Yields ("question", question) events and a final ("done", {"id": ...})
+    once the assessment is stored. Database work runs in worker threads, each step in its own
+    short session on `bind`, so the event loop never waits on the database.
+    """
+    logger.info(f"Streaming creation of assessment for job ID: {job_id}, title: {assessment.title}")
+
+    job_info = await asyncio.to_thread(_in_own_session, bind, lambda db: _get_job_info(db, job_id))
+    if job_info is None:
+        logger.error(f"Job not found for ID: {job_id}")
+        raise ValueError(f"Job not found for ID: {job_id}")
+
+    questions_types = [qt.value for qt in assessment.questions_types]
+
+    bank_slots, shortfall_types = [None] * len(questions_types), questions_types
+    if settings.question_bank_enabled and not assessment.bypass_cache and not assessment.additional_note:
+        bank_slots, shortfall_types = await asyncio.to_thread(
+            _in_own_session, bind, lambda db: assemble_questions_from_bank(db, questions_types, job_info)
+        )
+        record_bank_lookup(len(questions_types) - len(shortfall_types), len(shortfall_types))
+
+    for slot in bank_slots:
+        if slot is not None:
+            yield "question", slot.model_dump(mode="json")
+
+    new_questions = []
+    if shortfall_types:
+        async for question in astream_questions(
+            title=assessment.title,
+            questions_types=shortfall_types,
+            additional_note=assessment.additional_note,
+            job_info=job_info,
+            bind=bind
+        ):
+            new_questions.append(question)
+            yield "question", question.model_dump(mode="json")
+    generated_questions = _fill_question_slots(bank_slots, new_questions)
+
+    # In llm mode the estimate calls the provider, which must not block the event loop either
+    duration = await asyncio.to_thread(_in_own_session, bind, lambda db: estimate_assessment_duration(
+        title=assessment.title,
+        job_info=job_info,
+        questions=generated_questions,
+        additional_note=assessment.additional_note,
+        db=db
+    ))
+    assessment_id = await asyncio.to_thread(
+        _in_own_session, bind, lambda db: _store_assessment(db, job_id, assessment, generated_questions, duration).id
+    )
+    yield "done", {"id": assessment_id}
+
+@traced()
 def update_assessment(db: Session, assessment_id: str, **kwargs) -> Optional[Assessment]:
     """Update an assessment"""
     logger.info(f"Updating assessment with ID: {assessment_id}")
     db_assessment = get_assessment(db, assessment_id)
     if db_assessment:
-        for key, value in kwargs.items():
-            if key == 'questions':
-                if isinstance(value, list):
-                    # Value is already a JSON string if coming from regenerate_assessment
-                    setattr(db_assessment, key, json.dumps([q.model_dump() if hasattr(q, 'model_dump') else q for q in value]))
-                    
-                    # If questions are being updated, recalculate the duration using AI
-                    from services.ai_service import estimate_assessment_duration
-                    from models.job import Job
-                    import json
-                    
-                    # Get the job information
-                    job = db.query(Job).filter(Job.id == db_assessment.job_id).first()
-                    job_info = {}
-                    if job:
-                        job_info = {
-                            "title": job.title,
-                            "seniority": job.seniority,
-                            "description": job.description,
-                            "skill_categories": json.loads(job.skill_categories) if job.skill_categories else []
-                        }
-                    
-                    # Parse the questions to pass to the AI
-                    questions = [q for q in value]
-                    
+        return _apply_assessment_updates(db, db_assessment, **kwargs)
+    logger.warning(f"Failed to update assessment - assessment not found: {assessment_id}")
+    return None
+
+def _apply_assessment_updates(db: Session, db_assessment: Assessment, **kwargs) -> Assessment:
+    """Apply updates to a loaded assessment, re-estimating the duration when its questions change"""
+    for key, value in kwargs.items():
+        if key == 'questions':
+            if isinstance(value, list):
+                setattr(db_assessment, key, json.dumps([q.model_dump() if hasattr(q, 'model_dump') else q for q in value]))
+
+                # If questions are being updated, recalculate the duration using AI
+                questions = [q for q in value]
+                duration = estimate_assessment_duration(
+                    title=db_assessment.title,
+                    job_info=_get_job_info(db, db_assessment.job_id) or {},
+                    questions=questions,
+                    additional_note=None,  # Use None or get from somewhere if available
+                    db=db
+                )
+                setattr(db_assessment, 'duration', duration)
+                setattr(db_assessment, 'duration_source', current_duration_source())
+            elif isinstance(value, str):
+                # Value is already a JSON string
+                setattr(db_assessment, key, value)
+
+                # If questions are being updated as a JSON string, parse them to estimate duration
+                try:
+                    from schemas.assessment import AssessmentQuestion
+
+                    # Convert parsed questions to AssessmentQuestion objects
+                    questions = [AssessmentQuestion(**q) for q in json.loads(value)]
+
                     # Estimate new duration based on updated questions
                     duration = estimate_assessment_duration(
                         title=db_assessment.title,
-                        job_info=job_info,
+                        job_info=_get_job_info(db, db_assessment.job_id) or {},
                         questions=questions,
-                        additional_note=None  # Use None or get from somewhere if available
+                        additional_note=None,  # Use None or get from somewhere if available
+                        db=db
                     )
                     setattr(db_assessment, 'duration', duration)
-                elif isinstance(value, str):
-                    # Value is already a JSON string
-                    setattr(db_assessment, key, value)
-                    
-                    # If questions are being updated as a JSON string, parse them to estimate duration
-                    try:
-                        parsed_questions = json.loads(value)
-                        from schemas.assessment import AssessmentQuestion
-                        from services.ai_service import estimate_assessment_duration
-                        from models.job import Job
-                        
-                        # Get the job information
-                        job = db.query(Job).filter(Job.id == db_assessment.job_id).first()
-                        job_info = {}
-                        if job:
-                            job_info = {
-                                "title": job.title,
-                                "seniority": job.seniority,
-                                "description": job.description,
-                                "skill_categories": json.loads(job.skill_categories) if job.skill_categories else []
-                            }
-                        
-                        # Convert parsed questions to AssessmentQuestion objects
-                        questions = [AssessmentQuestion(**q) for q in parsed_questions]
-                        
-                        # Estimate new duration based on updated questions
-                        duration = estimate_assessment_duration(
-                            title=db_assessment.title,
-                            job_info=job_info,
-                            questions=questions,
-                            additional_note=None  # Use None or get from somewhere if available
-                        )
-                        setattr(db_assessment, 'duration', duration)
-                    except Exception as e:
-                        logger.warning(f"Could not estimate duration from JSON questions: {str(e)}")
-                        # If parsing fails, we'll skip duration recalculation
-                else:
-                    # Handle other cases
-                    setattr(db_assessment, key, json.dumps(value))
-            elif key == 'duration':
-                # Skip setting duration since it's handled by AI
-                continue
+                    setattr(db_assessment, 'duration_source', current_duration_source())
+                except Exception as e:
+                    logger.warning(f"Could not estimate duration from JSON questions: {str(e)}")
+                    # If parsing fails, we'll skip duration recalculation
             else:
-                setattr(db_assessment, key, value)
-        db.commit()
-        db.refresh(db_assessment)
-        logger.info(f"Successfully updated assessment: {db_assessment.id}")
-        return db_assessment
-    logger.warning(f"Failed to update assessment - assessment not found: {assessment_id}")
-    return None
+                # Handle other cases
+                setattr(db_assessment, key, json.dumps(value))
+        elif key == 'duration':
+            # Skip setting duration since it's handled by AI
+            continue
+        else:
+            setattr(db_assessment, key, value)
+    db.commit()
+    db.refresh(db_assessment)
+    logger.info(f"Successfully updated assessment: {db_assessment.id}")
+    return db_assessment
 
+@traced()
 def regenerate_assessment(db: Session, assessment_id: str, **kwargs) -> Optional[Assessment]:
     """Regenerate an assessment"""
     logger.info(f"Regenerating assessment with ID: {assessment_id}")
 
-    # Check if questions_types is provided in kwargs to regenerate questions
-    if 'questions_types' in kwargs and kwargs['questions_types'] is not None:
-        # Get the assessment to access its title and job_id
-        assessment = get_assessment(db, assessment_id)
-        if not assessment:
-            logger.warning(f"Assessment not found for regeneration: {assessment_id}")
-            return None
+    # Regeneration asks for fresh questions unless the caller explicitly allows cached ones
+    bypass_cache = kwargs.pop('bypass_cache', True)
+
+    db_assessment = get_assessment(db, assessment_id)
+    if not db_assessment:
+        logger.warning(f"Failed to regenerate assessment - assessment not found: {assessment_id}")
+        return None
 
+    # Check if questions_types is provided in kwargs to regenerate questions
+    # (it is not a field in the Assessment model, so it never reaches the update)
+    questions_types = kwargs.pop('questions_types', None)
+    question_ids = kwargs.pop('question_ids', None)
+    replacement_types = kwargs.pop('replacement_types', None) or {}
+    if question_ids is not None:
+        if questions_types is not None:
+            raise ValueError("Provide either questions_types or question_ids, not both")
+        _replace_questions(db, db_assessment, question_ids, replacement_types, kwargs.get('additional_note', None), bypass_cache)
+    elif questions_types is not None:
         # Get the job information to include in the AI request
-        from .job_service import get_job
-        job = get_job(db, assessment.job_id)
-        if not job:
+        job_info = _get_job_info(db, db_assessment.job_id)
+        if job_info is None:
             logger.error(f"Job not found for assessment ID: {assessment_id}")
             raise ValueError(f"Job not found for assessment ID: {assessment_id}")
 
-        # Prepare job information for the AI service
-        import json
-        job_info = {
-            "title": job.title,
-            "seniority": job.seniority,
-            "description": job.description,
-            "skill_categories": json.loads(job.skill_categories) if job.skill_categories else []
-        }
+        questions_types = [getattr(qt, 'value', qt) for qt in questions_types]
+        additional_note = kwargs.get('additional_note', None)
+        title = db_assessment.title
+        pending_duration = _start_duration(db, title, job_info, questions_types, additional_note)
+        _release_connection(db)
 
         # Generate new questions using the AI service
-        additional_note = kwargs.get('additional_note', None)
         generated_questions = generate_questions(
-            title=assessment.title,
-            questions_types=kwargs['questions_types'],
+            title=title,
+            questions_types=questions_types,
             additional_note=additional_note,
-            job_info=job_info
+            job_info=job_info,
+            db=db,
+            bypass_cache=bypass_cache
         )
 
-        # Convert the generated questions to JSON
-        questions_json = json.dumps([q.model_dump() for q in generated_questions])
-
-        # Update the kwargs to use the generated questions
-        kwargs['questions'] = questions_json
-        
-        # Estimate the duration using AI
-        from services.ai_service import estimate_assessment_duration
-        # Get the original assessment to access its title
-        original_assessment = get_assessment(db, assessment_id)
-        duration = estimate_assessment_duration(
-            title=original_assessment.title,
+        # Set the questions and their duration directly so the update does not estimate it again
+        db_assessment.questions = json.dumps([q.model_dump() for q in generated_questions])
+        db_assessment.duration = _finish_duration(db, pending_duration, title, job_info, generated_questions, additional_note)
+        db_assessment.duration_source = current_duration_source()
+
+    # Update the assessment with the remaining data
+    result = _apply_assessment_updates(db, db_assessment, **kwargs)
+    logger.info(f"Successfully regenerated assessment: {result.id}")
+    return result
+
+def get_unknown_question_ids(db_assessment: Assessment, question_ids: List[str]) -> List[str]:
+    """Get the ids among question_ids that are not questions of the assessment"""
+    existing_ids = {q.get('id') for q in json.loads(db_assessment.questions or "[]")}
+    return [qid for qid in question_ids if qid not in existing_ids]
+
+def get_unreplaced_type_ids(question_ids: List[str], replacement_types: Dict[str, Any]) -> List[str]:
+    """Get the ids given a replacement type that are not among the questions being replaced"""
+    return [qid for qid in replacement_types if qid not in question_ids]
+
+def _replace_questions(db: Session, db_assessment: Assessment, question_ids: List[str], replacement_types: Dict[str, Any],
+                       additional_note: str = None, bypass_cache: bool = True) -> None:
+    """Generate replacements for the selected questions only, keeping the others and their ids unchanged"""
+    from schemas.assessment import AssessmentQuestion
+
+    unknown_ids = get_unknown_question_ids(db_assessment, question_ids)
+    if unknown_ids:
+        raise ValueError(f"Questions not found in assessment: {', '.join(unknown_ids)}")
+    unreplaced_ids = get_unreplaced_type_ids(question_ids, replacement_types)
+    if unreplaced_ids:
+        raise ValueError(f"Replacement types for questions that are not replaced: {', '.join(unreplaced_ids)}")
+    questions = [AssessmentQuestion(**q) for q in json.loads(db_assessment.questions or "[]")]
+
+    job_info = _get_job_info(db, db_assessment.job_id)
+    if job_info is None:
+        logger.error(f"Job not found for assessment ID: {db_assessment.id}")
+        raise ValueError(f"Job not found for assessment ID: {db_assessment.id}")
+
+    selected = set(question_ids)
+    final_types = [getattr(replacement_types.get(q.id, q.type), 'value', replacement_types.get(q.id, q.type)) for q in questions]
+    replaced_types = [question_type for q, question_type in zip(questions, final_types) if q.id in selected]
+    title, assessment_id = db_assessment.title, db_assessment.id
+    pending_duration = _start_duration(db, title, job_info, final_types, additional_note)
+    _release_connection(db)
+
+    logger.info(f"Replacing {len(replaced_types)} of {len(questions)} questions in assessment: {assessment_id}")
+    new_questions = []
+    if replaced_types:
+        new_questions = generate_questions(
+            title=title,
+            questions_types=replaced_types,
+            additional_note=additional_note,
             job_info=job_info,
-            questions=generated_questions,
-            additional_note=additional_note
+            db=db,
+            bypass_cache=bypass_cache
         )
-        kwargs['duration'] = duration
 
-        # Remove questions_types from kwargs as it's not a field in the Assessment model
-        del kwargs['questions_types']
+    # Keeping old questions in place of missing replacements would look like a successful regeneration
+    if len(new_questions) < len(replaced_types):
+        logger.error(f"AI provider returned {len(new_questions)} of {len(replaced_types)} replacement questions for assessment: {assessment_id}")
+        raise ValueError(f"Only {len(new_questions)} of {len(replaced_types)} replacement questions were generated")
 
-    # Update the assessment with the new data
-    result = update_assessment(db, assessment_id, **kwargs)
-    if result:
-        logger.info(f"Successfully regenerated assessment: {result.id}")
-    else:
-        logger.warning(f"Failed to regenerate assessment - assessment not found: {assessment_id}")
-    return result
+    # Replacements get fresh ids so answers to the old questions are never matched to them
+    replacements = iter(q.model_copy(update={"id": str(uuid.uuid4())}) for q in new_questions)
+    questions = [next(replacements) if q.id in selected else q for q in questions]
+
+    db_assessment.questions = json.dumps([q.model_dump() for q in questions])
+    db_assessment.duration = _finish_duration(db, pending_duration, title, job_info, questions, additional_note)
+    db_assessment.duration_source = current_duration_source()
 
+@traced()
 def delete_assessment(db: Session, assessment_id: str) -> bool:
     """Delete an assessment"""
     logger.info(f"Deleting assessment with ID: {assessment_id}")
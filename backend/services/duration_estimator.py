@@ -0,0 +1,173 @@
+from sqlalchemy.orm import Session
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+import json
+import math
+import os
+
+from models.assessment import Assessment
+from schemas.assessment import AssessmentQuestion
+from config import settings
+from logging_config import get_logger
+
+# Create logger for this module
+logger = get_logger(__name__)
+
+# Seconds a candidate needs per question feature; `scale` is the factor fitted by calibration
+DEFAULT_COEFFICIENTS: Dict[str, Any] = {
+    "base_minutes": 2.0,
+    "type_seconds": {
+        "choose_one": 45.0,
+        "choose_many": 75.0,
+        "text_based": 240.0
+    },
+    "option_seconds": 8.0,
+    "weight_seconds": 20.0,  # per weight point above 1
+    "char_seconds": 0.06,  # reading speed of about 1000 characters a minute
+    "seniority_factor": {
+        "intern": 1.2,
+        "junior": 1.1,
+        "mid": 1.0,
+        "senior": 1.0
+    },
+    # Assumed when only the question types are known
+    "default_text_chars": 150,
+    "default_option_count": 4,
+    "default_weight": 3,
+    "scale": 1.0
+}
+
+# Where a stored assessment duration came from; calibration only fits to durations the local estimator did not produce
+DURATION_SOURCE_LOCAL = "local"
+DURATION_SOURCE_LLM = "llm"
+
+@lru_cache(maxsize=None)
+def _load_coefficients(path: Optional[str]) -> Dict[str, Any]:
+    """Merge calibrated coefficients from a JSON file over the defaults"""
+    coefficients = json.loads(json.dumps(DEFAULT_COEFFICIENTS))
+    if path and os.path.exists(path):
+        with open(path) as coefficients_file:
+            overrides = json.load(coefficients_file)
+        for key, value in overrides.items():
+            if isinstance(value, dict) and isinstance(coefficients.get(key), dict):
+                coefficients[key].update(value)
+            else:
+                coefficients[key] = value
+        logger.info(f"Loaded duration estimator coefficients from {path}")
+    return coefficients
+
+def get_coefficients() -> Dict[str, Any]:
+    """Get the duration estimator coefficients in use"""
+    return _load_coefficients(settings.duration_coefficients_path)
+
+def _question_seconds(question_type: str, option_count: int, weight: int, text_chars: int, coefficients: Dict[str, Any]) -> float:
+    """Estimate the seconds a candidate needs for one question"""
+    seconds = coefficients["type_seconds"].get(question_type, coefficients["type_seconds"]["text_based"])
+    seconds += option_count * coefficients["option_seconds"]
+    seconds += max(0, weight - 1) * coefficients["weight_seconds"]
+    seconds += text_chars * coefficients["char_seconds"]
+    return seconds
+
+def _sum_question_seconds(questions: List[AssessmentQuestion], coefficients: Dict[str, Any]) -> float:
+    """Estimate the seconds a candidate needs for all questions"""
+    return sum(
+        _question_seconds(
+            getattr(question.type, 'value', question.type),
+            len(question.options or []),
+            question.weight,
+            len(question.text) + sum(len(option.text) for option in question.options or []),
+            coefficients
+        )
+        for question in questions
+    )
+
+def _unscaled_minutes(question_seconds: float, job_info: dict, coefficients: Dict[str, Any]) -> float:
+    """Minutes for the summed question time before scaling and rounding"""
+    seniority = getattr((job_info or {}).get('seniority'), 'value', (job_info or {}).get('seniority'))
+    factor = coefficients["seniority_factor"].get(seniority, 1.0)
+    return coefficients["base_minutes"] + question_seconds / 60 * factor
+
+def _to_minutes(question_seconds: float, job_info: dict, coefficients: Dict[str, Any]) -> int:
+    """Turn the summed question time into whole minutes clamped to 1-180"""
+    minutes = _unscaled_minutes(question_seconds, job_info, coefficients) * coefficients["scale"]
+    return max(1, min(180, math.ceil(minutes)))
+
+def estimate_duration_minutes(questions: List[AssessmentQuestion], job_info: dict = None, coefficients: Dict[str, Any] = None) -> int:
+    """
+    Estimate an assessment's duration from its questions without calling an AI provider.
+
+    Args:
+        questions: The questions in the assessment
+        job_info: Information about the job, of which the seniority is used
+        coefficients: Coefficients to use instead of the configured ones
+
+    Returns:
+        Estimated duration in minutes (1-180)
+    """
+    coefficients = coefficients or get_coefficients()
+    return _to_minutes(_sum_question_seconds(questions, coefficients), job_info, coefficients)
+
+def estimate_duration_for_types(questions_types: List[str], job_info: dict = None, coefficients: Dict[str, Any] = None) -> int:
+    """Estimate an assessment's duration when only its question types are known"""
+    coefficients = coefficients or get_coefficients()
+    seconds = 0.0
+    for question_type in questions_types:
+        question_type = getattr(question_type, 'value', question_type)
+        option_count = 0 if question_type == 'text_based' else coefficients["default_option_count"]
+        seconds += _question_seconds(question_type, option_count, coefficients["default_weight"], coefficients["default_text_chars"], coefficients)
+    return _to_minutes(seconds, job_info, coefficients)
+
+def current_duration_source() -> str:
+    """Source of the durations estimated in the configured mode"""
+    return DURATION_SOURCE_LOCAL if settings.duration_estimator_mode == "local" else DURATION_SOURCE_LLM
+
+def calibrate_scale(samples: List[Dict[str, Any]], coefficients: Dict[str, Any] = None) -> Dict[str, Any]:
+    """
+    Fit the scale coefficient to observed durations.
+
+    Args:
+        samples: Dicts with 'questions', 'job_info' and the observed 'duration' in minutes
+        coefficients: Coefficients to start from instead of the configured ones
+
+    Returns:
+        The coefficients with a least-squares fitted scale
+    """
+    coefficients = json.loads(json.dumps(coefficients or get_coefficients()))
+    # Unclamped predictions at scale 1, so the fit isn't distorted by rounding
+    predicted = [_unscaled_minutes(_sum_question_seconds(sample['questions'], coefficients), sample.get('job_info'), coefficients) for sample in samples]
+    observed = [sample['duration'] for sample in samples]
+
+    denominator = sum(p * p for p in predicted)
+    if denominator:
+        coefficients["scale"] = round(sum(p * o for p, o in zip(predicted, observed)) / denominator, 4)
+    logger.info(f"Calibrated duration scale to {coefficients['scale']} from {len(samples)} samples")
+    return coefficients
+
+def calibrate_from_assessments(db: Session, path: str, limit: int = 1000) -> Dict[str, Any]:
+    """
+    Fit the scale to the durations of stored assessments and write the coefficients to a JSON file.
+
+    Durations the local estimator produced are skipped, since fitting to them only reproduces
+    the current scale, as are those stored before their source was recorded.
+    """
+    from services.assessment_service import _get_job_info
+
+    samples = []
+    job_infos: Dict[str, Optional[dict]] = {}
+    assessments = db.query(Assessment).filter(
+        Assessment.duration.isnot(None),
+        Assessment.duration_source.isnot(None),
+        Assessment.duration_source != DURATION_SOURCE_LOCAL
+    ).limit(limit).all()
+    for assessment in assessments:
+        if assessment.job_id not in job_infos:
+            job_infos[assessment.job_id] = _get_job_info(db, assessment.job_id)
+        questions = [AssessmentQuestion(**q) for q in json.loads(assessment.questions or "[]")]
+        if questions:
+            samples.append({"questions": questions, "job_info": job_infos[assessment.job_id], "duration": assessment.duration})
+
+    coefficients = calibrate_scale(samples)
+    with open(path, "w") as coefficients_file:
+        json.dump(coefficients, coefficients_file, indent=2, sort_keys=True)
+    _load_coefficients.cache_clear()
+    return coefficients
@@ -5,6 +5,7 @@ import json
 
 from models.job import Job
 from schemas.job import JobCreate, JobUpdate
+from services.pregeneration_service import schedule_pregeneration, cancel_pregeneration
 from logging_config import get_logger
 
 # Create logger for this module
@@ -49,6 +50,9 @@ def create_job(db: Session, job: JobCreate) -> Job:
     db.commit()
     db.refresh(db_job)
     logger.info(f"Successfully created job with ID: {db_job.id}")
+
+    # Fill the question bank for this job before HR asks for an assessment
+    schedule_pregeneration(db, db_job)
     return db_job
 
 def update_job(db: Session, job_id: str, **kwargs) -> Optional[Job]:
@@ -73,6 +77,7 @@ def delete_job(db: Session, job_id: str) -> bool:
     logger.info(f"Deleting job with ID: {job_id}")
     db_job = get_job(db, job_id)
     if db_job:
+        cancel_pregeneration(job_id)
         db.delete(db_job)
         db.commit()
         logger.info(f"Successfully deleted job: {db_job.id}")
@@ -0,0 +1,177 @@
+from sqlalchemy.orm import Session
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import deque
+from typing import Any, Dict, Optional
+import contextvars
+import threading
+import time
+import json
+
+from models.job import Job
+from schemas.enums import QuestionType
+import services.ai_service as ai_service
+from services.ai_service import generate_questions
+from services.question_service import add_questions_to_bank
+from integrations.ai_integration.scheduling import BULK, call_priority
+from config import settings
+from logging_config import get_logger
+
+# Create logger for this module
+logger = get_logger(__name__)
+
+# A single worker keeps speculative generations from competing with interactive requests
+_executor: Optional[ThreadPoolExecutor] = None
+_pending: Dict[str, "_PregenerationTask"] = {}
+_started_at: deque = deque()
+_lock = threading.Lock()
+_stats: Dict[str, int] = {
+    "scheduled": 0,
+    "skipped_over_budget": 0,
+    "completed": 0,
+    "failed": 0,
+    "cancelled": 0,
+    "questions_generated": 0,
+    "bank_hits": 0,
+    "bank_misses": 0
+}
+
+
+class _PregenerationTask:
+    """A scheduled pre-generation and the event used to cancel it"""
+
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+        self.cancelled = threading.Event()
+        self.future: Optional[Future] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Create the background worker on first use"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pregeneration")
+    return _executor
+
+def _increment(stat: str, amount: int = 1) -> None:
+    with _lock:
+        _stats[stat] += amount
+
+def _within_budget() -> bool:
+    """Check the pending and hourly budgets; must be called with the lock held"""
+    now = time.monotonic()
+    while _started_at and now - _started_at[0] > 3600:
+        _started_at.popleft()
+    return (len(_pending) < settings.pregeneration_max_pending_jobs
+            and len(_started_at) < settings.pregeneration_max_jobs_per_hour)
+
+def schedule_pregeneration(db: Session, job: Job) -> bool:
+    """
+    Schedule a low-priority generation of question bank entries for a new job.
+
+    Args:
+        db: Database session whose bind the background worker uses
+        job: The job to generate candidate questions for
+
+    Returns:
+        True if the pre-generation was scheduled, False if it is disabled or over budget
+    """
+    if not settings.pregeneration_enabled:
+        return False
+
+    job_info = {
+        "title": job.title,
+        "seniority": job.seniority,
+        "description": job.description,
+        "skill_categories": json.loads(job.skill_categories) if job.skill_categories else []
+    }
+    task = _PregenerationTask(job.id)
+    with _lock:
+        if job.id in _pending:
+            return True
+        if not _within_budget():
+            _stats["skipped_over_budget"] += 1
+            logger.info(f"Skipping question pre-generation for job {job.id}: budget exhausted")
+            return False
+        _pending[job.id] = task
+        _started_at.append(time.monotonic())
+        _stats["scheduled"] += 1
+
+    task.future = _get_executor().submit(contextvars.copy_context().run, _run_pregeneration, task, db.get_bind(), job_info)
+    logger.info(f"Scheduled question pre-generation for job {job.id}")
+    return True
+
+def _run_pregeneration(task: _PregenerationTask, bind: Any, job_info: Dict[str, Any]) -> None:
+    """Generate candidate questions for a job and store them in the question bank"""
+    try:
+        # Give interactive requests a head start before using the AI provider
+        if task.cancelled.wait(settings.pregeneration_delay_seconds):
+            return
+
+        questions_types = [qt.value for qt in QuestionType for _ in range(settings.pregeneration_questions_per_type)]
+        provider = ai_service.DEFAULT_PROVIDER
+        # Bulk priority keeps pre-generation from delaying interactive AI calls. Without a session
+        # nothing is stored yet, so a job deleted during generation gets no questions in the bank
+        with call_priority(BULK):
+            questions = generate_questions(
+                title=f"{job_info['title']} question pool",
+                questions_types=questions_types,
+                job_info=job_info,
+                provider=provider
+            )
+        if task.cancelled.is_set():
+            logger.info(f"Discarded {len(questions)} questions pre-generated for cancelled job {task.job_id}")
+            return
+
+        # The question bank is where create_assessment finds them
+        with Session(bind=bind) as db:
+            add_questions_to_bank(db, questions, job_info=job_info, source_provider=provider.value)
+        _increment("questions_generated", len(questions))
+        _increment("completed")
+        logger.info(f"Pre-generated {len(questions)} questions for job {task.job_id}")
+    except Exception as e:
+        _increment("failed")
+        logger.warning(f"Question pre-generation failed for job {task.job_id}: {str(e)}")
+    finally:
+        with _lock:
+            _pending.pop(task.job_id, None)
+
+def cancel_pregeneration(job_id: str) -> bool:
+    """Cancel a job's pending pre-generation, returning whether there was one"""
+    with _lock:
+        task = _pending.pop(job_id, None)
+    if task is None:
+        return False
+
+    task.cancelled.set()
+    if task.future is not None:
+        task.future.cancel()
+    _increment("cancelled")
+    logger.info(f"Cancelled question pre-generation for job {job_id}")
+    return True
+
+def record_bank_lookup(hits: int, misses: int) -> None:
+    """Record how many assessment questions were served from the question bank"""
+    with _lock:
+        _stats["bank_hits"] += hits
+        _stats["bank_misses"] += misses
+
+def get_pregeneration_stats() -> Dict[str, Any]:
+    """Get pre-generation counters and the question bank hit rate"""
+    with _lock:
+        stats: Dict[str, Any] = dict(_stats)
+        stats["pending"] = len(_pending)
+    lookups = stats["bank_hits"] + stats["bank_misses"]
+    stats["bank_hit_rate"] = stats["bank_hits"] / lookups if lookups else 0.0
+    return stats
+
+def shutdown_pregeneration() -> None:
+    """Cancel pending pre-generations and stop the background worker"""
+    global _executor
+    with _lock:
+        tasks = list(_pending.values())
+        _pending.clear()
+    for task in tasks:
+        task.cancelled.set()
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
@@ -1,11 +1,60 @@
+from sqlalchemy import func
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy.exc import SQLAlchemyError
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+import hashlib
+import json
+import uuid
 
 from models.question import Question
+from models.question_tag import QuestionTag
+from schemas.assessment import AssessmentQuestion, AssessmentQuestionOption
 from schemas.question import QuestionCreate, QuestionUpdate
-from services.base_service import get_item_by_id, get_items, create_item, update_item
+from schemas.enums import QuestionType
+from services.base_service import get_item_by_id, get_items, update_item
+from logging_config import get_logger
 
-def get_question(db: Session, question_id: int) -> Optional[Question]:
+# Create logger for this module
+logger = get_logger(__name__)
+
+# Difficulty assumed for generated questions, which are written for the job's seniority
+SENIORITY_DIFFICULTY = {
+    "intern": "easy",
+    "junior": "easy",
+    "mid": "medium",
+    "senior": "hard"
+}
+
+def _text_hash(question_type: str, text: str) -> str:
+    """Hash a question's type and normalized text to detect duplicates"""
+    normalized = " ".join(text.lower().split())
+    return hashlib.sha256(f"{question_type}:{normalized}".encode("utf-8")).hexdigest()
+
+def _normalize_tag(tag_name: str) -> str:
+    """Normalize a skill category so tags match regardless of case and spacing"""
+    return tag_name.strip().lower()
+
+def _build_question(question_type: str, text: str, weight: int, skill_categories: List[str], options, correct_options,
+                    seniority: Optional[str], difficulty: Optional[str], source_provider: Optional[str]) -> Tuple[Question, List[QuestionTag]]:
+    """Build a bank question and its tags without adding them to a session"""
+    db_question = Question(
+        id=str(uuid.uuid4()),
+        text=text,
+        text_hash=_text_hash(question_type, text),
+        type=question_type,
+        weight=weight,
+        options=json.dumps([opt.model_dump() if hasattr(opt, 'model_dump') else opt for opt in options or []]),
+        correct_options=json.dumps(list(correct_options or [])),
+        seniority=seniority,
+        difficulty=difficulty or SENIORITY_DIFFICULTY.get(seniority),
+        source_provider=source_provider
+    )
+    tags = [QuestionTag(id=str(uuid.uuid4()), question_id=db_question.id, tag_name=tag)
+            for tag in sorted({_normalize_tag(category) for category in skill_categories if category.strip()})]
+    return db_question, tags
+
+def get_question(db: Session, question_id: str) -> Optional[Question]:
     """Get question by ID"""
     return get_item_by_id(db, Question, question_id)
 
@@ -13,18 +62,137 @@ def get_questions(db: Session, skip: int = 0, limit: int = 100) -> List[Question
     """Get list of questions"""
     return get_items(db, Question, skip, limit)
 
-def get_questions_by_assessment(db: Session, assessment_id: int, skip: int = 0, limit: int = 100) -> List[Question]:
-    """Get list of questions by assessment ID"""
-    return db.query(Question).filter(Question.assessment_id == assessment_id).offset(skip).limit(limit).all()
+def get_questions_by_tag(db: Session, tag_name: str, skip: int = 0, limit: int = 100) -> List[Question]:
+    """Get list of questions tagged with a skill category"""
+    tagged_ids = db.query(QuestionTag.question_id).filter(QuestionTag.tag_name == _normalize_tag(tag_name))
+    return db.query(Question).filter(Question.id.in_(tagged_ids)).offset(skip).limit(limit).all()
 
 def create_question(db: Session, question: QuestionCreate) -> Question:
-    """Create a new question"""
-    db_question = Question(**question.dict())
-    return create_item(db, db_question)
+    """Create a new question in the bank together with its skill tags"""
+    db_question, tags = _build_question(
+        question.type.value, question.text, question.weight, question.skill_categories, question.options,
+        question.correct_options, question.seniority.value if question.seniority else None, question.difficulty,
+        question.source_provider
+    )
+    db.add(db_question)
+    db.add_all(tags)
+    db.commit()
+    db.refresh(db_question)
+    return db_question
 
-def update_question(db: Session, question_id: int, question_update: QuestionUpdate) -> Optional[Question]:
+def update_question(db: Session, question_id: str, question_update: QuestionUpdate) -> Optional[Question]:
     """Update a question"""
     db_question = get_question(db, question_id)
     if db_question:
-        return update_item(db, db_question, **question_update.dict(exclude_unset=True))
-    return None
\ No newline at end of file
+        changes = question_update.dict(exclude_unset=True)
+        if 'options' in changes:
+            changes['options'] = json.dumps(changes['options'] or [])
+        if 'correct_options' in changes:
+            changes['correct_options'] = json.dumps(changes['correct_options'] or [])
+        if 'text' in changes:
+            changes['text_hash'] = _text_hash(db_question.type, changes['text'])
+        return update_item(db, db_question, **changes)
+    return None
+
+def add_questions_to_bank(db: Session, questions: List[AssessmentQuestion], job_info: dict = None, source_provider: str = None) -> int:
+    """
+    Store generated questions in the question bank, skipping ones it already holds.
+
+    Returns:
+        Number of questions added
+    """
+    seniority = (job_info or {}).get('seniority')
+    seniority = getattr(seniority, 'value', seniority)
+    # Bank writes use their own session so a failure never affects the caller's transaction
+    try:
+        with Session(bind=db.get_bind()) as bank_db:
+            new_questions = {}
+            for question in questions:
+                question_type = QuestionType(question.type).value
+                new_questions.setdefault(_text_hash(question_type, question.text), (question_type, question))
+
+            existing_hashes = {
+                text_hash for (text_hash,) in
+                bank_db.query(Question.text_hash).filter(Question.text_hash.in_(list(new_questions)))
+            }
+
+            added = 0
+            for text_hash, (question_type, question) in new_questions.items():
+                if text_hash in existing_hashes:
+                    continue
+                db_question, tags = _build_question(
+                    question_type, question.text, question.weight, question.skill_categories, question.options,
+                    question.correct_options, seniority, None, source_provider
+                )
+                bank_db.add(db_question)
+                bank_db.add_all(tags)
+                added += 1
+
+            bank_db.commit()
+            logger.info(f"Added {added} of {len(questions)} generated questions to the question bank")
+            return added
+    except SQLAlchemyError as e:
+        logger.warning(f"Could not add questions to the question bank: {str(e)}")
+        return 0
+
+def _to_assessment_question(db_question: Question, tags: List[str]) -> AssessmentQuestion:
+    """Convert a bank question to the question format stored in assessments"""
+    return AssessmentQuestion(
+        id=db_question.id,
+        text=db_question.text,
+        weight=db_question.weight,
+        skill_categories=tags or ["general"],
+        type=QuestionType(db_question.type),
+        options=[AssessmentQuestionOption(**opt) for opt in json.loads(db_question.options or "[]")],
+        correct_options=json.loads(db_question.correct_options or "[]")
+    )
+
+def find_bank_questions(db: Session, question_type: str, limit: int, seniority: str = None, skill_categories: List[str] = None,
+                        difficulty: str = None) -> List[AssessmentQuestion]:
+    """Pick up to `limit` random bank questions of a type matching the seniority, difficulty and any of the skills"""
+    query = db.query(Question).filter(Question.type == question_type)
+    if seniority:
+        query = query.filter(Question.seniority == seniority)
+    if difficulty:
+        query = query.filter(Question.difficulty == difficulty)
+    if skill_categories:
+        tags = [_normalize_tag(category) for category in skill_categories]
+        query = query.filter(Question.id.in_(db.query(QuestionTag.question_id).filter(QuestionTag.tag_name.in_(tags))))
+    db_questions = query.order_by(func.random()).limit(limit).all()
+
+    tags_by_question: Dict[str, List[str]] = {}
+    if db_questions:
+        question_tags = db.query(QuestionTag).filter(QuestionTag.question_id.in_([q.id for q in db_questions])).all()
+        for tag in question_tags:
+            tags_by_question.setdefault(tag.question_id, []).append(tag.tag_name)
+
+    return [_to_assessment_question(q, sorted(tags_by_question.get(q.id, []))) for q in db_questions]
+
+def assemble_questions_from_bank(db: Session, questions_types: List[str], job_info: dict = None) -> Tuple[List[Optional[AssessmentQuestion]], List[str]]:
+    """
+    Fill as many of the requested question slots as possible from the question bank.
+
+    Returns:
+        The slots in request order (None where the bank had no matching question),
+        and the question types that still have to be generated
+    """
+    job_info = job_info or {}
+    seniority = getattr(job_info.get('seniority'), 'value', job_info.get('seniority'))
+    skill_categories = job_info.get('skill_categories') or []
+
+    available = {
+        question_type: find_bank_questions(db, question_type, count, seniority=seniority, skill_categories=skill_categories)
+        for question_type, count in Counter(questions_types).items()
+    }
+
+    slots = []
+    shortfall_types = []
+    for question_type in questions_types:
+        if available[question_type]:
+            slots.append(available[question_type].pop())
+        else:
+            slots.append(None)
+            shortfall_types.append(question_type)
+
+    logger.info(f"Assembled {len(questions_types) - len(shortfall_types)} of {len(questions_types)} questions from the question bank")
+    return slots, shortfall_types
@@ -1,11 +1,19 @@
+from uuid import uuid4
+
 import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from fastapi.testclient import TestClient
 
 from main import app
-from database.database import get_db
+from database.database import get_read_db, get_write_db
 from models.base import Base
+from models.job import Job
+from models.user import User
+from utils.dependencies import get_current_user
+from integrations.ai_integration.ai_factory import AIProvider
+import services.ai_service
+from integrations.ai_integration.resilience import reset_circuit_breakers
 
 
 # Create a test database session
@@ -23,8 +31,9 @@ def override_get_db():
         db.close()
 
 
-# Override the database dependency
-app.dependency_overrides[get_db] = override_get_db
+# Override the database dependencies; reads and writes share the test database
+app.dependency_overrides[get_write_db] = override_get_db
+app.dependency_overrides[get_read_db] = override_get_db
 
 
 @pytest.fixture(scope="session")
@@ -50,8 +59,33 @@ def db_session(db_engine):
     connection.close()
 
 
+@pytest.fixture(autouse=True)
+def closed_circuit_breakers():
+    """Keep provider failures simulated by one test from opening circuits for the next"""
+    yield
+    reset_circuit_breakers()
+
+
 @pytest.fixture(scope="module")
 def client():
     """Create a test client."""
     with TestClient(app) as test_client:
-        yield test_client
\ No newline at end of file
+        yield test_client
+
+
+@pytest.fixture
+def hr_client(client, db_engine, monkeypatch):
+    """Client authenticated as an HR user, generating with the mock provider"""
+    monkeypatch.setattr(services.ai_service, "DEFAULT_PROVIDER", AIProvider.MOCK)
+    with TestingSessionLocal() as db:
+        hr_user = User(id=str(uuid4()), first_name="Hana", last_name="Rami", email=f"hr-{uuid4()}@example.com", password="x", role="hr")
+        job_id = str(uuid4())
+        job = Job(id=job_id, title="QA Engineer", seniority="junior", skill_categories='["testing"]')
+        db.add_all([hr_user, job])
+        db.commit()
+        db.refresh(hr_user)
+        db.expunge(hr_user)
+
+    app.dependency_overrides[get_current_user] = lambda: hr_user
+    yield client, job_id
+    app.dependency_overrides.pop(get_current_user, None)
@@ -0,0 +1,89 @@
+from config import settings
+from integrations.ai_integration.ai_factory import AIProvider
+from integrations.ai_integration.mock_ai_generator import MockAIGenerator
+from models.ai_cache import AICacheEntry
+from services.ai_cache_service import make_cache_key, get_cached_value, set_cached_value, delete_expired_entries
+from services.ai_service import generate_questions, estimate_assessment_duration
+
+
+JOB_INFO = {
+    "title": "Backend Engineer",
+    "seniority": "mid",
+    "description": "Python and SQL",
+    "skill_categories": ["python", "sql"]
+}
+
+
+def test_cache_key_is_canonical():
+    """Keys ignore dict ordering but change with any request field"""
+    first = make_cache_key("questions", {"title": "A", "job_info": {"x": 1, "y": 2}})
+    reordered = make_cache_key("questions", {"job_info": {"y": 2, "x": 1}, "title": "A"})
+    different = make_cache_key("questions", {"title": "B", "job_info": {"x": 1, "y": 2}})
+
+    assert first == reordered
+    assert first != different
+    assert first != make_cache_key("duration", {"title": "A", "job_info": {"x": 1, "y": 2}})
+
+
+def test_cached_value_expires(db_session):
+    """Entries are not returned once their TTL has passed"""
+    set_cached_value(db_session, "fresh-key", "duration", 42, ttl_seconds=60)
+    set_cached_value(db_session, "stale-key", "duration", 42, ttl_seconds=-1)
+
+    assert get_cached_value(db_session, "fresh-key") == 42
+    assert get_cached_value(db_session, "stale-key") is None
+    assert get_cached_value(db_session, "missing-key") is None
+
+
+def test_expired_entries_are_deleted(db_session):
+    set_cached_value(db_session, "kept-key", "duration", 1, ttl_seconds=60)
+    set_cached_value(db_session, "expired-key", "duration", 1, ttl_seconds=-1)
+
+    assert delete_expired_entries(db_session) >= 1
+    keys = {key for (key,) in db_session.query(AICacheEntry.key).filter(AICacheEntry.key.in_(["kept-key", "expired-key"]))}
+    assert keys == {"kept-key"}
+
+
+def test_generate_questions_uses_cache_unless_bypassed(db_session):
+    """Identical requests are served from the cache; bypass_cache asks the provider again"""
+    kwargs = dict(
+        title="Cached Assessment",
+        questions_types=["choose_one", "text_based"],
+        additional_note="cache test",
+        job_info=JOB_INFO,
+        provider=AIProvider.MOCK,
+        db=db_session
+    )
+
+    first = generate_questions(**kwargs)
+    second = generate_questions(**kwargs)
+    fresh = generate_questions(**kwargs, bypass_cache=True)
+    after_refresh = generate_questions(**kwargs)
+
+    # The mock provider assigns random ids, so equal ids mean the cache was used
+    assert [q.id for q in second] == [q.id for q in first]
+    assert [q.id for q in fresh] != [q.id for q in first]
+    assert [q.id for q in after_refresh] == [q.id for q in fresh]
+
+
+def test_duration_estimate_is_cached_per_question_set(db_session, monkeypatch):
+    """The provider is only asked again when the question set changes"""
+    monkeypatch.setattr(settings, "duration_estimator_mode", "llm")
+    calls = []
+
+    def counting_estimate(self, prompt):
+        calls.append(prompt)
+        return "17"
+
+    monkeypatch.setattr(MockAIGenerator, "estimate_duration", counting_estimate)
+    questions = generate_questions("Duration Assessment", ["choose_one"], job_info=JOB_INFO, provider=AIProvider.MOCK)
+    other_questions = generate_questions("Duration Assessment", ["text_based"], job_info=JOB_INFO, provider=AIProvider.MOCK)
+
+    durations = [
+        estimate_assessment_duration("Duration Assessment", JOB_INFO, questions, provider=AIProvider.MOCK, db=db_session),
+        estimate_assessment_duration("Duration Assessment", JOB_INFO, questions, provider=AIProvider.MOCK, db=db_session),
+        estimate_assessment_duration("Duration Assessment", JOB_INFO, other_questions, provider=AIProvider.MOCK, db=db_session),
+    ]
+
+    assert durations == [17, 17, 17]
+    assert len(calls) == 2
@@ -0,0 +1,111 @@
+import asyncio
+from types import SimpleNamespace
+
+from config import settings
+from integrations.ai_integration.instrumentation import (
+    AI_CALLS, AI_COST, AI_TOKENS, InstrumentedAIGenerator, _call_usage, estimate_cost, record_token_usage
+)
+from integrations.ai_integration.mistral_generator import MistralGenerator
+from integrations.ai_integration.mock_ai_generator import MockAIGenerator
+from integrations.ai_integration.resilience import CircuitBreaker, ResilientAIGenerator
+
+
+class UsageReportingGenerator(MockAIGenerator):
+    """Reports token usage like a real provider, failing the first `failures` calls"""
+
+    model = "mistral-small-latest"
+
+    def __init__(self, failures=0):
+        self.failures = failures
+
+    def estimate_duration(self, prompt):
+        record_token_usage(100, 50)
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("503")
+        return "30"
+
+
+def _value(counter, **labels):
+    key = tuple(str(labels.get(label, "")) for label in counter.labels)
+    return counter.values().get(key, 0.0)
+
+
+def test_call_records_tokens_cost_and_status():
+    generator = InstrumentedAIGenerator(UsageReportingGenerator(), "test-usage")
+    labels = dict(provider="test-usage", model="mistral-small-latest", method="estimate_duration", route="background")
+
+    assert generator.estimate_duration("prompt") == "30"
+
+    assert _value(AI_CALLS, status="ok", **labels) == 1
+    assert _value(AI_TOKENS, kind="prompt", **labels) == 100
+    assert _value(AI_TOKENS, kind="completion", **labels) == 50
+    assert _value(AI_COST, provider="test-usage", model="mistral-small-latest", route="background") == estimate_cost("mistral-small-latest", 100, 50)
+
+
+def test_tokens_of_retried_attempts_add_up(monkeypatch):
+    monkeypatch.setattr(settings, "ai_retry_backoff_seconds", 0.01)
+    generator = InstrumentedAIGenerator(
+        ResilientAIGenerator(UsageReportingGenerator(failures=1), CircuitBreaker("test-retry", 5, 30.0)), "test-retry"
+    )
+    labels = dict(provider="test-retry", model="mistral-small-latest", method="estimate_duration", route="background")
+
+    generator.estimate_duration("prompt")
+
+    assert _value(AI_CALLS, status="ok", **labels) == 1
+    assert _value(AI_TOKENS, kind="prompt", **labels) == 200
+
+
+def test_stream_closed_early_is_recorded_as_cancelled():
+    generator = InstrumentedAIGenerator(MockAIGenerator(), "test-cancel")
+    labels = dict(provider="test-cancel", model=generator.model or "unknown", method="astream_questions", route="background")
+
+    async def read_first_question():
+        stream = generator.astream_questions("Logic", ["choose_one", "text_based"])
+        await stream.__anext__()
+        await stream.aclose()
+        return _call_usage.get()
+
+    # The call's usage is released rather than leaking into the reader's context
+    assert asyncio.run(read_first_question()) is None
+    assert _value(AI_CALLS, status="cancelled", **labels) == 1
+    assert _value(AI_CALLS, status="ok", **labels) == 0
+
+
+def test_estimate_cost_uses_configured_prices(monkeypatch):
+    monkeypatch.setattr(settings, "ai_token_prices_usd_per_million", {"priced-model": [1.0, 4.0]})
+
+    assert estimate_cost("priced-model", 1_000_000, 500_000) == 3.0
+    assert estimate_cost("unpriced-model", 1_000_000, 500_000) == 0.0
+
+
+def test_mistral_reports_response_usage():
+    generator = MistralGenerator.__new__(MistralGenerator)
+    generator.model = "mistral-small-latest"
+    response = SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content="12"))],
+        usage=SimpleNamespace(prompt_tokens=40, completion_tokens=2)
+    )
+    generator.client = SimpleNamespace(chat=SimpleNamespace(complete=lambda **kwargs: response))
+    instrumented = InstrumentedAIGenerator(generator, "test-mistral")
+
+    instrumented.estimate_duration("prompt")
+
+    labels = dict(provider="test-mistral", model="mistral-small-latest", method="estimate_duration", route="background")
+    assert _value(AI_TOKENS, kind="prompt", **labels) == 40
+    assert _value(AI_TOKENS, kind="completion", **labels) == 2
+
+
+def test_metrics_endpoint_attributes_calls_to_routes(hr_client):
+    client, job_id = hr_client
+    client.post(f"/api/assessments/jobs/{job_id}/stream", json={
+        "title": "Instrumented Assessment",
+        "passing_score": 60,
+        "questions_types": ["text_based"],
+        "bypass_cache": True
+    })
+
+    stats = client.get("/api/metrics/ai").json()
+
+    assert stats["routes"]["POST /api/assessments/jobs/{id}/stream"]["calls"] >= 1
+    assert "ai_call_latency_seconds" in stats["metrics"]
@@ -0,0 +1,155 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from config import settings
+from integrations.ai_integration.mock_ai_generator import MockAIGenerator
+from integrations.ai_integration.resilience import AICallTimeoutError, CircuitBreaker, CircuitOpenError, ResilientAIGenerator
+
+
+class ScriptedGenerator(MockAIGenerator):
+    """Answers estimate_duration from a script of delays and errors, one entry per call"""
+
+    def __init__(self, script):
+        self.script = list(script)
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def _next(self):
+        with self.lock:
+            step = self.script[min(self.calls, len(self.script) - 1)]
+            self.calls += 1
+        delay, outcome = step
+        return delay, outcome
+
+    def estimate_duration(self, prompt):
+        delay, outcome = self._next()
+        time.sleep(delay)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    async def aestimate_duration(self, prompt):
+        delay, outcome = self._next()
+        await asyncio.sleep(delay)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture(autouse=True)
+def fast_policy(monkeypatch):
+    monkeypatch.setattr(settings, "ai_retry_backoff_seconds", 0.01)
+    monkeypatch.setattr(settings, "ai_max_retries", 2)
+    monkeypatch.setattr(settings, "ai_call_timeout_seconds", 1.0)
+    monkeypatch.setattr(settings, "ai_call_deadline_seconds", 5.0)
+    monkeypatch.setattr(settings, "ai_hedge_after_seconds", None)
+
+
+def _resilient(script, fallback=None, threshold=5, reset_seconds=30.0):
+    return ResilientAIGenerator(ScriptedGenerator(script), CircuitBreaker("test", threshold, reset_seconds), fallback)
+
+
+def test_failures_are_retried():
+    generator = _resilient([(0, RuntimeError("503")), (0, ValueError("bad JSON")), (0, "20")])
+
+    assert generator.estimate_duration("prompt") == "20"
+    assert generator.inner.calls == 3
+    assert generator.breaker.state == "closed"
+
+
+def test_slow_attempts_stop_at_the_timeout(monkeypatch):
+    monkeypatch.setattr(settings, "ai_call_timeout_seconds", 0.1)
+    monkeypatch.setattr(settings, "ai_max_retries", 0)
+    generator = _resilient([(1.0, "20")])
+
+    started = time.perf_counter()
+    with pytest.raises(AICallTimeoutError):
+        generator.estimate_duration("prompt")
+    assert time.perf_counter() - started < 0.5
+
+
+def test_circuit_opens_and_recovers_after_the_reset_time():
+    generator = _resilient([(0, RuntimeError("down"))] * 3 + [(0, "15")], threshold=3, reset_seconds=0.2)
+
+    with pytest.raises(RuntimeError):
+        generator.estimate_duration("prompt")
+    with pytest.raises(CircuitOpenError):
+        generator.estimate_duration("prompt")
+    assert generator.inner.calls == 3
+
+    time.sleep(0.25)
+    assert generator.estimate_duration("prompt") == "15"
+    assert generator.breaker.state == "closed"
+
+
+def test_fallback_answers_when_the_provider_fails():
+    fallback = ScriptedGenerator([(0, "40")])
+    generator = _resilient([(0, RuntimeError("down"))], fallback=lambda: fallback)
+
+    assert generator.estimate_duration("prompt") == "40"
+    assert fallback.calls == 1
+
+
+def test_missing_implementations_are_not_retried():
+    generator = _resilient([(0, NotImplementedError("not yet"))], fallback=lambda: ScriptedGenerator([(0, "40")]))
+
+    with pytest.raises(NotImplementedError):
+        generator.estimate_duration("prompt")
+    assert generator.inner.calls == 1
+
+
+def test_slow_attempt_is_hedged(monkeypatch):
+    monkeypatch.setattr(settings, "ai_hedge_after_seconds", 0.05)
+    generator = _resilient([(1.0, "slow"), (0, "fast")])
+
+    started = time.perf_counter()
+    assert generator.estimate_duration("prompt") == "fast"
+    assert time.perf_counter() - started < 0.5
+
+
+def test_async_calls_share_the_policy(monkeypatch):
+    generator = _resilient([(0, RuntimeError("503")), (0, "25")])
+    assert asyncio.run(generator.aestimate_duration("prompt")) == "25"
+
+    monkeypatch.setattr(settings, "ai_call_timeout_seconds", 0.1)
+    monkeypatch.setattr(settings, "ai_max_retries", 0)
+    with pytest.raises(AICallTimeoutError):
+        asyncio.run(_resilient([(1.0, "20")]).aestimate_duration("prompt"))
+
+
+def test_cancelled_trial_call_lets_the_next_call_try_again():
+    """A half-open trial cancelled before its outcome must not leave the circuit refusing every call"""
+    generator = _resilient([(0, RuntimeError("down")), (1.0, "slow"), (0, "15")], threshold=1, reset_seconds=0.05)
+    with pytest.raises(RuntimeError):
+        generator.estimate_duration("prompt")
+    time.sleep(0.1)
+
+    async def cancel_trial():
+        trial = asyncio.ensure_future(generator.aestimate_duration("prompt"))
+        await asyncio.sleep(0.05)
+        trial.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await trial
+
+    asyncio.run(cancel_trial())
+    assert generator.estimate_duration("prompt") == "15"
+    assert generator.breaker.state == "closed"
+
+
+def test_trial_stream_closed_early_lets_the_next_call_try_again():
+    breaker = CircuitBreaker("test", 1, 0.05)
+    breaker.record_failure()
+    time.sleep(0.1)
+    generator = ResilientAIGenerator(MockAIGenerator(), breaker)
+
+    async def read_first_question():
+        stream = generator.astream_questions("Logic", ["choose_one", "text_based"])
+        await stream.__anext__()
+        await stream.aclose()
+
+    asyncio.run(read_first_question())
+    assert generator.estimate_duration("prompt")
+    assert breaker.state == "closed"
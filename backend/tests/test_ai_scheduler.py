@@ -0,0 +1,217 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from config import settings
+from integrations.ai_integration.ai_factory import AIProvider
+from integrations.ai_integration.mock_ai_generator import MockAIGenerator
+from integrations.ai_integration.resilience import CircuitBreaker, ResilientAIGenerator, get_circuit_breaker_states
+from integrations.ai_integration.scheduling import (
+    AICallScheduler, AIQueueTimeoutError, BULK, INTERACTIVE, ScheduledAIGenerator, call_priority, get_scheduler
+)
+from services.ai_service import get_ai_generator
+
+
+def _scheduler(rate=None, burst=5, max_concurrency=4, bulk_share=0.5):
+    return AICallScheduler("test", rate_per_second=rate, burst=burst, max_concurrency=max_concurrency, bulk_share=bulk_share)
+
+
+def test_token_bucket_limits_the_request_rate():
+    scheduler = _scheduler(rate=20.0, burst=1)
+
+    started = time.perf_counter()
+    for _ in range(5):
+        scheduler.acquire(INTERACTIVE, timeout=2)
+        scheduler.release(INTERACTIVE)
+
+    # The first call uses the burst, the other four wait for a token each
+    assert time.perf_counter() - started >= 0.18
+
+
+def test_queued_interactive_call_starts_before_queued_bulk_call():
+    scheduler = _scheduler(max_concurrency=1)
+    scheduler.acquire(INTERACTIVE, timeout=1)
+    order = []
+
+    def call(priority):
+        scheduler.acquire(priority, timeout=2)
+        order.append(priority)
+        scheduler.release(priority)
+
+    bulk = threading.Thread(target=call, args=(BULK,))
+    bulk.start()
+    time.sleep(0.05)
+    interactive = threading.Thread(target=call, args=(INTERACTIVE,))
+    interactive.start()
+    time.sleep(0.05)
+
+    scheduler.release(INTERACTIVE)
+    bulk.join()
+    interactive.join()
+    assert order == [INTERACTIVE, BULK]
+
+
+def test_bulk_calls_keep_to_their_share():
+    scheduler = _scheduler(max_concurrency=4, bulk_share=0.5)
+    scheduler.acquire(BULK, timeout=1)
+    scheduler.acquire(BULK, timeout=1)
+
+    with pytest.raises(AIQueueTimeoutError):
+        scheduler.acquire(BULK, timeout=0.05)
+    # Interactive calls still find free slots
+    scheduler.acquire(INTERACTIVE, timeout=0.05)
+
+    stats = scheduler.get_stats()
+    assert stats[BULK]["in_flight"] == 2
+    assert stats[BULK]["timed_out"] == 1
+    assert stats[INTERACTIVE]["in_flight"] == 1
+
+
+def test_concurrency_limit_halves_on_429_and_recovers():
+    scheduler = _scheduler(max_concurrency=8)
+    scheduler.acquire(INTERACTIVE, timeout=1)
+    scheduler.release(INTERACTIVE, throttled=True)
+    assert scheduler.get_stats()["concurrency_limit"] == 4
+
+    for _ in range(4):
+        scheduler.acquire(INTERACTIVE, timeout=1)
+        scheduler.release(INTERACTIVE)
+    assert scheduler.get_stats()["concurrency_limit"] == 5
+
+
+def test_async_waits_hold_no_threads_and_wake_on_release():
+    class NoThreads(ThreadPoolExecutor):
+        def submit(self, *args, **kwargs):
+            raise AssertionError("aacquire must not wait in a thread")
+
+    scheduler = _scheduler(max_concurrency=1)
+    scheduler.acquire(INTERACTIVE, timeout=1)
+
+    async def wait_for_slots():
+        asyncio.get_running_loop().set_default_executor(NoThreads())
+        # Released from another thread while both calls wait on the event loop
+        threading.Timer(0.05, scheduler.release, args=(INTERACTIVE,)).start()
+        await scheduler.aacquire(INTERACTIVE, timeout=2)
+        with pytest.raises(AIQueueTimeoutError):
+            await scheduler.aacquire(BULK, timeout=0.05)
+        scheduler.release(INTERACTIVE)
+
+    asyncio.run(wait_for_slots())
+    stats = scheduler.get_stats()
+    assert stats[INTERACTIVE]["started"] == 2
+    assert stats[INTERACTIVE]["in_flight"] == 0
+    assert stats[BULK]["queued"] == 0
+
+
+def test_queue_timeouts_do_not_trip_the_circuit_breaker(monkeypatch):
+    monkeypatch.setattr(settings, "ai_queue_timeout_seconds", 0.01)
+    generator = get_ai_generator(AIProvider.MOCK)
+    scheduler = get_scheduler(AIProvider.MOCK.value)
+    taken = 0
+    while scheduler.get_stats()[INTERACTIVE]["in_flight"] < scheduler.get_stats()["concurrency_limit"]:
+        scheduler.acquire(INTERACTIVE, timeout=1)
+        taken += 1
+
+    try:
+        for _ in range(settings.ai_circuit_failure_threshold + 1):
+            with pytest.raises(AIQueueTimeoutError):
+                generator.estimate_duration("prompt")
+        # Queued calls never reached the provider, so they are no evidence of it failing
+        assert get_circuit_breaker_states().get(AIProvider.MOCK.value, "closed") == "closed"
+    finally:
+        for _ in range(taken):
+            scheduler.release(INTERACTIVE)
+
+
+class RateLimitedError(Exception):
+    status_code = 429
+
+
+def test_scheduled_generator_reports_rate_limited_calls():
+    class ThrottledGenerator(MockAIGenerator):
+        def estimate_duration(self, prompt):
+            raise RateLimitedError("too many requests")
+
+    scheduler = _scheduler(max_concurrency=8)
+    generator = ScheduledAIGenerator(ThrottledGenerator(), scheduler)
+
+    with pytest.raises(RateLimitedError):
+        generator.estimate_duration("prompt")
+    assert scheduler.get_stats()["concurrency_limit"] == 4
+    assert scheduler.get_stats()[INTERACTIVE]["throttled"] == 1
+
+
+def _wait_until_idle(scheduler, timeout=2.0):
+    # Slots are freed by the finished request's callback, which may run just after the caller resumes
+    deadline = time.monotonic() + timeout
+    while any(scheduler.get_stats()[priority]["in_flight"] for priority in (INTERACTIVE, BULK)):
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+
+def test_every_retry_takes_a_slot_and_reports_rate_limiting(monkeypatch):
+    monkeypatch.setattr(settings, "ai_max_retries", 2)
+    monkeypatch.setattr(settings, "ai_retry_backoff_seconds", 0.0)
+
+    class ThrottledOnceGenerator(MockAIGenerator):
+        calls = 0
+
+        def estimate_duration(self, prompt):
+            self.calls += 1
+            if self.calls == 1:
+                raise RateLimitedError("too many requests")
+            return super().estimate_duration(prompt)
+
+    scheduler = _scheduler(max_concurrency=8)
+    generator = ResilientAIGenerator(ThrottledOnceGenerator(), CircuitBreaker("test", 5, 30.0), scheduler=scheduler)
+
+    generator.estimate_duration("prompt")
+    _wait_until_idle(scheduler)
+    stats = scheduler.get_stats()
+    assert stats[INTERACTIVE]["started"] == 2
+    assert stats[INTERACTIVE]["throttled"] == 1
+    assert stats["concurrency_limit"] == 4
+
+
+def test_rate_limiting_is_reported_when_the_fallback_answers(monkeypatch):
+    monkeypatch.setattr(settings, "ai_max_retries", 1)
+    monkeypatch.setattr(settings, "ai_retry_backoff_seconds", 0.0)
+
+    class ThrottledGenerator(MockAIGenerator):
+        def estimate_duration(self, prompt):
+            raise RateLimitedError("too many requests")
+
+        async def aestimate_duration(self, prompt):
+            raise RateLimitedError("too many requests")
+
+    scheduler = _scheduler(max_concurrency=8)
+    generator = ResilientAIGenerator(ThrottledGenerator(), CircuitBreaker("test", 5, 30.0), MockAIGenerator, scheduler)
+
+    assert generator.estimate_duration("prompt") is not None
+    assert asyncio.run(generator.aestimate_duration("prompt")) is not None
+    _wait_until_idle(scheduler)
+    # Both attempts of both calls reached the provider and were rate limited
+    assert scheduler.get_stats()[INTERACTIVE]["throttled"] == 4
+
+
+def test_call_priority_reaches_the_scheduler_through_worker_threads():
+    scheduler = _scheduler()
+    generator = ResilientAIGenerator(MockAIGenerator(), CircuitBreaker("test", 5, 30.0), scheduler=scheduler)
+
+    with call_priority(BULK):
+        generator.estimate_duration("prompt")
+    generator.estimate_duration("prompt")
+
+    _wait_until_idle(scheduler)
+    stats = scheduler.get_stats()
+    assert stats[BULK]["started"] == 1
+    assert stats[INTERACTIVE]["started"] == 1
+
+
+def test_scheduler_metrics_endpoint(client):
+    response = client.get("/api/metrics/ai-scheduler")
+    assert response.status_code == 200
+    assert isinstance(response.json(), dict)
@@ -0,0 +1,105 @@
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from integrations.ai_integration.mock_ai_generator import MockAIGenerator
+from models.assessment_operation import AssessmentOperation
+from services.assessment_operation_service import WORKER_ID, fail_expired_operations, renew_leases
+from tests.conftest import TestingSessionLocal
+
+
+def _wait_for_operation(client, operation_id, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        operation = client.get(f"/api/assessments/operations/{operation_id}").json()
+        if operation["status"] in ("succeeded", "failed"):
+            return operation
+        time.sleep(0.05)
+    raise AssertionError(f"Operation {operation_id} did not finish in {timeout} seconds")
+
+
+def test_create_and_regenerate_run_in_background(hr_client):
+    """Both endpoints answer 202 at once and the operation reports the assessment when done"""
+    client, job_id = hr_client
+    response = client.post(f"/api/assessments/jobs/{job_id}", json={
+        "title": "Async Assessment",
+        "passing_score": 60,
+        "questions_types": ["choose_one", "text_based"]
+    })
+    assert response.status_code == 202
+    operation = _wait_for_operation(client, response.json()["operation_id"])
+    assert operation["status"] == "succeeded"
+    assert operation["kind"] == "create"
+
+    assessment_id = operation["assessment_id"]
+    assessment = client.get(f"/api/assessments/jobs/{job_id}/{assessment_id}").json()
+    assert assessment["questions_count"] == 2
+
+    response = client.patch(f"/api/assessments/jobs/{job_id}/{assessment_id}/regenerate", json={
+        "questions_types": ["choose_many", "choose_many", "text_based"]
+    })
+    assert response.status_code == 202
+    operation = _wait_for_operation(client, response.json()["operation_id"])
+    assert operation["status"] == "succeeded"
+    assert operation["assessment_id"] == assessment_id
+    assert client.get(f"/api/assessments/jobs/{job_id}/{assessment_id}").json()["questions_count"] == 3
+
+
+def test_failed_generation_is_reported(hr_client, monkeypatch):
+    """Provider errors end up in the operation instead of the HTTP response"""
+    client, job_id = hr_client
+
+    def failing_generate(self, *args, **kwargs):
+        raise RuntimeError("provider unavailable")
+
+    monkeypatch.setattr(MockAIGenerator, "generate_questions", failing_generate)
+    response = client.post(f"/api/assessments/jobs/{job_id}", json={
+        "title": "Failing Assessment",
+        "passing_score": 60,
+        "questions_types": ["text_based"],
+        "bypass_cache": True
+    })
+    assert response.status_code == 202
+    operation = _wait_for_operation(client, response.json()["operation_id"])
+    assert operation["status"] == "failed"
+    assert "provider unavailable" in operation["error"]
+
+
+def test_unknown_job_and_operation(hr_client):
+    client, _ = hr_client
+    response = client.post("/api/assessments/jobs/missing-job", json={
+        "title": "Orphan Assessment",
+        "passing_score": 60,
+        "questions_types": ["text_based"]
+    })
+    assert response.status_code == 404
+    assert client.get("/api/assessments/operations/missing-operation").status_code == 404
+
+
+def test_only_operations_with_an_expired_lease_are_failed(db_session):
+    """Operations whose owner stopped renewing the lease are failed; live ones of other workers are left alone"""
+    now = datetime.now(timezone.utc)
+    dead = AssessmentOperation(kind="create", status="running", job_id=str(uuid4()), owner_id="other-host:1:dead",
+                               lease_expires_at=now - timedelta(seconds=1))
+    live = AssessmentOperation(kind="create", status="pending", job_id=str(uuid4()), owner_id="other-host:2:live",
+                               lease_expires_at=now + timedelta(minutes=5))
+    db_session.add_all([dead, live])
+    db_session.commit()
+
+    assert fail_expired_operations(db_session) >= 1
+    db_session.refresh(dead)
+    db_session.refresh(live)
+    assert dead.status == "failed"
+    assert live.status == "pending"
+
+
+def test_own_leases_are_renewed(db_session):
+    operation = AssessmentOperation(kind="create", status="running", job_id=str(uuid4()), owner_id=WORKER_ID,
+                                    lease_expires_at=datetime.now(timezone.utc) - timedelta(seconds=1))
+    db_session.add(operation)
+    db_session.commit()
+
+    assert renew_leases(db_session) >= 1
+    assert fail_expired_operations(db_session) == 0
+    db_session.refresh(operation)
+    assert operation.status == "running"
@@ -14,10 +14,10 @@ def test_create_assessment(client: TestClient, sample_job_data: dict, sample_ass
     
     # Create an assessment for the job
     response = client.post(f"/assessments/jobs/{job_id}", json=sample_assessment_data)
-    assert response.status_code == 200
+    assert response.status_code == 202
     data = response.json()
-    assert "id" in data
-    assert len(data["id"]) > 0  # UUID should be returned
+    assert "operation_id" in data
+    assert len(data["operation_id"]) > 0  # UUID should be returned
 
 
 def test_get_assessment_list(client: TestClient, sample_job_data: dict, sample_assessment_data: dict):
@@ -140,7 +140,7 @@ def test_regenerate_assessment(client: TestClient, sample_job_data: dict, sample
         "passing_score": 75.0
     }
     response = client.patch(f"/assessments/jobs/{job_id}/{assessment_id}/regenerate", json=regenerate_data)
-    assert response.status_code == 200
+    assert response.status_code == 202
     
     # Verify the regeneration
     response = client.get(f"/assessments/jobs/{job_id}/{assessment_id}")
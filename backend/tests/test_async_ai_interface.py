@@ -0,0 +1,112 @@
+import asyncio
+from types import SimpleNamespace
+
+from integrations.ai_integration.ai_generator_interface import AIGeneratorInterface
+from integrations.ai_integration.mock_ai_generator import MockAIGenerator
+from integrations.ai_integration.mistral_generator import MistralGenerator
+from schemas.assessment import AssessmentQuestion, AssessmentQuestionOption
+from schemas.enums import QuestionType
+
+
+class BlockingOnlyGenerator(AIGeneratorInterface):
+    """Provider that only implements the blocking methods."""
+
+    def generate_questions(self, title, questions_types, additional_note=None, job_info=None):
+        return [
+            AssessmentQuestion(id=f"q{i}", text=title, weight=1, skill_categories=["general"], type=QuestionType(t))
+            for i, t in enumerate(questions_types)
+        ]
+
+    def score_answer(self, question, answer_text, selected_options=None):
+        return {'score': 1.0, 'rationale': answer_text, 'correct': True}
+
+    def estimate_duration(self, prompt):
+        return "12"
+
+
+class FakeChat:
+    """Stands in for the Mistral chat API, returning a fixed content string."""
+
+    def __init__(self, content):
+        self.content = content
+        self.calls = []
+
+    def _response(self):
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=self.content))])
+
+    def complete(self, **kwargs):
+        self.calls.append(("complete", kwargs))
+        return self._response()
+
+    async def complete_async(self, **kwargs):
+        self.calls.append(("complete_async", kwargs))
+        return self._response()
+
+
+def make_mistral_generator(content):
+    """Build a MistralGenerator without touching the network."""
+    generator = MistralGenerator.__new__(MistralGenerator)
+    generator.client = SimpleNamespace(chat=FakeChat(content))
+    return generator
+
+
+def test_default_async_methods_delegate_to_blocking_ones():
+    """Providers without native async support still expose the async API"""
+    generator = BlockingOnlyGenerator()
+    question = AssessmentQuestion(id="q", text="Explain", weight=1, skill_categories=["general"], type=QuestionType.text_based)
+
+    questions = asyncio.run(generator.agenerate_questions("Python", ["choose_one", "text_based"]))
+    score = asyncio.run(generator.ascore_answer(question, "answer"))
+    duration = asyncio.run(generator.aestimate_duration("prompt"))
+
+    assert [q.type for q in questions] == [QuestionType.choose_one, QuestionType.text_based]
+    assert score == {'score': 1.0, 'rationale': "answer", 'correct': True}
+    assert duration == "12"
+
+
+def test_mock_generator_async_methods():
+    """The mock provider implements every async counterpart"""
+    generator = MockAIGenerator()
+    question = AssessmentQuestion(
+        id="q1",
+        text="Pick one",
+        weight=2,
+        skill_categories=["python"],
+        type=QuestionType.choose_one,
+        options=[AssessmentQuestionOption(text="A", value="a"), AssessmentQuestionOption(text="B", value="b")],
+        correct_options=["a"]
+    )
+
+    async def run():
+        return await asyncio.gather(
+            generator.agenerate_questions("Python Basics", ["choose_one", "choose_many", "text_based"]),
+            generator.ascore_answer(question, "", ["a"]),
+            generator.aestimate_duration("Question 1\nQuestion 2"),
+        )
+
+    questions, score, duration = asyncio.run(run())
+
+    assert len(questions) == 3
+    assert score['correct'] is True and score['score'] == 1.0
+    assert "minutes" in duration
+
+
+def test_mistral_async_methods_use_async_client():
+    """MistralGenerator awaits complete_async and parses the response like the blocking path"""
+    generator = make_mistral_generator(
+        '```json\n[{"type": "MCQ", "prompt": "2+2?", "choices": ["3", "4"], "correct_answer": "4", "skill": "math"}]\n```'
+    )
+
+    questions = asyncio.run(generator.agenerate_questions("Math", ["choose_one"]))
+
+    assert generator.client.chat.calls[0][0] == "complete_async"
+    assert len(questions) == 1
+    assert questions[0].correct_options == ["4"]
+    assert questions[0].skill_categories == ["math"]
+
+    generator = make_mistral_generator('{"score": 0.5, "rationale": "partial", "correct": false}')
+    question = AssessmentQuestion(id="q", text="Explain", weight=1, skill_categories=["general"], type=QuestionType.text_based)
+    score = asyncio.run(generator.ascore_answer(question, "something"))
+
+    assert score == {'score': 0.5, 'rationale': "partial", 'correct': False}
+    assert asyncio.run(make_mistral_generator("25").aestimate_duration("prompt")) == "25"
@@ -0,0 +1,122 @@
+import threading
+import time
+
+from config import settings
+from integrations.ai_integration.ai_factory import AIProvider
+from integrations.ai_integration.mock_ai_generator import MockAIGenerator
+from schemas.assessment import AssessmentQuestion
+from schemas.enums import QuestionType
+from services.ai_service import generate_questions, _chunk_questions_types
+
+
+class SlowNumberingGenerator(MockAIGenerator):
+    """Numbers its questions per call like MistralGenerator, taking a fixed time per call"""
+
+    def __init__(self, latency=0.0, repeat_first=False, single_choice_only=False):
+        self.latency = latency
+        self.repeat_first = repeat_first
+        self.single_choice_only = single_choice_only
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def generate_questions(self, title, questions_types, additional_note=None, job_info=None):
+        time.sleep(self.latency)
+        with self.lock:
+            call = len(self.calls)
+            self.calls.append((list(questions_types), job_info))
+        return [
+            AssessmentQuestion(
+                id=f"chunk_{i}",
+                # Every chunk's first question repeats, like a provider asked the same thing twice
+                text="Shared question" if self.repeat_first and i == 0 and call < 2 else f"Question {call}.{i}",
+                weight=1,
+                skill_categories=["general"],
+                # Like MistralGenerator, which answers every multiple choice question as choose_one
+                type=QuestionType.choose_one if self.single_choice_only and question_type == "choose_many" else QuestionType(question_type)
+            )
+            for i, question_type in enumerate(questions_types)
+        ]
+
+
+def test_chunks_group_types_and_stay_within_the_size():
+    types = ["text_based", "choose_one"] * 12 + ["choose_many"]
+    chunks = _chunk_questions_types(types, 10)
+
+    assert len(chunks) == 3
+    assert all(len(chunk) <= 10 for chunk in chunks)
+    assert sorted(sum(chunks, [])) == list(range(len(types)))
+    # Same-type questions are next to each other, so most chunks hold a single type
+    assert [types[position] for position in chunks[0]] == ["text_based"] * 9
+
+
+def test_chunked_questions_keep_the_requested_order(monkeypatch):
+    generator = SlowNumberingGenerator()
+    monkeypatch.setattr("services.ai_service.AIGeneratorFactory.get_generator", lambda provider: generator)
+    monkeypatch.setattr(settings, "generation_chunk_size", 4)
+    types = ["text_based", "choose_one", "choose_many"] * 4
+
+    questions = generate_questions("Backend", types, provider=AIProvider.MOCK)
+
+    assert len(generator.calls) == 3
+    # Each chunk was asked for a single type, yet the questions come back interleaved as requested
+    assert all(len(set(call[0])) == 1 for call in generator.calls)
+    assert [q.type.value for q in questions] == types
+    assert [q.id for q in questions] == [f"mock_{i}" for i in range(len(types))]
+
+
+def test_single_choice_answers_fill_multiple_choice_slots(monkeypatch, caplog):
+    generator = SlowNumberingGenerator(single_choice_only=True)
+    monkeypatch.setattr("services.ai_service.AIGeneratorFactory.get_generator", lambda provider: generator)
+    monkeypatch.setattr(settings, "generation_chunk_size", 4)
+    types = ["text_based", "choose_one", "choose_many"] * 4
+
+    questions = generate_questions("Backend", types, provider=AIProvider.MOCK)
+
+    # No regeneration call and nothing reported as a dropped duplicate
+    assert len(generator.calls) == 3
+    assert "Dropped" not in caplog.text
+    assert [q.type.value for q in questions] == ["text_based", "choose_one", "choose_one"] * 4
+    # The choose_many chunk's answers are in the choose_many positions
+    assert [q.text for q in questions[2::3]] == [f"Question {generator.calls.index((['choose_many'] * 4, None))}.{i}" for i in range(4)]
+
+
+def test_large_request_runs_chunks_in_parallel(monkeypatch):
+    generator = SlowNumberingGenerator(latency=0.3)
+    monkeypatch.setattr("services.ai_service.AIGeneratorFactory.get_generator", lambda provider: generator)
+    monkeypatch.setattr(settings, "generation_chunk_size", 10)
+    monkeypatch.setattr(settings, "generation_chunk_threads", 4)
+    monkeypatch.setattr("services.ai_service._generation_executor", None)
+
+    started = time.perf_counter()
+    questions = generate_questions("Backend", ["choose_one"] * 20 + ["text_based"] * 20, provider=AIProvider.MOCK,
+                                   job_info={"title": "Backend", "skill_categories": ["python", "sql", "http", "git"]})
+    elapsed = time.perf_counter() - started
+
+    assert len(generator.calls) == 4
+    assert elapsed < 0.9  # one chunk's latency, not the sum of four
+    assert [q.id for q in questions] == [f"mock_{i}" for i in range(40)]
+    # Each chunk asks about its own share of the job's skills
+    assert sorted(call[1]["skill_categories"][0] for call in generator.calls) == ["git", "http", "python", "sql"]
+
+
+def test_duplicates_across_chunks_are_regenerated(monkeypatch):
+    generator = SlowNumberingGenerator(repeat_first=True)
+    monkeypatch.setattr("services.ai_service.AIGeneratorFactory.get_generator", lambda provider: generator)
+    monkeypatch.setattr(settings, "generation_chunk_size", 5)
+
+    questions = generate_questions("Backend", ["text_based"] * 10, provider=AIProvider.MOCK)
+
+    assert len(generator.calls) == 3
+    assert generator.calls[-1][0] == ["text_based"]
+    assert len(questions) == 10
+    assert len({q.text for q in questions}) == 10
+
+
+def test_small_request_is_one_call(monkeypatch):
+    generator = SlowNumberingGenerator()
+    monkeypatch.setattr("services.ai_service.AIGeneratorFactory.get_generator", lambda provider: generator)
+
+    questions = generate_questions("Backend", ["text_based", "choose_one"], provider=AIProvider.MOCK)
+
+    assert len(generator.calls) == 1
+    assert [q.id for q in questions] == ["chunk_0", "chunk_1"]
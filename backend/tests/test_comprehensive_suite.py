@@ -11,7 +11,7 @@ from fastapi.testclient import TestClient
 from unittest.mock import patch
 
 from main import app
-from database.database import get_db
+from database.database import get_read_db, get_write_db
 from models.assessment import Assessment
 from models.job import Job
 from models.user import User
@@ -42,8 +42,9 @@ def override_get_db():
         db.close()
 
 
-# Override the database dependency
-app.dependency_overrides[get_db] = override_get_db
+# Override the database dependencies; reads and writes share the test database
+app.dependency_overrides[get_write_db] = override_get_db
+app.dependency_overrides[get_read_db] = override_get_db
 client = TestClient(app)
 
 
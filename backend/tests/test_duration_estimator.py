@@ -0,0 +1,120 @@
+import json
+from uuid import uuid4
+
+from sqlalchemy.orm import Session
+
+import services.ai_service
+from config import settings
+from database.database import create_database_engine
+from integrations.ai_integration.ai_factory import AIProvider
+from integrations.ai_integration.mock_ai_generator import MockAIGenerator
+from models import Assessment, Base, Job
+from schemas.assessment import AssessmentCreate
+from schemas.assessment import AssessmentQuestion, AssessmentQuestionOption
+from schemas.enums import QuestionType
+from services.ai_service import estimate_assessment_duration
+from services.assessment_service import create_assessment
+from services.duration_estimator import (
+    DEFAULT_COEFFICIENTS, _load_coefficients, calibrate_from_assessments, calibrate_scale, estimate_duration_for_types,
+    estimate_duration_minutes
+)
+
+
+def _choice(text="Which index speeds up this query?", options=4, weight=2):
+    return AssessmentQuestion(
+        id="c", text=text, weight=weight, skill_categories=["sql"], type=QuestionType.choose_one,
+        options=[AssessmentQuestionOption(text=f"Option {i}", value=str(i)) for i in range(options)],
+        correct_options=["0"]
+    )
+
+
+def _essay(text="Describe how you would shard a growing orders table.", weight=4):
+    return AssessmentQuestion(id="t", text=text, weight=weight, skill_categories=["sql"], type=QuestionType.text_based)
+
+
+def test_local_estimate_is_deterministic_and_grows_with_work():
+    """Same input gives the same minutes; more, longer or heavier questions take longer"""
+    job_info = {"seniority": "mid"}
+    base = estimate_duration_minutes([_choice()], job_info)
+
+    assert estimate_duration_minutes([_choice()], job_info) == base
+    assert estimate_duration_minutes([_choice(), _essay()], job_info) > base
+    assert estimate_duration_minutes([_essay()], job_info) > estimate_duration_minutes([_choice()], job_info)
+    assert estimate_duration_minutes([_essay(weight=5)], job_info) > estimate_duration_minutes([_essay(weight=1)], job_info)
+    assert estimate_duration_minutes([_essay()], {"seniority": "intern"}) >= estimate_duration_minutes([_essay()], job_info)
+    assert estimate_duration_minutes([_essay()] * 100, job_info) == 180
+    assert estimate_duration_for_types(["choose_one", "text_based"], job_info) > estimate_duration_for_types(["choose_one"], job_info)
+
+
+def test_calibration_fits_scale_and_is_loaded(tmp_path, monkeypatch):
+    """Observed durations twice the prediction double the scale, and the file overrides the defaults"""
+    questions = [_choice(), _essay()]
+    predicted = estimate_duration_minutes(questions, {"seniority": "mid"}, dict(DEFAULT_COEFFICIENTS, base_minutes=0.0))
+    coefficients = calibrate_scale(
+        [{"questions": questions, "job_info": {"seniority": "mid"}, "duration": predicted * 2}],
+        dict(DEFAULT_COEFFICIENTS, base_minutes=0.0)
+    )
+    assert 1.8 < coefficients["scale"] < 2.2
+
+    path = tmp_path / "coefficients.json"
+    path.write_text(json.dumps({"scale": 2.0, "type_seconds": {"text_based": 600.0}}))
+    monkeypatch.setattr(settings, "duration_coefficients_path", str(path))
+    loaded = _load_coefficients(str(path))
+    assert loaded["scale"] == 2.0
+    assert loaded["type_seconds"]["text_based"] == 600.0
+    assert loaded["type_seconds"]["choose_one"] == DEFAULT_COEFFICIENTS["type_seconds"]["choose_one"]
+    assert estimate_duration_minutes(questions, {"seniority": "mid"}) > estimate_duration_minutes(questions, {"seniority": "mid"}, DEFAULT_COEFFICIENTS)
+    _load_coefficients.cache_clear()
+
+
+def test_local_mode_skips_the_provider(monkeypatch):
+    """The default mode never asks the AI provider; llm mode still does"""
+    monkeypatch.setattr(services.ai_service, "DEFAULT_PROVIDER", AIProvider.MOCK)
+    calls = []
+
+    def estimate(self, prompt):
+        calls.append(prompt)
+        return "42"
+
+    monkeypatch.setattr(MockAIGenerator, "estimate_duration", estimate)
+    questions = [_choice(), _essay()]
+
+    assert estimate_assessment_duration("Local", {"seniority": "mid"}, questions) == estimate_duration_minutes(questions, {"seniority": "mid"})
+    assert calls == []
+
+    monkeypatch.setattr(settings, "duration_estimator_mode", "llm")
+    assert estimate_assessment_duration("LLM", {"seniority": "mid"}, questions) == 42
+    assert len(calls) == 1
+
+
+def test_calibration_skips_durations_of_the_local_estimator(tmp_path, monkeypatch):
+    """Locally estimated durations are recorded as such and left out of the fit"""
+    monkeypatch.setattr(services.ai_service, "DEFAULT_PROVIDER", AIProvider.MOCK)
+    monkeypatch.setattr(settings, "question_bank_enabled", False)
+    engine = create_database_engine(f"sqlite:///{tmp_path / 'calibration.db'}", pool_size=1, max_overflow=0)
+    Base.metadata.create_all(bind=engine)
+    job_id = str(uuid4())
+    questions = [_choice(), _essay()]
+    predicted = estimate_duration_minutes(questions, {"seniority": "mid"}, dict(DEFAULT_COEFFICIENTS, base_minutes=0.0, scale=1.0))
+    try:
+        with Session(bind=engine) as db:
+            db.add(Job(id=job_id, title="Backend Engineer", seniority="mid", skill_categories='["sql"]'))
+            db.commit()
+            local = create_assessment(db, job_id, AssessmentCreate(title="Local", passing_score=50, questions_types=[QuestionType.choose_one]))
+            assert local.duration_source == "local"
+
+            # An LLM estimate three times the local one, and locally estimated durations that would pull the scale to 1
+            questions_json = json.dumps([q.model_dump() for q in questions])
+            db.add(Assessment(job_id=job_id, title="LLM", duration=predicted * 3, duration_source="llm", passing_score=50, questions=questions_json))
+            db.add_all(Assessment(job_id=job_id, title="Local", duration=predicted, duration_source="local", passing_score=50, questions=questions_json) for _ in range(5))
+            db.commit()
+
+            monkeypatch.setattr(settings, "duration_coefficients_path", None)
+            monkeypatch.setattr("services.duration_estimator.DEFAULT_COEFFICIENTS", dict(DEFAULT_COEFFICIENTS, base_minutes=0.0))
+            _load_coefficients.cache_clear()
+            coefficients = calibrate_from_assessments(db, str(tmp_path / "coefficients.json"))
+        assert 2.7 < coefficients["scale"] < 3.3
+    finally:
+        _load_coefficients.cache_clear()
+        engine.dispose()
+
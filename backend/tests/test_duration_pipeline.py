@@ -0,0 +1,106 @@
+import json
+import threading
+
+import services.ai_service
+from config import settings
+from integrations.ai_integration.ai_factory import AIProvider
+from integrations.ai_integration.mock_ai_generator import MockAIGenerator
+from models.job import Job
+from schemas.assessment import AssessmentCreate
+from schemas.enums import QuestionType
+from services.assessment_service import create_assessment, regenerate_assessment
+from uuid import uuid4
+
+
+def _add_job(db_session):
+    job = Job(id=str(uuid4()), title="Site Reliability Engineer", seniority="senior", skill_categories='["linux"]')
+    db_session.add(job)
+    db_session.commit()
+    return job
+
+
+def test_duration_estimate_overlaps_generation(db_session, monkeypatch):
+    """The duration estimate is already running while the questions are generated"""
+    monkeypatch.setattr(services.ai_service, "DEFAULT_PROVIDER", AIProvider.MOCK)
+    monkeypatch.setattr(settings, "ai_cache_enabled", False)
+    monkeypatch.setattr(settings, "duration_estimator_mode", "llm")
+    estimate_started = threading.Event()
+    overlapped = []
+    original_generate = MockAIGenerator.generate_questions
+
+    def slow_generate(self, title, questions_types, additional_note=None, job_info=None):
+        # Only returns early if the estimate was started before generation finished
+        overlapped.append(estimate_started.wait(timeout=5))
+        return original_generate(self, title, questions_types, additional_note, job_info)
+
+    def estimate(self, prompt):
+        estimate_started.set()
+        return "25"
+
+    monkeypatch.setattr(MockAIGenerator, "generate_questions", slow_generate)
+    monkeypatch.setattr(MockAIGenerator, "estimate_duration", estimate)
+    job = _add_job(db_session)
+
+    assessment = create_assessment(db_session, job.id, AssessmentCreate(
+        title="Pipelined Assessment",
+        passing_score=50,
+        questions_types=[QuestionType.text_based, QuestionType.choose_one],
+        additional_note="always generate"
+    ))
+
+    assert overlapped == [True]
+    assert assessment.duration == 25
+
+
+def test_regenerate_estimates_duration_once(db_session, monkeypatch):
+    """Regeneration asks for one duration estimate and keeps it"""
+    monkeypatch.setattr(services.ai_service, "DEFAULT_PROVIDER", AIProvider.MOCK)
+    monkeypatch.setattr(settings, "ai_cache_enabled", False)
+    monkeypatch.setattr(settings, "duration_estimator_mode", "llm")
+    prompts = []
+
+    def estimate(self, prompt):
+        prompts.append(prompt)
+        return str(10 * len(prompts))
+
+    monkeypatch.setattr(MockAIGenerator, "estimate_duration", estimate)
+    job = _add_job(db_session)
+    assessment = create_assessment(db_session, job.id, AssessmentCreate(
+        title="Regenerated Assessment",
+        passing_score=50,
+        questions_types=[QuestionType.text_based],
+        additional_note="always generate"
+    ))
+
+    regenerated = regenerate_assessment(db_session, assessment.id, questions_types=[QuestionType.choose_many, QuestionType.text_based], passing_score=70)
+
+    assert len(prompts) == 2
+    assert regenerated.duration == 20
+    assert regenerated.passing_score == 70
+    assert len(json.loads(regenerated.questions)) == 2
+    assert "Questions Count: 2" in prompts[1]
+
+
+def test_sequential_estimate_when_pipeline_disabled(db_session, monkeypatch):
+    """With pipelining off the estimate is built from the generated questions"""
+    monkeypatch.setattr(services.ai_service, "DEFAULT_PROVIDER", AIProvider.MOCK)
+    monkeypatch.setattr(settings, "ai_cache_enabled", False)
+    monkeypatch.setattr(settings, "duration_estimator_mode", "llm")
+    monkeypatch.setattr(settings, "pipeline_duration_estimate", False)
+    prompts = []
+
+    def estimate(self, prompt):
+        prompts.append(prompt)
+        return "12"
+
+    monkeypatch.setattr(MockAIGenerator, "estimate_duration", estimate)
+    job = _add_job(db_session)
+    assessment = create_assessment(db_session, job.id, AssessmentCreate(
+        title="Sequential Assessment",
+        passing_score=50,
+        questions_types=[QuestionType.choose_one],
+        additional_note="always generate"
+    ))
+
+    assert assessment.duration == 12
+    assert "Multiple choice with" in prompts[0]
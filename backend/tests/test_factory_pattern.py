@@ -3,6 +3,8 @@ from integrations.ai_integration.mock_ai_generator import MockAIGenerator
 from integrations.ai_integration.openai_generator import OpenAIGenerator
 from integrations.ai_integration.anthropic_generator import AnthropicGenerator
 from integrations.ai_integration.google_ai_generator import GoogleAIGenerator
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 
 
 def test_factory_pattern():
@@ -121,6 +123,63 @@ def test_mock_generator_functionality():
         print(f"   [FAIL] Mock generator functionality test failed: {e}")
 
 
+def test_shared_generator_instances():
+    """get_generator returns one shared instance per provider, even under concurrent first use"""
+    asyncio.run(AIGeneratorFactory.aclose_all())
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        instances = list(executor.map(lambda _: AIGeneratorFactory.get_generator(AIProvider.MOCK), range(32)))
+
+    assert all(instance is instances[0] for instance in instances)
+    assert isinstance(instances[0], MockAIGenerator)
+    # create_generator still builds independent instances
+    assert AIGeneratorFactory.create_generator(AIProvider.MOCK) is not instances[0]
+
+
+def test_shared_generator_lifecycle():
+    """Warm-up creates the shared instance and closing forgets it"""
+    closed = []
+
+    class ClosingMockGenerator(MockAIGenerator):
+        async def aclose(self):
+            closed.append(self)
+
+    AIGeneratorFactory.register_provider(AIProvider.MOCK, ClosingMockGenerator)
+    try:
+        AIGeneratorFactory.warm_up([AIProvider.MOCK])
+        warmed = AIGeneratorFactory.get_generator(AIProvider.MOCK)
+        assert isinstance(warmed, ClosingMockGenerator)
+
+        asyncio.run(AIGeneratorFactory.aclose_all())
+        assert closed == [warmed]
+        assert AIGeneratorFactory.get_generator(AIProvider.MOCK) is not warmed
+    finally:
+        AIGeneratorFactory.register_provider(AIProvider.MOCK, MockAIGenerator)
+
+
+def test_mistral_close_releases_both_http_clients(monkeypatch):
+    """close() outside an event loop and inside one both close the async client too"""
+    from integrations.ai_integration.mistral_generator import MistralGenerator
+    monkeypatch.setenv("MISTRAL_API_KEY", "test-key")
+
+    generator = MistralGenerator()
+    generator.close()
+    assert generator._http_client.is_closed
+    assert generator._async_http_client.is_closed
+
+    async def close_inside_loop():
+        generator = MistralGenerator()
+        generator.close()
+        await generator._closing
+        return generator
+
+    generator = asyncio.run(close_inside_loop())
+    assert generator._http_client.is_closed
+    assert generator._async_http_client.is_closed
+
+
 if __name__ == "__main__":
     test_factory_pattern()
-    test_mock_generator_functionality()
\ No newline at end of file
+    test_mock_generator_functionality()
+    test_shared_generator_instances()
+    test_shared_generator_lifecycle()
\ No newline at end of file
@@ -0,0 +1,59 @@
+from utils.http_metrics import HTTP_DB_STATEMENTS, HTTP_REQUESTS, HTTP_RESPONSE_SIZE
+from utils.metrics import MetricsRegistry, render_prometheus
+
+
+def _series(metric, **labels):
+    return metric.values().get(tuple(str(labels.get(label, "")) for label in metric.labels))
+
+
+def test_requests_are_recorded_per_route_template(hr_client):
+    client, job_id = hr_client
+    before = _series(HTTP_DB_STATEMENTS, method="GET", route="/api/jobs/{id}")
+    before_count = before["count"] if before else 0
+    before_sum = before["sum"] if before else 0
+
+    response = client.get(f"/api/jobs/{job_id}")
+
+    assert response.status_code == 200
+    assert _series(HTTP_REQUESTS, method="GET", route="/api/jobs/{id}", status=200) >= 1
+    statements = _series(HTTP_DB_STATEMENTS, method="GET", route="/api/jobs/{id}")
+    assert statements["count"] == before_count + 1
+    assert statements["sum"] > before_sum
+    assert _series(HTTP_RESPONSE_SIZE, method="GET", route="/api/jobs/{id}")["sum"] >= len(response.content)
+
+
+def test_unmatched_paths_share_one_series(client):
+    client.get("/no-such-page-1")
+    client.get("/no-such-page-2")
+
+    assert _series(HTTP_REQUESTS, method="GET", route="unmatched", status=404) >= 2
+
+
+def test_render_prometheus_text_format():
+    registry = MetricsRegistry()
+    registry.counter("requests_total", "Requests", ("route",)).inc(route='GET /a"b')
+    latency = registry.histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0))
+    latency.observe(0.05, route="/a")
+    latency.observe(0.5, route="/a")
+    registry.gauge("in_flight", "In flight").set(3)
+
+    text = render_prometheus(registry)
+
+    assert "# TYPE requests_total counter" in text
+    assert 'requests_total{route="GET /a\\"b"} 1' in text
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{route="/a",le="1"} 2' in text
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 2' in text
+    assert 'latency_seconds_count{route="/a"} 2' in text
+    assert "# TYPE in_flight gauge\nin_flight 3" in text
+
+
+def test_metrics_endpoint_serves_prometheus_text(client):
+    client.get("/api/")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'http_requests_total{method="GET",route="/api/",status="200"}' in response.text
+    assert "http_request_db_statements_bucket" in response.text
@@ -0,0 +1,63 @@
+import os
+import subprocess
+import sys
+import logging
+
+from config import settings
+from integrations.ai_integration.ai_factory import AIGeneratorFactory, AIProvider
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_in_fresh_interpreter(code: str) -> str:
+    """Run code in a new interpreter so previously imported modules don't leak in."""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip().splitlines()[-1]
+
+
+def test_importing_main_does_not_import_provider_sdks():
+    """No provider module or SDK is imported until a provider is used"""
+    output = run_in_fresh_interpreter(
+        "import sys, main; "
+        "print(sorted(m for m in sys.modules if m.startswith('mistralai') or m.endswith('_generator')))"
+    )
+    assert output == "[]"
+
+
+def test_only_the_requested_provider_is_imported():
+    """Creating a generator imports that provider's module and nothing else"""
+    output = run_in_fresh_interpreter(
+        "import sys; "
+        "from integrations.ai_integration.ai_factory import AIGeneratorFactory, AIProvider; "
+        "AIGeneratorFactory.get_generator(AIProvider.MOCK); "
+        "print(sorted(m for m in sys.modules if m.startswith('mistralai') or m.endswith('_generator')))"
+    )
+    assert output == "['integrations.ai_integration.mock_ai_generator']"
+
+
+def test_provider_registered_by_path_is_resolved_on_first_use():
+    """Providers registered by dotted path become classes once created"""
+    AIGeneratorFactory.register_provider(AIProvider.MOCK, "integrations.ai_integration.mock_ai_generator.MockAIGenerator")
+    assert AIProvider.MOCK not in AIGeneratorFactory.get_loaded_providers()
+
+    generator = AIGeneratorFactory.create_generator(AIProvider.MOCK)
+
+    assert type(generator).__name__ == "MockAIGenerator"
+    assert AIProvider.MOCK in AIGeneratorFactory.get_loaded_providers()
+
+
+def test_startup_budget_check_warns_when_exceeded(monkeypatch, caplog):
+    """The startup check logs a warning once the time budget is exceeded"""
+    import main
+
+    monkeypatch.setattr(settings, "startup_time_budget_ms", 0)
+    with caplog.at_level(logging.INFO, logger="main"):
+        main.check_startup_budget()
+
+    assert any("over the budget" in record.message for record in caplog.records)
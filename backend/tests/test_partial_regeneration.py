@@ -0,0 +1,104 @@
+import json
+from uuid import uuid4
+
+import pytest
+
+import services.ai_service
+from config import settings
+from integrations.ai_integration.ai_factory import AIProvider
+from integrations.ai_integration.mock_ai_generator import MockAIGenerator
+from models.assessment import Assessment
+from models.job import Job
+from schemas.assessment import AssessmentCreate
+from schemas.enums import QuestionType
+from services.assessment_service import create_assessment, regenerate_assessment
+from tests.conftest import TestingSessionLocal
+
+
+@pytest.fixture
+def assessment(db_session, monkeypatch):
+    """An assessment of three generated questions, with generation calls recorded"""
+    monkeypatch.setattr(services.ai_service, "DEFAULT_PROVIDER", AIProvider.MOCK)
+    monkeypatch.setattr(settings, "ai_cache_enabled", False)
+    requested = []
+    original_generate = MockAIGenerator.generate_questions
+
+    def recording_generate(self, title, questions_types, additional_note=None, job_info=None):
+        requested.append(list(questions_types))
+        return original_generate(self, title, questions_types, additional_note, job_info)
+
+    monkeypatch.setattr(MockAIGenerator, "generate_questions", recording_generate)
+    job = Job(id=str(uuid4()), title="Support Engineer", seniority="mid")
+    db_session.add(job)
+    db_session.commit()
+
+    assessment = create_assessment(db_session, job.id, AssessmentCreate(
+        title="Partial Assessment",
+        passing_score=50,
+        questions_types=[QuestionType.choose_one, QuestionType.text_based, QuestionType.choose_many],
+        additional_note="always generate"
+    ))
+    requested.clear()
+    return assessment, requested
+
+
+def test_only_selected_questions_are_generated(db_session, assessment):
+    assessment, requested = assessment
+    before = json.loads(assessment.questions)
+
+    regenerated = regenerate_assessment(db_session, assessment.id, question_ids=[before[1]["id"]],
+                                        replacement_types={before[1]["id"]: QuestionType.choose_one})
+    after = json.loads(regenerated.questions)
+
+    assert requested == [["choose_one"]]
+    assert after[0] == before[0] and after[2] == before[2]
+    assert after[1]["id"] not in {q["id"] for q in before}
+    assert after[1]["type"] == "choose_one"
+
+
+def test_unknown_question_ids_are_rejected(db_session, assessment):
+    assessment, requested = assessment
+
+    with pytest.raises(ValueError, match="not found"):
+        regenerate_assessment(db_session, assessment.id, question_ids=["missing"])
+    assert requested == []
+
+
+def test_question_ids_and_types_cannot_be_combined(db_session, assessment):
+    assessment, _ = assessment
+    question_id = json.loads(assessment.questions)[0]["id"]
+
+    with pytest.raises(ValueError, match="either"):
+        regenerate_assessment(db_session, assessment.id, question_ids=[question_id], questions_types=[QuestionType.text_based])
+
+
+def test_short_replacement_fails_instead_of_keeping_old_questions(db_session, assessment, monkeypatch):
+    assessment, _ = assessment
+    before = json.loads(assessment.questions)
+    monkeypatch.setattr(MockAIGenerator, "generate_questions", lambda self, *args, **kwargs: [])
+
+    with pytest.raises(ValueError, match="0 of 2"):
+        regenerate_assessment(db_session, assessment.id, question_ids=[before[0]["id"], before[2]["id"]])
+    db_session.refresh(assessment)
+    assert json.loads(assessment.questions) == before
+
+
+@pytest.mark.parametrize("body", [
+    {"question_ids": ["missing"]},
+    {"question_ids": ["q1"], "replacement_types": {"other": "text_based"}},
+    {"question_ids": ["q1"], "questions_types": ["text_based"]},
+    {"replacement_types": {"q1": "text_based"}},
+    {"question_ids": ["q1"], "replacement_types": {"q1": "essay"}},
+])
+def test_invalid_replacements_are_rejected_by_the_route(hr_client, body):
+    client, job_id = hr_client
+    with TestingSessionLocal() as db:
+        question = {"id": "q1", "text": "Why?", "weight": 1, "skill_categories": ["general"], "type": "text_based"}
+        assessment = Assessment(id=str(uuid4()), job_id=job_id, title="Routed Assessment", duration=10, passing_score=50,
+                                questions=json.dumps([question]), active=True)
+        db.add(assessment)
+        db.commit()
+        assessment_id = assessment.id
+
+    response = client.patch(f"/api/assessments/jobs/{job_id}/{assessment_id}/regenerate", json=body)
+    assert response.status_code == 422
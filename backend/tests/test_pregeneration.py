@@ -0,0 +1,98 @@
+import services.ai_service
+from config import settings
+from integrations.ai_integration.ai_factory import AIProvider
+from schemas.job import JobCreate
+from schemas.enums import JobSeniority
+from services import pregeneration_service
+from services.job_service import create_job, delete_job
+from services.question_service import assemble_questions_from_bank
+
+
+def _create_job(db_session, monkeypatch, title="Platform Engineer"):
+    monkeypatch.setattr(settings, "pregeneration_enabled", False)
+    job = create_job(db_session, JobCreate(title=title, seniority=JobSeniority.mid))
+    monkeypatch.setattr(settings, "pregeneration_enabled", True)
+    return job
+
+
+def test_pregeneration_fills_question_bank(db_session, monkeypatch):
+    """A finished pre-generation lets the job's first assessment come entirely from the bank"""
+    monkeypatch.setattr(services.ai_service, "DEFAULT_PROVIDER", AIProvider.MOCK)
+    monkeypatch.setattr(settings, "pregeneration_delay_seconds", 0)
+    job = _create_job(db_session, monkeypatch)
+    # No skill categories: the mock provider picks its skill tags at random
+    job_info = {"title": job.title, "seniority": job.seniority, "description": None, "skill_categories": []}
+    completed_before = pregeneration_service.get_pregeneration_stats()["completed"]
+
+    # Run the worker inline so it uses the test transaction
+    task = pregeneration_service._PregenerationTask(job.id)
+    pregeneration_service._run_pregeneration(task, db_session.get_bind(), job_info)
+
+    slots, shortfall = assemble_questions_from_bank(db_session, ["choose_one", "choose_many", "text_based"], job_info)
+    assert shortfall == []
+    assert all(slot is not None for slot in slots)
+    assert pregeneration_service.get_pregeneration_stats()["completed"] == completed_before + 1
+
+
+def test_pregeneration_is_cancelled_when_job_is_deleted(db_session, monkeypatch):
+    """Deleting a job cancels its pending pre-generation before the provider is called"""
+    monkeypatch.setattr(settings, "pregeneration_delay_seconds", 30)
+    job = _create_job(db_session, monkeypatch, title="Cancelled Job")
+
+    assert pregeneration_service.schedule_pregeneration(db_session, job)
+    task = pregeneration_service._pending[job.id]
+    cancelled_before = pregeneration_service.get_pregeneration_stats()["cancelled"]
+
+    assert delete_job(db_session, job.id)
+    task.future.result(timeout=5)
+
+    assert task.cancelled.is_set()
+    assert job.id not in pregeneration_service._pending
+    assert pregeneration_service.get_pregeneration_stats()["cancelled"] == cancelled_before + 1
+
+
+def test_pregeneration_cancelled_during_generation_stores_nothing(db_session, monkeypatch):
+    """A job deleted while its questions are generated gets none of them in the bank"""
+    monkeypatch.setattr(services.ai_service, "DEFAULT_PROVIDER", AIProvider.MOCK)
+    monkeypatch.setattr(settings, "pregeneration_delay_seconds", 0)
+    job = _create_job(db_session, monkeypatch, title="Deleted Mid-Generation Job")
+    job_info = {"title": job.title, "seniority": "staff", "description": None, "skill_categories": []}
+    task = pregeneration_service._PregenerationTask(job.id)
+    generate = services.ai_service.generate_questions
+
+    def generate_then_cancel(*args, **kwargs):
+        questions = generate(*args, **kwargs)
+        task.cancelled.set()
+        return questions
+    monkeypatch.setattr(pregeneration_service, "generate_questions", generate_then_cancel)
+    stats_before = pregeneration_service.get_pregeneration_stats()
+
+    pregeneration_service._run_pregeneration(task, db_session.get_bind(), job_info)
+
+    _, shortfall = assemble_questions_from_bank(db_session, ["choose_one", "choose_many", "text_based"], job_info)
+    assert shortfall == ["choose_one", "choose_many", "text_based"]
+    stats_after = pregeneration_service.get_pregeneration_stats()
+    assert stats_after["completed"] == stats_before["completed"]
+    assert stats_after["questions_generated"] == stats_before["questions_generated"]
+
+
+def test_pregeneration_respects_budget(db_session, monkeypatch):
+    """Jobs over the pending budget are not scheduled"""
+    job = _create_job(db_session, monkeypatch, title="Over Budget Job")
+    monkeypatch.setattr(settings, "pregeneration_max_pending_jobs", 0)
+    skipped_before = pregeneration_service.get_pregeneration_stats()["skipped_over_budget"]
+
+    assert not pregeneration_service.schedule_pregeneration(db_session, job)
+    assert job.id not in pregeneration_service._pending
+    assert pregeneration_service.get_pregeneration_stats()["skipped_over_budget"] == skipped_before + 1
+
+
+def test_bank_hit_rate_metrics(client):
+    """Bank lookups are exposed as hit and miss counters"""
+    before = client.get("/api/metrics/pregeneration").json()
+    pregeneration_service.record_bank_lookup(hits=3, misses=1)
+    after = client.get("/api/metrics/pregeneration").json()
+
+    assert after["bank_hits"] == before["bank_hits"] + 3
+    assert after["bank_misses"] == before["bank_misses"] + 1
+    assert 0.0 < after["bank_hit_rate"] <= 1.0
@@ -0,0 +1,84 @@
+import json
+
+import services.ai_service
+from integrations.ai_integration.ai_factory import AIProvider
+from integrations.ai_integration.mock_ai_generator import MockAIGenerator
+from schemas.assessment import AssessmentCreate, AssessmentQuestion
+from schemas.job import JobCreate
+from schemas.question import QuestionCreate
+from schemas.enums import QuestionType, JobSeniority
+from services.assessment_service import create_assessment
+from services.job_service import create_job
+from services.question_service import add_questions_to_bank, assemble_questions_from_bank, create_question, find_bank_questions
+
+
+JOB_INFO = {
+    "title": "Data Engineer",
+    "seniority": "senior",
+    "description": "Pipelines and warehousing",
+    "skill_categories": ["Airflow", "SQL"]
+}
+
+
+def _bank_question(text, question_type=QuestionType.text_based, skills=("airflow",), seniority=JobSeniority.senior):
+    return QuestionCreate(text=text, type=question_type, weight=2, skill_categories=list(skills), seniority=seniority)
+
+
+def test_add_questions_to_bank_skips_duplicates(db_session):
+    """Questions already in the bank (ignoring case and spacing) are not stored twice"""
+    questions = [
+        AssessmentQuestion(id="q1", text="Explain  idempotent DAG runs", weight=3, skill_categories=["Airflow"], type=QuestionType.text_based),
+        AssessmentQuestion(id="q2", text="explain idempotent dag runs", weight=3, skill_categories=["Airflow"], type=QuestionType.text_based),
+    ]
+
+    assert add_questions_to_bank(db_session, questions, job_info=JOB_INFO, source_provider="mock") == 1
+    assert add_questions_to_bank(db_session, questions, job_info=JOB_INFO, source_provider="mock") == 0
+
+    stored = find_bank_questions(db_session, "text_based", 10, seniority="senior", skill_categories=["AIRFLOW"], difficulty="hard")
+    assert [q.text for q in stored] == ["Explain  idempotent DAG runs"]
+    assert stored[0].skill_categories == ["airflow"]
+
+
+def test_assemble_reports_shortfall_in_request_order(db_session):
+    """Slots the bank cannot fill are returned as question types to generate"""
+    create_question(db_session, _bank_question("Design a slowly changing dimension"))
+    create_question(db_session, _bank_question("Junior airflow question", seniority=JobSeniority.junior))
+    create_question(db_session, _bank_question("Unrelated skill question", skills=("kotlin",)))
+
+    slots, shortfall = assemble_questions_from_bank(db_session, ["text_based", "choose_one", "text_based"], JOB_INFO)
+
+    assert slots[0].text == "Design a slowly changing dimension"
+    assert slots[1] is None and slots[2] is None
+    assert shortfall == ["choose_one", "text_based"]
+
+
+def test_create_assessment_only_generates_shortfall(db_session, monkeypatch):
+    """The provider is only asked for questions the bank could not supply"""
+    monkeypatch.setattr(services.ai_service, "DEFAULT_PROVIDER", AIProvider.MOCK)
+    requested = []
+    original_generate = MockAIGenerator.generate_questions
+
+    def counting_generate(self, title, questions_types, additional_note=None, job_info=None):
+        requested.append(list(questions_types))
+        return original_generate(self, title, questions_types, additional_note, job_info)
+
+    monkeypatch.setattr(MockAIGenerator, "generate_questions", counting_generate)
+    job = create_job(db_session, JobCreate(title="Data Engineer", seniority=JobSeniority.senior, skill_categories=["Airflow", "SQL"]))
+    create_question(db_session, _bank_question("Describe backfilling a partitioned table", skills=("sql",)))
+
+    assessment = create_assessment(db_session, job.id, AssessmentCreate(
+        title="Bank Assessment",
+        passing_score=50,
+        questions_types=[QuestionType.choose_one, QuestionType.text_based]
+    ))
+    assert requested == [["choose_one"]]
+    assert [q["type"] for q in json.loads(assessment.questions)] == ["choose_one", "text_based"]
+
+    # Bypassing the cache also skips the bank and generates every question
+    create_assessment(db_session, job.id, AssessmentCreate(
+        title="Bank Assessment",
+        passing_score=50,
+        questions_types=[QuestionType.choose_one, QuestionType.text_based],
+        bypass_cache=True
+    ))
+    assert requested == [["choose_one"], ["choose_one", "text_based"]]
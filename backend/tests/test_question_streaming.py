@@ -0,0 +1,151 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import event
+
+from integrations.ai_integration.json_stream import JSONArrayStreamParser
+from integrations.ai_integration.mistral_generator import MistralGenerator
+from integrations.ai_integration.mock_ai_generator import MockAIGenerator
+from schemas.enums import QuestionType
+from tests.conftest import engine
+
+
+RESPONSE = (
+    '```json\n[{"type": "MCQ", "prompt": "Pick {one}", "choices": ["a", "b"], "correct_answer": "b", "skill": "logic"},'
+    ' {"type": "TEXT", "prompt": "Say \\"why\\" [briefly]", "choices": [], "correct_answer": null, "skill": "writing"}]\n```'
+)
+
+
+def _chunks(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def _parse_events(body):
+    """Turn a server-sent event stream into (event, data) pairs"""
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+@pytest.mark.parametrize("size", [1, 7, len(RESPONSE)])
+def test_parser_returns_each_object_once_it_is_complete(size):
+    """Objects come out in order regardless of how the text is split, ignoring braces in strings"""
+    parser = JSONArrayStreamParser()
+    items = []
+    for chunk in _chunks(RESPONSE, size):
+        items.extend(parser.feed(chunk))
+
+    assert [item["prompt"] for item in items] == ["Pick {one}", 'Say "why" [briefly]']
+    assert parser.finished
+
+
+def test_parser_emits_first_object_before_the_array_ends():
+    parser = JSONArrayStreamParser()
+    assert parser.feed('[{"prompt": "one"}, {"prom') == [{"prompt": "one"}]
+    assert parser.feed('pt": "two"}') == [{"prompt": "two"}]
+    assert not parser.finished
+
+
+class FakeStreamingChat:
+    """Stands in for the Mistral chat API, streaming a fixed content string in small deltas"""
+
+    def __init__(self, content, size=5):
+        self.chunks = _chunks(content, size)
+
+    async def stream_async(self, **kwargs):
+        async def events():
+            for chunk in self.chunks:
+                yield SimpleNamespace(data=SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=chunk))]))
+        return events()
+
+
+def test_mistral_streams_questions_from_deltas():
+    generator = MistralGenerator.__new__(MistralGenerator)
+    generator.model = "test-model"
+    generator.client = SimpleNamespace(chat=FakeStreamingChat(RESPONSE))
+
+    async def collect():
+        return [q async for q in generator.astream_questions("Logic", ["choose_one", "text_based"])]
+
+    questions = asyncio.run(collect())
+
+    assert [q.id for q in questions] == ["mistral_0", "mistral_1"]
+    assert questions[0].correct_options == ["b"]
+    assert questions[1].type == QuestionType.text_based
+
+
+def test_stream_endpoint_sends_questions_then_assessment_id(hr_client):
+    """The SSE endpoint relays every question and finishes with the stored assessment"""
+    client, job_id = hr_client
+    response = client.post(f"/api/assessments/jobs/{job_id}/stream", json={
+        "title": "Streamed Assessment",
+        "passing_score": 60,
+        "questions_types": ["choose_one", "text_based"],
+        "bypass_cache": True
+    })
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    events = _parse_events(response.text)
+    assert [event for event, _ in events] == ["question", "question", "done"]
+
+    assessment = client.get(f"/api/assessments/jobs/{job_id}/{events[-1][1]['id']}").json()
+    assert assessment["questions_count"] == 2
+
+
+def test_stream_endpoint_keeps_database_work_off_the_event_loop(hr_client, monkeypatch):
+    """Every query of the stream runs in a worker thread, where no event loop is running"""
+    client, job_id = hr_client
+    monkeypatch.setattr("config.settings.question_bank_enabled", True)
+    on_event_loop = []
+
+    def record(*args):
+        try:
+            asyncio.get_running_loop()
+            on_event_loop.append(args[2])
+        except RuntimeError:
+            pass
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = client.post(f"/api/assessments/jobs/{job_id}/stream", json={
+            "title": "Threaded Assessment",
+            "passing_score": 60,
+            "questions_types": ["choose_one", "text_based"]
+        })
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert [event_name for event_name, _ in _parse_events(response.text)][-1] == "done"
+    assert on_event_loop == []
+
+
+def test_stream_endpoint_reports_generation_errors(hr_client, monkeypatch):
+    client, job_id = hr_client
+
+    def failing_generate(self, *args, **kwargs):
+        raise RuntimeError("provider unavailable")
+
+    monkeypatch.setattr(MockAIGenerator, "generate_questions", failing_generate)
+    response = client.post(f"/api/assessments/jobs/{job_id}/stream", json={
+        "title": "Failing Assessment",
+        "passing_score": 60,
+        "questions_types": ["text_based"],
+        "bypass_cache": True
+    })
+
+    assert _parse_events(response.text) == [("error", {"detail": "provider unavailable"})]
+
+
+def test_stream_endpoint_checks_the_job(hr_client):
+    client, _ = hr_client
+    response = client.post("/api/assessments/jobs/missing-job/stream", json={
+        "title": "Orphan Assessment",
+        "passing_score": 60,
+        "questions_types": ["text_based"]
+    })
+    assert response.status_code == 404
@@ -0,0 +1,149 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+
+import pytest
+from fastapi.routing import APIRoute
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+import services.ai_service
+from config import settings
+from database.database import create_database_engine, create_read_engine, get_read_db, get_write_db
+from integrations.ai_integration.ai_factory import AIProvider
+from integrations.ai_integration.mock_ai_generator import MockAIGenerator
+from main import app
+from models import AICacheEntry, Assessment, Base, Job, Question
+from schemas.assessment import AssessmentCreate
+from schemas.enums import QuestionType
+from services.assessment_service import create_assessment
+
+
+def _dependencies(dependant):
+    for dependency in dependant.dependencies:
+        yield dependency.call
+        yield from _dependencies(dependency)
+
+
+@pytest.fixture
+def engines(tmp_path):
+    url = f"sqlite:///{tmp_path / 'routing.db'}"
+    write_engine = create_database_engine(url, settings.db_write_pool_size, settings.db_write_max_overflow)
+    read_engine = create_read_engine(url, write_engine)
+    yield write_engine, read_engine
+    read_engine.dispose()
+    write_engine.dispose()
+
+
+def test_read_engine_sees_committed_writes_but_refuses_writes(engines):
+    write_engine, read_engine = engines
+    assert read_engine is not write_engine
+    with write_engine.begin() as conn:
+        conn.execute(text("CREATE TABLE jobs (id TEXT PRIMARY KEY)"))
+        conn.execute(text("INSERT INTO jobs VALUES ('j1')"))
+
+    with read_engine.connect() as conn:
+        assert conn.execute(text("SELECT id FROM jobs")).scalars().all() == ["j1"]
+        with pytest.raises(OperationalError, match="readonly"):
+            conn.execute(text("INSERT INTO jobs VALUES ('j2')"))
+
+
+def test_read_and_write_pools_are_sized_separately(engines):
+    write_engine, read_engine = engines
+    assert write_engine.pool.size() == settings.db_write_pool_size
+    assert read_engine.pool.size() == settings.db_read_pool_size
+    assert read_engine.pool._max_overflow == settings.db_read_max_overflow
+
+
+def test_in_memory_database_shares_the_writer_engine():
+    write_engine = create_database_engine("sqlite://", settings.db_write_pool_size, settings.db_write_max_overflow)
+    assert create_read_engine("sqlite://", write_engine) is write_engine
+
+
+def test_routes_declare_the_session_they_need():
+    sessions = {}
+    for route in app.routes:
+        if isinstance(route, APIRoute):
+            calls = set(_dependencies(route.dependant)) & {get_read_db, get_write_db}
+            if calls:
+                assert len(calls) == 1, f"{route.path} uses both a read and a write session"
+                session = calls.pop()
+                for method in route.methods:
+                    sessions[(method, route.path)] = session
+
+    # Every GET only reads; every route that changes data writes
+    for (method, path), session in sessions.items():
+        if method == "GET":
+            assert session is get_read_db, f"GET {path} should use the read session"
+    assert sessions[("POST", "/api/jobs")] is get_write_db
+    assert sessions[("POST", "/api/applications/jobs/{jid}/assessments/{aid}")] is get_write_db
+    assert sessions[("PATCH", "/api/assessments/jobs/{jid}/{aid}")] is get_write_db
+    assert sessions[("POST", "/api/users/registration/signup")] is get_write_db
+    assert sessions[("POST", "/api/users/registration/login")] is get_read_db
+
+
+def test_concurrent_generations_do_not_exhaust_a_small_writer_pool(tmp_path, monkeypatch):
+    """Generations release their connection during provider calls, so cache and bank writes find a free one"""
+    monkeypatch.setattr(settings, "db_pool_timeout_seconds", 1.0)
+    monkeypatch.setattr(settings, "ai_cache_enabled", True)
+    monkeypatch.setattr(settings, "question_bank_enabled", True)
+    monkeypatch.setattr(settings, "duration_estimator_mode", "local")
+    monkeypatch.setattr(services.ai_service, "DEFAULT_PROVIDER", AIProvider.MOCK)
+    generate = MockAIGenerator.generate_questions
+
+    def slow_generate(self, *args, **kwargs):
+        time.sleep(0.3)
+        return generate(self, *args, **kwargs)
+    monkeypatch.setattr(MockAIGenerator, "generate_questions", slow_generate)
+
+    engine = create_database_engine(f"sqlite:///{tmp_path / 'pool.db'}", pool_size=2, max_overflow=0)
+    Base.metadata.create_all(bind=engine)
+    job_id = str(uuid4())
+    with Session(bind=engine) as db:
+        db.add(Job(id=job_id, title="Backend Engineer", seniority="mid", skill_categories='["python"]'))
+        db.commit()
+
+    def create(index):
+        with Session(bind=engine) as db:
+            # A note skips the question bank lookup, so every generation calls the provider
+            assessment = AssessmentCreate(title=f"Pool {index}", passing_score=50, additional_note=f"pool test {index}",
+                                          questions_types=[QuestionType.choose_one, QuestionType.text_based])
+            return create_assessment(db, job_id, assessment).id
+
+    try:
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            created = list(executor.map(create, range(6)))
+        with Session(bind=engine) as db:
+            assert db.query(Assessment).filter(Assessment.id.in_(created)).count() == 6
+            # A cache write that timed out waiting for a connection would be missing here
+            assert db.query(AICacheEntry).filter(AICacheEntry.kind == "questions").count() == 6
+    finally:
+        engine.dispose()
+
+
+def test_cache_and_bank_writes_need_no_second_writer_connection(tmp_path, monkeypatch):
+    """A generation gives its connection back before the provider call, so one writer connection is enough"""
+    monkeypatch.setattr(settings, "db_pool_timeout_seconds", 0.5)
+    monkeypatch.setattr(settings, "ai_cache_enabled", True)
+    monkeypatch.setattr(settings, "question_bank_enabled", True)
+    monkeypatch.setattr(settings, "duration_estimator_mode", "local")
+    monkeypatch.setattr(services.ai_service, "DEFAULT_PROVIDER", AIProvider.MOCK)
+
+    engine = create_database_engine(f"sqlite:///{tmp_path / 'single.db'}", pool_size=1, max_overflow=0)
+    Base.metadata.create_all(bind=engine)
+    job_id = str(uuid4())
+    try:
+        with Session(bind=engine) as db:
+            db.add(Job(id=job_id, title="Backend Engineer", seniority="mid", skill_categories='["python"]'))
+            db.commit()
+            assessment = AssessmentCreate(title="Single connection", passing_score=50, additional_note="single connection",
+                                          questions_types=[QuestionType.choose_one, QuestionType.text_based])
+            create_assessment(db, job_id, assessment)
+
+        with Session(bind=engine) as db:
+            # Writes that waited for a second connection would time out and be skipped with a warning
+            assert db.query(AICacheEntry).filter(AICacheEntry.kind == "questions").count() == 1
+            assert db.query(Question).count() == 2
+    finally:
+        engine.dispose()
@@ -0,0 +1,82 @@
+import asyncio
+import time
+
+import pytest
+
+from config import settings
+from integrations.ai_integration.ai_factory import AIGeneratorFactory, AIProvider
+from integrations.ai_integration.replay_ai_generator import ReplayAIGenerator, ReplayInjectedError
+
+
+@pytest.fixture
+def recordings(tmp_path, monkeypatch):
+    """Record two mock generations, then switch to replaying them without latency"""
+    monkeypatch.setattr(settings, "ai_replay_path", str(tmp_path / "recordings.jsonl"))
+    monkeypatch.setattr(settings, "ai_replay_mode", "record")
+    monkeypatch.setattr(settings, "ai_replay_record_provider", "mock")
+    recorder = ReplayAIGenerator()
+    recorded = recorder.generate_questions(title="Backend", questions_types=["choose_one", "text_based"])
+    recorder.estimate_duration("How long?")
+
+    monkeypatch.setattr(settings, "ai_replay_mode", "replay")
+    monkeypatch.setattr(settings, "ai_replay_latency", "none")
+    return recorded
+
+
+def test_recorded_response_is_replayed(recordings):
+    replayed = ReplayAIGenerator().generate_questions(title="Backend", questions_types=["choose_one", "text_based"])
+
+    assert [q.model_dump() for q in replayed] == [q.model_dump() for q in recordings]
+
+
+def test_unrecorded_request_is_answered_with_recorded_questions_of_its_types(recordings):
+    replayed = ReplayAIGenerator().generate_questions(title="Frontend", questions_types=["text_based", "text_based"])
+
+    recorded_text = next(q.text for q in recordings if q.type.value == "text_based")
+    assert [q.text for q in replayed] == [recorded_text, recorded_text]
+    assert replayed[0].id != replayed[1].id
+
+
+def test_injected_errors_are_deterministic(recordings, monkeypatch):
+    monkeypatch.setattr(settings, "ai_replay_error_rate", 0.5)
+
+    def outcomes():
+        generator = ReplayAIGenerator()
+        results = []
+        for _ in range(20):
+            try:
+                generator.estimate_duration("How long?")
+                results.append("ok")
+            except ReplayInjectedError:
+                results.append("error")
+        return results
+
+    first = outcomes()
+    assert "ok" in first and "error" in first
+    assert outcomes() == first
+
+
+def test_injected_timeout_hangs_for_the_call_timeout(recordings, monkeypatch):
+    monkeypatch.setattr(settings, "ai_replay_timeout_rate", 1.0)
+    monkeypatch.setattr(settings, "ai_call_timeout_seconds", 0.05)
+
+    started = time.perf_counter()
+    with pytest.raises(TimeoutError):
+        ReplayAIGenerator().estimate_duration("How long?")
+    assert time.perf_counter() - started >= 0.05
+
+
+def test_async_replay_waits_for_the_latency(recordings, monkeypatch):
+    monkeypatch.setattr(settings, "ai_replay_latency", "lognormal")
+    monkeypatch.setattr(settings, "ai_replay_latency_median_seconds", 0.05)
+    monkeypatch.setattr(settings, "ai_replay_latency_sigma", 0.01)
+
+    started = time.perf_counter()
+    asyncio.run(ReplayAIGenerator().aestimate_duration("How long?"))
+    assert time.perf_counter() - started >= 0.04
+
+
+def test_replay_provider_is_registered(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "ai_replay_path", str(tmp_path / "missing.jsonl"))
+
+    assert isinstance(AIGeneratorFactory.create_generator(AIProvider.REPLAY), ReplayAIGenerator)
@@ -0,0 +1,64 @@
+from types import SimpleNamespace
+
+from sqlalchemy import create_engine, text
+
+from config import settings
+from database.slow_query_log import (
+    fingerprint, get_slow_queries, install_slow_query_log, redact_parameters, reset_slow_queries
+)
+from utils.dependencies import get_current_user
+from main import app
+
+
+def _engine():
+    engine = create_engine("sqlite://")
+    install_slow_query_log(engine)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE applications (id TEXT PRIMARY KEY, user_id TEXT)"))
+    return engine
+
+
+def test_fingerprint_groups_literals_and_in_lists():
+    assert fingerprint("SELECT * FROM t WHERE a = 'x' AND b IN (?, ?, ?)") == fingerprint("SELECT *  FROM t\nWHERE a = 'y' AND b IN (?, ?)")
+    assert fingerprint("SELECT * FROM t LIMIT 10 OFFSET 20") == "SELECT * FROM t LIMIT ? OFFSET ?"
+
+
+def test_redact_parameters_keeps_only_types():
+    assert redact_parameters(("secret@example.com", 3)) == ["<str>", "<int>"]
+    assert redact_parameters({"email": "secret@example.com"}) == {"email": "<str>"}
+
+
+def test_slow_statement_is_recorded_with_query_plan(monkeypatch):
+    monkeypatch.setattr(settings, "slow_query_threshold_ms", 0)
+    reset_slow_queries()
+    engine = _engine()
+
+    with engine.connect() as conn:
+        for user_id in ("u1", "u2"):
+            conn.execute(text("SELECT id FROM applications WHERE user_id = :user_id"), {"user_id": user_id})
+
+    entry = next(e for e in get_slow_queries() if "WHERE user_id" in e["fingerprint"])
+    assert entry["count"] == 2
+    # Without an index on user_id, SQLite reads the whole table
+    assert any(step.startswith("SCAN") and "applications" in step for step in entry["plan"])
+
+
+def test_fast_statements_are_not_recorded(monkeypatch):
+    monkeypatch.setattr(settings, "slow_query_threshold_ms", 10_000)
+    reset_slow_queries()
+    engine = _engine()
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT id FROM applications"))
+
+    assert get_slow_queries() == []
+
+
+def test_slow_queries_endpoint_is_hr_only(hr_client):
+    client, _ = hr_client
+    response = client.get("/api/admin/slow-queries")
+    assert response.status_code == 200
+    assert "queries" in response.json()
+
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id="candidate", role="candidate")
+    assert client.get("/api/admin/slow-queries").status_code == 403
@@ -0,0 +1,59 @@
+import pytest
+from sqlalchemy import text
+
+from config import settings
+from database.database import create_database_engine
+from database.sqlite_pragmas import is_file_database
+
+
+def _engine(url):
+    return create_database_engine(url, settings.db_write_pool_size, settings.db_write_max_overflow)
+
+
+def _pragma(engine, name):
+    with engine.connect() as conn:
+        return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+
+def test_file_database_gets_production_pragmas_and_pool(tmp_path):
+    engine = _engine(f"sqlite:///{tmp_path / 'tuned.db'}")
+    try:
+        assert _pragma(engine, "journal_mode") == "wal"
+        assert _pragma(engine, "synchronous") == 1  # NORMAL
+        assert _pragma(engine, "busy_timeout") == settings.sqlite_busy_timeout_ms
+        assert _pragma(engine, "cache_size") == -settings.sqlite_cache_size_kib
+        assert _pragma(engine, "mmap_size") == settings.sqlite_mmap_size_bytes
+        assert _pragma(engine, "temp_store") == 2  # MEMORY
+        assert engine.pool.size() == settings.db_write_pool_size
+        assert engine.pool._max_overflow == settings.db_write_max_overflow
+        assert engine.pool._timeout == settings.db_pool_timeout_seconds
+    finally:
+        engine.dispose()
+
+
+def test_disabled_pragmas_keep_sqlite_defaults(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "sqlite_pragmas_enabled", False)
+    engine = _engine(f"sqlite:///{tmp_path / 'plain.db'}")
+    try:
+        assert _pragma(engine, "journal_mode") == "delete"
+        assert _pragma(engine, "synchronous") == 2  # FULL
+    finally:
+        engine.dispose()
+
+
+def test_in_memory_database_skips_pool_sizing():
+    assert not is_file_database("sqlite://")
+    assert not is_file_database("sqlite:///:memory:")
+    assert is_file_database("sqlite:///./assessment_platform.db")
+
+    engine = _engine("sqlite://")
+    try:
+        assert _pragma(engine, "busy_timeout") == settings.sqlite_busy_timeout_ms
+    finally:
+        engine.dispose()
+
+
+def test_unknown_pragma_value_is_rejected(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "sqlite_journal_mode", "wal; DROP TABLE users")
+    with pytest.raises(ValueError, match="journal mode"):
+        _engine(f"sqlite:///{tmp_path / 'bad.db'}")
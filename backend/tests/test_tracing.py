@@ -0,0 +1,82 @@
+import json
+
+import pytest
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+import utils.tracing
+from config import settings
+from database.database import get_db
+from main import app
+from integrations.ai_integration.instrumentation import InstrumentedAIGenerator
+from integrations.ai_integration.mock_ai_generator import MockAIGenerator
+from services.application_service import calculate_application_score
+from utils.tracing import configure_tracing, install_sql_tracing, shutdown_tracing
+
+_exporter = InMemorySpanExporter()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def recording_tracer_provider():
+    """Record spans in memory; the global provider can only be set once per process"""
+    if not isinstance(trace.get_tracer_provider(), TracerProvider):
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(_exporter))
+        trace.set_tracer_provider(provider)
+    # The tests run on their own engine rather than the application's
+    sessions = app.dependency_overrides.get(get_db, get_db)()
+    install_sql_tracing(next(sessions).get_bind())
+    sessions.close()
+
+
+@pytest.fixture
+def spans():
+    _exporter.clear()
+    return _exporter.get_finished_spans
+
+
+def test_request_span_contains_service_and_sql_spans(hr_client, spans):
+    client, job_id = hr_client
+    response = client.get(f"/api/jobs/{job_id}")
+    assert response.status_code == 200
+
+    finished = spans()
+    server = next(s for s in finished if s.name == "GET /api/jobs/{id}")
+    assert server.attributes["http.route"] == "/api/jobs/{id}"
+    assert server.attributes["http.response.status_code"] == 200
+    queries = [s for s in finished if s.name == "db.query"]
+    assert queries
+    assert all(q.context.trace_id == server.context.trace_id for q in queries)
+
+
+def test_service_function_span_records_ids(db_session, spans):
+    calculate_application_score(db_session, "missing-application")
+
+    span = next(s for s in spans() if s.name == "application_service.calculate_application_score")
+    assert span.attributes["app.application_id"] == "missing-application"
+
+
+def test_ai_call_span_records_provider_and_tokens(spans):
+    generator = InstrumentedAIGenerator(MockAIGenerator(), "test-trace")
+
+    generator.estimate_duration("prompt")
+
+    span = next(s for s in spans() if s.name == "ai.estimate_duration")
+    assert span.attributes["ai.provider"] == "test-trace"
+    assert span.attributes["ai.prompt_tokens"] == 0
+
+
+def test_file_exporter_writes_one_span_per_line(tmp_path, monkeypatch):
+    path = tmp_path / "traces.jsonl"
+    monkeypatch.setattr(settings, "tracing_enabled", True)
+    monkeypatch.setattr(settings, "tracing_exporter", "file")
+    monkeypatch.setattr(settings, "tracing_file_path", str(path))
+    monkeypatch.setattr(utils.tracing, "_provider", None)
+
+    configure_tracing()
+    utils.tracing._provider.get_tracer("test").start_span("offline").end()
+    shutdown_tracing()
+
+    assert json.loads(path.read_text().splitlines()[0])["name"] == "offline"
@@ -0,0 +1,73 @@
+import contextvars
+import time
+from typing import Dict, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from utils.metrics import registry
+
+HTTP_REQUESTS = registry.counter("http_requests_total", "HTTP requests handled", ("method", "route", "status"))
+HTTP_LATENCY = registry.histogram("http_request_duration_seconds", "HTTP request latency, until the response body is sent", ("method", "route"))
+HTTP_IN_FLIGHT = registry.gauge("http_requests_in_flight", "HTTP requests being handled", ("method",))
+HTTP_RESPONSE_SIZE = registry.histogram(
+    "http_response_size_bytes", "HTTP response body size", ("method", "route"),
+    buckets=(100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+)
+HTTP_DB_STATEMENTS = registry.histogram(
+    "http_request_db_statements", "SQL statements executed while handling an HTTP request", ("method", "route"),
+    buckets=(0, 1, 2, 5, 10, 25, 50, 100, 250)
+)
+
+# SQL statement count of the request in progress; sync endpoints run in copies of the
+# request's context, so they add to the same dict
+_request_statements: contextvars.ContextVar[Optional[Dict[str, int]]] = contextvars.ContextVar("request_statements", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    statements = _request_statements.get()
+    if statements is not None:
+        statements["count"] += 1
+
+
+def _route_template(scope) -> str:
+    # Paths that matched no route are grouped so that scanners cannot add a series per URL
+    return getattr(scope.get("route"), "path", None) or "unmatched"
+
+
+class HTTPMetricsMiddleware:
+    """ASGI middleware that records request counts, latency, response size and SQL statements per route template"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        response = {"status": 500, "size": 0}
+        statements = {"count": 0}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+            elif message["type"] == "http.response.body":
+                response["size"] += len(message.get("body", b""))
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc(method=method)
+        token = _request_statements.set(statements)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            latency = time.perf_counter() - started
+            _request_statements.reset(token)
+            HTTP_IN_FLIGHT.dec(method=method)
+
+            route = _route_template(scope)
+            HTTP_REQUESTS.inc(method=method, route=route, status=response["status"])
+            HTTP_LATENCY.observe(latency, method=method, route=route)
+            HTTP_RESPONSE_SIZE.observe(response["size"], method=method, route=route)
+            HTTP_DB_STATEMENTS.observe(statements["count"], method=method, route=route)
@@ -4,7 +4,7 @@ from sqlalchemy.orm import Session
 import jwt
 
 from config import settings
-from database.database import get_db
+from database.database import get_read_db
 from models.user import User
 from utils.password_utils import get_password_hash, verify_password
 
@@ -63,8 +63,8 @@ def is_authenticated(token: str) -> Optional[User]:
         return None
 
     # Get the user from the database
-    from database.database import get_db
-    db: Session = next(get_db())
+    from database.database import get_read_db
+    db: Session = next(get_read_db())
     try:
         user = db.query(User).filter(User.id == user_id).first()
         return user
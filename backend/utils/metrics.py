@@ -0,0 +1,165 @@
+import bisect
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Latency buckets in seconds, from a cached lookup to a slow LLM generation
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+class Counter:
+    """A monotonically increasing value per label combination"""
+
+    def __init__(self, name: str, description: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.description = description
+        self.labels = tuple(labels)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = tuple(str(labels.get(label, "")) for label in self.labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def values(self) -> Dict[Tuple[str, ...], float]:
+        with self._lock:
+            return dict(self._values)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        return [{"labels": dict(zip(self.labels, key)), "value": value} for key, value in self.values().items()]
+
+
+class Gauge(Counter):
+    """A value per label combination that can go up and down"""
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = tuple(str(labels.get(label, "")) for label in self.labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram:
+    """Bucketed observations per label combination, with their count and sum"""
+
+    def __init__(self, name: str, description: str, labels: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.description = description
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        self._values: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = tuple(str(labels.get(label, "")) for label in self.labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                series = self._values[key] = {"counts": [0] * (len(self.buckets) + 1), "count": 0, "sum": 0.0}
+            series["counts"][index] += 1
+            series["count"] += 1
+            series["sum"] += value
+
+    def values(self) -> Dict[Tuple[str, ...], Dict[str, Any]]:
+        with self._lock:
+            return {key: {"counts": list(series["counts"]), "count": series["count"], "sum": series["sum"]} for key, series in self._values.items()}
+
+    def quantile(self, q: float, counts: List[int]) -> Optional[float]:
+        """Estimate a quantile as the upper bound of the bucket it falls in"""
+        total = sum(counts)
+        if not total:
+            return None
+        rank = q * total
+        seen = 0
+        for bound, count in zip(self.buckets + (float("inf"),), counts):
+            seen += count
+            if seen >= rank:
+                return bound if bound != float("inf") else self.buckets[-1]
+        return self.buckets[-1]
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "labels": dict(zip(self.labels, key)),
+                "count": series["count"],
+                "sum": round(series["sum"], 6),
+                "p50": self.quantile(0.5, series["counts"]),
+                "p95": self.quantile(0.95, series["counts"]),
+                "p99": self.quantile(0.99, series["counts"])
+            }
+            for key, series in self.values().items()
+        ]
+
+
+class MetricsRegistry:
+    """Holds the process's metrics by name"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, description: str, labels: Sequence[str] = ()) -> Counter:
+        """Get the counter with this name, creating it on first use"""
+        return self._register(Counter(name, description, labels))
+
+    def gauge(self, name: str, description: str, labels: Sequence[str] = ()) -> Gauge:
+        """Get the gauge with this name, creating it on first use"""
+        return self._register(Gauge(name, description, labels))
+
+    def histogram(self, name: str, description: str, labels: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        """Get the histogram with this name, creating it on first use"""
+        return self._register(Histogram(name, description, labels, buckets))
+
+    def metrics(self) -> List[Any]:
+        with self._lock:
+            return list(self._metrics.values())
+
+    def snapshot(self, prefix: str = "") -> Dict[str, List[Dict[str, Any]]]:
+        """Get the current values of the metrics whose names start with prefix"""
+        return {metric.name: metric.snapshot() for metric in self.metrics() if metric.name.startswith(prefix)}
+
+
+# The registry shared by the whole process
+registry = MetricsRegistry()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(zip(names, values)) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+def _format_number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+def render_prometheus(metrics_registry: MetricsRegistry = None) -> str:
+    """Render the metrics in the Prometheus text exposition format"""
+    lines = []
+    for metric in (metrics_registry or registry).metrics():
+        kind = "histogram" if isinstance(metric, Histogram) else "gauge" if isinstance(metric, Gauge) else "counter"
+        lines.append(f"# HELP {metric.name} {metric.description}")
+        lines.append(f"# TYPE {metric.name} {kind}")
+        if isinstance(metric, Histogram):
+            for key, series in sorted(metric.values().items()):
+                cumulative = 0
+                for bound, count in zip(metric.buckets + (float("inf"),), series["counts"]):
+                    cumulative += count
+                    lines.append(f"{metric.name}_bucket{_format_labels(metric.labels, key, ('le', _format_number(bound)))} {cumulative}")
+                lines.append(f"{metric.name}_sum{_format_labels(metric.labels, key)} {_format_number(series['sum'])}")
+                lines.append(f"{metric.name}_count{_format_labels(metric.labels, key)} {series['count']}")
+        else:
+            for key, value in sorted(metric.values().items()):
+                lines.append(f"{metric.name}{_format_labels(metric.labels, key)} {_format_number(value)}")
+    return "\n".join(lines) + "\n"
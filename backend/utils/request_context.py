@@ -0,0 +1,37 @@
+import contextvars
+from typing import Any, Dict, Optional
+
+# ASGI scope of the request being handled; copied into the background work it starts
+_request_scope: contextvars.ContextVar[Optional[Dict[str, Any]]] = contextvars.ContextVar("request_scope", default=None)
+
+
+def get_current_route() -> str:
+    """
+    Get the route that originated the current work, such as "POST /api/assessments/jobs/{id}".
+
+    Work outside any request, like startup tasks, is reported as "background".
+    """
+    scope = _request_scope.get()
+    if scope is None:
+        return "background"
+    route = scope.get("route")
+    path = getattr(route, "path", None) or scope.get("path", "")
+    return f"{scope.get('method', '')} {path}".strip()
+
+
+class RequestContextMiddleware:
+    """ASGI middleware that makes the current request available to get_current_route"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = _request_scope.set(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_scope.reset(token)
@@ -0,0 +1,168 @@
+import functools
+import inspect
+from typing import Any, Callable, Optional
+from opentelemetry import context as otel_context, propagate, trace
+from opentelemetry.trace import Span, SpanKind, Status, StatusCode
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from config import settings
+from logging_config import get_logger
+
+# Create logger for this module
+logger = get_logger(__name__)
+
+# Spans are no-ops until configure_tracing installs an SDK tracer provider
+tracer = trace.get_tracer("talent-assessment-platform")
+
+_provider = None
+
+
+def configure_tracing() -> None:
+    """Install the tracer provider, sampler and exporter from the settings, when tracing is enabled"""
+    global _provider
+    if not settings.tracing_enabled or _provider is not None:
+        return
+
+    # The SDK is only needed when traces are recorded
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+    if settings.tracing_exporter == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        exporter = OTLPSpanExporter(endpoint=settings.tracing_otlp_endpoint)
+    elif settings.tracing_exporter == "file":
+        # One JSON span per line, for inspecting traces offline
+        exporter = ConsoleSpanExporter(
+            out=open(settings.tracing_file_path, "a", encoding="utf-8"),
+            formatter=lambda span: span.to_json(indent=None) + "\n"
+        )
+    elif settings.tracing_exporter == "console":
+        exporter = ConsoleSpanExporter()
+    else:
+        raise ValueError(f"Unknown tracing exporter: {settings.tracing_exporter}")
+
+    _provider = TracerProvider(
+        resource=Resource.create({"service.name": settings.app_name, "service.version": settings.app_version}),
+        sampler=ParentBased(TraceIdRatioBased(settings.tracing_sample_rate))
+    )
+    _provider.add_span_processor(BatchSpanProcessor(exporter))
+    trace.set_tracer_provider(_provider)
+    logger.info(f"Tracing enabled with the {settings.tracing_exporter} exporter at a sample rate of {settings.tracing_sample_rate}")
+
+def shutdown_tracing() -> None:
+    """Export the spans still buffered"""
+    if _provider is not None:
+        _provider.shutdown()
+
+
+def set_span_attributes(**attributes: Any) -> None:
+    """Add attributes, such as an assessment id or question count, to the current span"""
+    span = trace.get_current_span()
+    if span.is_recording():
+        span.set_attributes({f"app.{key}": value for key, value in attributes.items() if value is not None})
+
+def _argument_attributes(signature: inspect.Signature, args, kwargs) -> dict:
+    # Ids passed to a service function identify what the span worked on
+    try:
+        bound = signature.bind_partial(*args, **kwargs)
+    except TypeError:
+        return {}
+    return {f"app.{name}": value for name, value in bound.arguments.items() if name.endswith("_id") and isinstance(value, str)}
+
+def traced(name: Optional[str] = None) -> Callable:
+    """Run a function in its own span, named after its module and function by default"""
+    def decorator(func: Callable) -> Callable:
+        span_name = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+        signature = inspect.signature(func)
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with tracer.start_as_current_span(span_name, attributes=_argument_attributes(signature, args, kwargs)):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with tracer.start_as_current_span(span_name, attributes=_argument_attributes(signature, args, kwargs)):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    span = tracer.start_span("db.query", kind=SpanKind.CLIENT, attributes={
+        "db.system": conn.dialect.name,
+        "db.statement": statement,
+    })
+    conn.info.setdefault("query_spans", []).append(span)
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    spans = conn.info.get("query_spans")
+    if spans:
+        span = spans.pop()
+        if cursor.rowcount is not None and cursor.rowcount >= 0:
+            span.set_attribute("db.rows_affected", cursor.rowcount)
+        span.end()
+
+def _handle_error(exception_context):
+    spans = exception_context.connection.info.get("query_spans") if exception_context.connection else None
+    if spans:
+        span = spans.pop()
+        span.record_exception(exception_context.original_exception)
+        span.set_status(Status(StatusCode.ERROR))
+        span.end()
+
+def install_sql_tracing(engine: Engine) -> None:
+    """Record a span for every statement run on the engine"""
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+class TracingMiddleware:
+    """ASGI middleware that runs each request in a server span, continuing the caller's trace if it sent one"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = {key.decode("latin-1"): value.decode("latin-1") for key, value in scope.get("headers", [])}
+        token = otel_context.attach(propagate.extract(headers))
+        status = {"code": None}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        try:
+            with tracer.start_as_current_span(scope["method"], kind=SpanKind.SERVER, attributes={
+                "http.request.method": scope["method"],
+                "url.path": scope.get("path", ""),
+            }) as span:
+                try:
+                    await self.app(scope, receive, send_wrapper)
+                finally:
+                    _finish_request_span(span, scope, status["code"])
+        finally:
+            otel_context.detach(token)
+
+def _finish_request_span(span: Span, scope, status_code: Optional[int]) -> None:
+    # The route is only known once the router has matched the request
+    route = getattr(scope.get("route"), "path", None)
+    if route:
+        span.update_name(f"{scope['method']} {route}")
+        span.set_attribute("http.route", route)
+    if status_code is not None:
+        span.set_attribute("http.response.status_code", status_code)
+        if status_code >= 500:
+            span.set_status(Status(StatusCode.ERROR))
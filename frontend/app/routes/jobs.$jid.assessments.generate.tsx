@@ -7,7 +7,10 @@ import { Checkbox } from "~/components/ui/checkbox";
 import { Textarea } from "~/components/ui/textarea";
 import { useNavigate, useParams } from "react-router";
 import type { Route } from "./+types/jobs.$jid.assessments.generate";
-import { usePostJobAssessment } from "~/services/usePostJobAssessment";
+import {
+    useStreamJobAssessment,
+    type StreamedQuestion,
+} from "~/services/useStreamJobAssessment";
 
 export function meta({}: Route.MetaArgs) {
     return [
@@ -22,7 +25,8 @@ export function meta({}: Route.MetaArgs) {
 export default function AssessmentGenerateRoute() {
     const { jid } = useParams();
     const navigate = useNavigate();
-    const mutation = usePostJobAssessment();
+    const mutation = useStreamJobAssessment();
+    const [questions, setQuestions] = useState<Array<StreamedQuestion>>([]);
 
     const [form, setForm] = useState({
         title: "",
@@ -64,6 +68,7 @@ export default function AssessmentGenerateRoute() {
             return;
         }
 
+        setQuestions([]);
         try {
             await mutation.mutateAsync({
                 jid,
@@ -73,6 +78,8 @@ export default function AssessmentGenerateRoute() {
                     questions_types: form.questions_types,
                     additional_note: form.additional_note.trim(),
                 },
+                onQuestion: (question) =>
+                    setQuestions((current) => [...current, question]),
             });
             toast.success("Assessment generated");
             navigate(`/jobs/${jid}`);
@@ -200,6 +207,21 @@ export default function AssessmentGenerateRoute() {
                     </Button>
                 </div>
 
+                {questions.length > 0 && (
+                    <div className="space-y-2">
+                        <p className="text-sm text-gray-700 dark:text-gray-300">
+                            {mutation.isPending
+                                ? `Generated ${questions.length} of ${form.questions_types.length} questions…`
+                                : `Generated ${questions.length} questions`}
+                        </p>
+                        <ol className="list-decimal list-inside space-y-1 text-sm text-gray-600 dark:text-gray-400">
+                            {questions.map((question, i) => (
+                                <li key={i}>{question.text}</li>
+                            ))}
+                        </ol>
+                    </div>
+                )}
+
                 {mutation.isError && (
                     <div className="text-sm text-red-500">
                         Error:{" "}
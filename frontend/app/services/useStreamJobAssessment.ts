@@ -0,0 +1,62 @@
+import { useMutation } from "@tanstack/react-query";
+import type { Assessment } from "./useGetJobAssessments";
+import type { PostJobAssessmentPayload } from "~/types/assessment";
+
+export const STREAM_JOB_ASSESSMENT_KEY = "stream-job-assessment"
+
+export type StreamedQuestion = Assessment["questions"][number];
+
+export type StreamJobAssessmentPayload = PostJobAssessmentPayload & {
+    onQuestion: (question: StreamedQuestion) => void;
+};
+
+// Axios buffers the whole response in the browser, so the event stream is read with fetch
+export const useStreamJobAssessment = () => useMutation({
+    mutationKey: [STREAM_JOB_ASSESSMENT_KEY],
+    mutationFn: async (payload: StreamJobAssessmentPayload) => {
+        const token = localStorage.getItem("token");
+        const response = await fetch(`${import.meta.env.VITE_APP_API_URL}/assessments/jobs/${payload.jid}/stream`, {
+            method: "POST",
+            headers: {
+                "Content-Type": "application/json",
+                "Accept": "text/event-stream",
+                ...(token ? { "Authorization": `Bearer ${token}` } : {}),
+            },
+            body: JSON.stringify(payload.body),
+        });
+        if (!response.ok || !response.body) {
+            const error = await response.json().catch(() => null);
+            throw new Error(error?.detail ?? "Failed to generate assessment");
+        }
+
+        const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+        let buffer = "";
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) {
+                throw new Error("Assessment generation ended unexpectedly");
+            }
+            buffer += value;
+
+            // Events are separated by a blank line
+            let boundary = buffer.indexOf("\n\n");
+            while (boundary !== -1) {
+                const block = buffer.slice(0, boundary);
+                buffer = buffer.slice(boundary + 2);
+                boundary = buffer.indexOf("\n\n");
+
+                const event = block.match(/^event: (.*)$/m)?.[1];
+                const data = JSON.parse(block.match(/^data: (.*)$/m)?.[1] ?? "null");
+                if (event === "question") {
+                    payload.onQuestion(data);
+                } else if (event === "done") {
+                    await reader.cancel();
+                    return { id: data.id as string };
+                } else if (event === "error") {
+                    await reader.cancel();
+                    throw new Error(data?.detail ?? "Assessment generation failed");
+                }
+            }
+        }
+    },
+});
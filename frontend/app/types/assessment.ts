@@ -0,0 +1,9 @@
+export type PostJobAssessmentPayload = {
+    jid: string;
+    body: {
+        title: string;
+        passing_score: number;
+        additional_note: string;
+        questions_types: Array<"text_based" | "choose_one" | "choose_many">;
+    };
+};
\ No newline at end of file